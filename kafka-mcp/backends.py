@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Backends - Pluggable factories for the clients KafkaManager uses
+
+A backend creates the admin client, producer and consumers and opens raw
+broker connections for warm-up probes. ``mcp.backend`` in kafka.properties
+selects one: ``kafka`` (default) talks to real brokers with kafka-python,
+``memory`` uses an in-process cluster for offline testing and benchmarking.
+"""
+
+import socket
+from typing import Any, Callable, Dict
+
+from kafka import KafkaConsumer, KafkaProducer
+from kafka.admin import KafkaAdminClient
+
+from memory_backend import MemoryBackend
+
+DEFAULT_BACKEND = "kafka"
+
+
+class KafkaBackend:
+    """Creates kafka-python clients that talk to real brokers"""
+
+    name = "kafka"
+
+    def __init__(self, config: Dict[str, str]):
+        pass
+
+    def admin_client(self, **configs) -> KafkaAdminClient:
+        return KafkaAdminClient(**configs)
+
+    def producer(self, **configs) -> KafkaProducer:
+        return KafkaProducer(**configs)
+
+    def consumer(self, **configs) -> KafkaConsumer:
+        return KafkaConsumer(**configs)
+
+    def connect_broker(self, host: str, port: int, timeout: float) -> None:
+        """Open and close a TCP connection to a broker"""
+        socket.create_connection((host, port), timeout=timeout).close()
+
+
+# Backend name -> class taking the full properties dict
+BACKENDS: Dict[str, Callable[[Dict[str, str]], Any]] = {
+    "kafka": KafkaBackend,
+    "memory": MemoryBackend,
+}
+
+
+def create_backend(config: Dict[str, str]):
+    """Create the backend selected by mcp.backend"""
+    name = config.get("mcp.backend", DEFAULT_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend '{name}'. Available: {', '.join(sorted(BACKENDS))}"
+        )
+    return BACKENDS[name](config)
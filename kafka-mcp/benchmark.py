@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Time KafkaManager operations against a broker and emit JSON
+
+For each topic count the benchmark creates that many topics, times topic
+listing (uncached and cached), topic lookup, single and batched sends, then
+deletes the topics again, timing every create and delete. Results are
+written as JSON; pass an earlier result file with --baseline to fail on
+operations whose median latency regressed.
+
+    python benchmark.py --config kafka.properties --topic-counts 10,100,1000
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+import kafka
+
+from delivery import latency_summary
+from kafka_utils import KafkaManager
+
+
+def measure(
+    operation: str,
+    topic_count: int,
+    func: Callable[[], Any],
+    iterations: int,
+) -> Dict[str, Any]:
+    """Call func repeatedly and summarize its latency"""
+    samples = []
+    errors = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+        if isinstance(result, dict) and result.get("status") not in (None, "success"):
+            errors += 1
+    return summarize(operation, topic_count, samples, errors)
+
+
+def summarize(
+    operation: str, topic_count: int, samples: List[float], errors: int = 0
+) -> Dict[str, Any]:
+    """One result entry from latency samples in milliseconds"""
+    total_s = sum(samples) / 1000
+    return {
+        "operation": operation,
+        "topics": topic_count,
+        "iterations": len(samples),
+        "errors": errors,
+        "ops_per_s": round(len(samples) / total_s, 1) if total_s else None,
+        "latency_ms": latency_summary(samples),
+    }
+
+
+def run_topic_count(
+    manager: KafkaManager, topic_count: int, args: argparse.Namespace
+) -> List[Dict[str, Any]]:
+    """Benchmark every operation with topic_count benchmark topics in the cluster"""
+    prefix = f"{args.prefix}{uuid.uuid4().hex[:8]}-"
+    names = [f"{prefix}{i:05d}" for i in range(topic_count)]
+    results = []
+
+    samples, errors = [], 0
+    for name in names:
+        started = time.perf_counter()
+        result = manager.create_topic(name, num_partitions=args.partitions)
+        samples.append((time.perf_counter() - started) * 1000)
+        errors += result["status"] != "success"
+    results.append(summarize("create_topic", topic_count, samples, errors))
+
+    try:
+        results.append(
+            measure(
+                "list_topics",
+                topic_count,
+                lambda: manager.list_topics(refresh=True),
+                args.repeat,
+            )
+        )
+        manager.list_topics()
+        results.append(
+            measure(
+                "list_topics_cached",
+                topic_count,
+                lambda: manager.list_topics(),
+                args.repeat,
+            )
+        )
+        results.append(
+            measure(
+                "get_topic_info",
+                topic_count,
+                lambda: manager.get_topic_info(names[0], refresh=True),
+                args.repeat,
+            )
+        )
+
+        value = {"payload": "x" * args.message_size}
+        results.append(
+            measure(
+                "send_message",
+                topic_count,
+                lambda: manager.send_message(names[0], value),
+                args.messages,
+            )
+        )
+        batch = [{"value": value} for _ in range(args.messages)]
+        batch_result = measure(
+            "send_messages",
+            topic_count,
+            lambda: manager.send_messages(names[0], batch),
+            args.repeat,
+        )
+        batch_result["batch_size"] = args.messages
+        results.append(batch_result)
+    finally:
+        samples, errors = [], 0
+        for name in names:
+            started = time.perf_counter()
+            result = manager.delete_topic(name)
+            samples.append((time.perf_counter() - started) * 1000)
+            errors += result["status"] != "success"
+        results.append(summarize("delete_topic", topic_count, samples, errors))
+
+    return results
+
+
+def find_regressions(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """Operations whose p50 latency grew by more than threshold over the baseline"""
+    previous = {
+        (entry["operation"], entry["topics"]): entry
+        for entry in baseline.get("results", [])
+    }
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["operation"], entry["topics"]))
+        if not before or not before["latency_ms"].get("p50"):
+            continue
+        ratio = entry["latency_ms"]["p50"] / before["latency_ms"]["p50"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    "operation": entry["operation"],
+                    "topics": entry["topics"],
+                    "baseline_p50_ms": before["latency_ms"]["p50"],
+                    "p50_ms": entry["latency_ms"]["p50"],
+                    "ratio": round(ratio, 2),
+                }
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--config", default="kafka.properties", help="Kafka properties file"
+    )
+    parser.add_argument(
+        "--topic-counts",
+        default="10,100,1000,10000",
+        help="Comma-separated numbers of topics to benchmark with",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Iterations per timed operation"
+    )
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=1000,
+        help="Single sends to time, and the size of each send_messages batch",
+    )
+    parser.add_argument("--message-size", type=int, default=256)
+    parser.add_argument("--partitions", type=int, default=1)
+    parser.add_argument("--prefix", default="mcp-bench-", help="Benchmark topic prefix")
+    parser.add_argument("--output", help="Write results to this file (default stdout)")
+    parser.add_argument("--baseline", help="Earlier result file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed p50 slowdown against the baseline (0.2 = 20%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    manager = KafkaManager(args.config)
+    started_at = int(time.time() * 1000)
+    results = []
+    try:
+        for topic_count in (int(n) for n in args.topic_counts.split(",")):
+            print(f"Benchmarking with {topic_count} topics...", file=sys.stderr)
+            results.extend(run_topic_count(manager, topic_count, args))
+    finally:
+        manager.close()
+
+    report = {
+        "started_at": started_at,
+        "config": args.config,
+        "python": platform.python_version(),
+        "kafka_python": kafka.__version__,
+        "parameters": {
+            "repeat": args.repeat,
+            "messages": args.messages,
+            "message_size": args.message_size,
+            "partitions": args.partitions,
+        },
+        "results": results,
+    }
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            report["regressions"] = find_regressions(
+                results, json.load(f), args.threshold
+            )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
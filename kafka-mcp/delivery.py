@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Delivery - Aggregate producer acknowledgements for fire-and-forget sends
+
+Each fire-and-forget send is attached to a ticket. Delivery callbacks update
+the ticket's counters and a bounded ring buffer of latencies, so a ticket
+can collect any number of sends in constant memory. Tickets that need
+percentiles over every send rather than the most recent ones keep a
+LatencyReservoir instead.
+"""
+
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+DEFAULT_MAX_TICKETS = 100
+DEFAULT_MAX_SAMPLES = 10000
+MAX_ERRORS_PER_TICKET = 10
+
+
+def latency_summary(samples: Iterable[float]) -> Dict[str, Any]:
+    """Count, min, mean, p50/p95/p99 and max of latency samples in milliseconds"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def percentile(p: float) -> float:
+        # Nearest-rank percentile
+        index = max(0, min(len(ordered) - 1, math.ceil(p * len(ordered) / 100) - 1))
+        return round(ordered[index], 3)
+
+    return {
+        "count": len(ordered),
+        "min": round(ordered[0], 3),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class LatencyReservoir:
+    """Uniform sample of every latency added, with exact count, min, mean and max
+
+    Up to ``size`` samples are kept by reservoir sampling, so percentiles
+    describe the whole stream rather than its most recent values.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.samples: List[float] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._random = random.Random()
+
+    def append(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.samples) < self.size:
+            self.samples.append(value)
+        else:
+            index = self._random.randrange(self.count)
+            if index < self.size:
+                self.samples[index] = value
+
+    def summary(self) -> Dict[str, Any]:
+        """latency_summary of the samples, with the exact figures of the stream"""
+        summary = latency_summary(self.samples)
+        if self.count:
+            summary.update(
+                count=self.count,
+                min=round(self.min, 3),
+                mean=round(self.total / self.count, 3),
+                max=round(self.max, 3),
+            )
+        return summary
+
+
+class DeliveryTicket:
+    """Delivery counters for a group of fire-and-forget sends"""
+
+    def __init__(
+        self,
+        ticket_id: str,
+        topic: str,
+        max_samples: int,
+        samples: Optional[LatencyReservoir] = None,
+    ):
+        self.ticket_id = ticket_id
+        self.topic = topic
+        self.created_at = time.time()
+        self.last_ack_at: Optional[float] = None
+        self.sent = 0
+        self.acked = 0
+        self.failed = 0
+        self.latencies_ms: Union["deque[float]", LatencyReservoir] = (
+            samples if samples is not None else deque(maxlen=max_samples)
+        )
+        self.errors: "deque[Dict[str, Any]]" = deque(maxlen=MAX_ERRORS_PER_TICKET)
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize the ticket's deliveries so far"""
+        pending = self.sent - self.acked - self.failed
+        return {
+            "ticket": self.ticket_id,
+            "topic": self.topic,
+            "state": "pending" if pending else "complete",
+            "sent": self.sent,
+            "acked": self.acked,
+            "failed": self.failed,
+            "pending": pending,
+            "created_at": int(self.created_at * 1000),
+            "last_ack_at": (
+                int(self.last_ack_at * 1000) if self.last_ack_at is not None else None
+            ),
+            "latency_ms": (
+                self.latencies_ms.summary()
+                if isinstance(self.latencies_ms, LatencyReservoir)
+                else latency_summary(self.latencies_ms)
+            ),
+            "last_errors": list(self.errors),
+        }
+
+
+class DeliveryTracker:
+    """Thread-safe registry of delivery tickets, evicting the oldest when full"""
+
+    def __init__(
+        self,
+        max_tickets: int = DEFAULT_MAX_TICKETS,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+    ):
+        self.max_tickets = max_tickets
+        self.max_samples = max_samples
+        self._tickets: "OrderedDict[str, DeliveryTicket]" = OrderedDict()
+        # Callbacks run on the producer's I/O thread
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        topic: str,
+        ticket_id: Optional[str] = None,
+        samples: Optional[LatencyReservoir] = None,
+    ) -> DeliveryTicket:
+        """Return the named ticket, creating it (or a new random one) if needed
+
+        A new ticket keeps its latencies in ``samples`` when given, instead
+        of a ring buffer of the most recent ones.
+        """
+        with self._lock:
+            if ticket_id in self._tickets:
+                return self._tickets[ticket_id]
+            ticket = DeliveryTicket(
+                ticket_id or uuid.uuid4().hex[:12], topic, self.max_samples, samples
+            )
+            self._tickets[ticket.ticket_id] = ticket
+            while len(self._tickets) > self.max_tickets:
+                self._tickets.popitem(last=False)
+            return ticket
+
+    def track(self, ticket: DeliveryTicket, future, started: float) -> None:
+        """Count a send and record its outcome when the broker responds
+
+        ``started`` is the ``time.perf_counter()`` reading taken just before
+        the send, so latencies include time spent waiting for metadata.
+        """
+        with self._lock:
+            ticket.sent += 1
+
+        def on_success(record_metadata) -> None:
+            with self._lock:
+                ticket.acked += 1
+                ticket.last_ack_at = time.time()
+                ticket.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+        def on_error(exc: BaseException) -> None:
+            self._record_error(ticket, exc)
+
+        future.add_callback(on_success)
+        future.add_errback(on_error)
+
+    def record_failure(self, ticket: DeliveryTicket, exc: BaseException) -> None:
+        """Count a send that failed before it reached the producer buffer"""
+        with self._lock:
+            ticket.sent += 1
+        self._record_error(ticket, exc)
+
+    def _record_error(self, ticket: DeliveryTicket, exc: BaseException) -> None:
+        """Count a failed delivery and keep its error"""
+        with self._lock:
+            ticket.failed += 1
+            ticket.errors.append(
+                {"at": int(time.time() * 1000), "error": f"{type(exc).__name__}: {exc}"}
+            )
+
+    def status(self, ticket_id: Optional[str] = None) -> Dict[str, Any]:
+        """Report one ticket, or every retained ticket newest first"""
+        with self._lock:
+            if ticket_id is not None:
+                ticket = self._tickets.get(ticket_id)
+                if ticket is None:
+                    return {
+                        "status": "error",
+                        "message": f"Unknown or expired delivery ticket '{ticket_id}'",
+                    }
+                return {"status": "success", **ticket.report()}
+            return {
+                "status": "success",
+                "tickets": [
+                    ticket.report() for ticket in reversed(self._tickets.values())
+                ],
+            }
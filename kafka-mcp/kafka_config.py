@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Kafka Config - Translate Java-style kafka.properties into kafka-python kwargs
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from kafka import KafkaConsumer, KafkaProducer, codec
+from kafka.admin import KafkaAdminClient
+
+# Configure logging
+logger = logging.getLogger("kafka-config")
+
+# Java/librdkafka property names whose kafka-python argument isn't simply the
+# name with dots replaced by underscores
+PROPERTY_ALIASES = {
+    "ssl.key.password": "ssl_password",
+    "ssl.ca.location": "ssl_cafile",
+    "ssl.certificate.location": "ssl_certfile",
+    "ssl.key.location": "ssl_keyfile",
+    "ssl.crl.location": "ssl_crlfile",
+    "ssl.cipher.suites": "ssl_ciphers",
+}
+
+# Java properties kafka-python has no equivalent for; dropped with a warning
+UNSUPPORTED_PROPERTIES = {
+    "buffer.memory": "not supported by the kafka-python producer",
+    "key.serializer": "serializers are configured with mcp.serializer.* properties",
+    "value.serializer": "serializers are configured with mcp.serializer.* properties",
+    "key.deserializer": "record keys and values are decoded by the server",
+    "value.deserializer": "record keys and values are decoded by the server",
+}
+
+# Property prefixes that scope a setting to a single client
+CLIENT_NAMESPACES = {
+    "admin": KafkaAdminClient,
+    "producer": KafkaProducer,
+    "consumer": KafkaConsumer,
+}
+
+# kafka-python arguments whose default is None, so their type can't be inferred
+INT_ARGUMENTS = {"receive_buffer_bytes", "send_buffer_bytes"}
+
+TRUE_VALUES = {"true", "1", "yes", "on"}
+FALSE_VALUES = {"false", "0", "no", "off"}
+
+
+def _best_compression() -> str:
+    """Fastest compression codec whose Python library is installed"""
+    for name, available in (
+        ("lz4", codec.has_lz4),
+        ("zstd", codec.has_zstd),
+        ("snappy", codec.has_snappy),
+    ):
+        if available():
+            return name
+    return "gzip"
+
+
+# Named producer tuning profiles; explicit properties override their values
+PRODUCER_PROFILES = {
+    "throughput": lambda: {
+        "linger_ms": 50,
+        "batch_size": 262144,
+        "compression_type": _best_compression(),
+        "acks": 1,
+        "max_in_flight_requests_per_connection": 5,
+    },
+    "latency": lambda: {
+        "linger_ms": 0,
+        "batch_size": 16384,
+        "compression_type": None,
+        "acks": 1,
+    },
+    "durability": lambda: {
+        "acks": "all",
+        "enable_idempotence": True,
+        # kafka-python only guarantees idempotence with one in-flight request
+        "max_in_flight_requests_per_connection": 1,
+        "delivery_timeout_ms": 300000,
+    },
+}
+
+
+def producer_profile(name: Optional[str]) -> Dict[str, Any]:
+    """Return the kwargs of a named producer profile (empty for None)"""
+    if not name:
+        return {}
+    if name not in PRODUCER_PROFILES:
+        raise ValueError(
+            f"Unknown producer profile '{name}'. "
+            f"Available: {', '.join(sorted(PRODUCER_PROFILES))}"
+        )
+    return PRODUCER_PROFILES[name]()
+
+
+def argument_name(key: str) -> str:
+    """Map a Java-style property name to a kafka-python argument name"""
+    return PROPERTY_ALIASES.get(key, key.replace(".", "_").replace("-", "_"))
+
+
+def convert_value(argument: str, value: str, default: Any) -> Any:
+    """Convert a properties string to the type kafka-python expects"""
+    value = value.strip()
+    if argument == "acks":
+        return "all" if value.lower() in ("all", "-1") else int(value)
+    if argument == "compression_type":
+        return None if value.lower() == "none" else value.lower()
+    if argument == "api_version":
+        return tuple(int(part) for part in value.split("."))
+    if argument == "ssl_check_hostname":
+        # Also accepts ssl.endpoint.identification.algorithm=https|""
+        return value.lower() in TRUE_VALUES | {"https"}
+    if isinstance(default, bool):
+        if value.lower() in TRUE_VALUES:
+            return True
+        if value.lower() in FALSE_VALUES:
+            return False
+        raise ValueError(f"expected true or false, got '{value}'")
+    if isinstance(default, int) or argument in INT_ARGUMENTS:
+        return int(value)
+    if isinstance(default, float):
+        return float(value)
+    return value
+
+
+def parse_jaas_config(value: str) -> Dict[str, str]:
+    """Extract SASL username/password from a Java sasl.jaas.config entry"""
+    options = dict(re.findall(r'(\w+)\s*=\s*"([^"]*)"', value))
+    credentials = {}
+    if "username" in options:
+        credentials["sasl_plain_username"] = options["username"]
+    if "password" in options:
+        credentials["sasl_plain_password"] = options["password"]
+    return credentials
+
+
+def _translate(key: str, value: str, client_class: type) -> Optional[Dict[str, Any]]:
+    """Translate one property for a client, or None if the client doesn't take it"""
+    if key == "sasl.jaas.config":
+        return parse_jaas_config(value)
+    if key == "ssl.endpoint.identification.algorithm":
+        key = "ssl.check.hostname"
+
+    argument = argument_name(key)
+    defaults = client_class.DEFAULT_CONFIG
+    if argument not in defaults:
+        return None
+    return {argument: convert_value(argument, value, defaults[argument])}
+
+
+def build_client_configs(
+    properties: Dict[str, str], profile: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Split properties into validated kwargs for the admin client, producer and consumer
+
+    Unprefixed properties are shared: each client takes the ones it accepts.
+    ``admin.*``, ``producer.*`` and ``consumer.*`` properties apply to that
+    client only and override shared ones. Every property is checked here, so
+    a typo or a setting no client accepts fails once, at load time, with all
+    problems listed.
+    """
+    shared: Dict[str, str] = {}
+    scoped: Dict[str, Dict[str, str]] = {
+        namespace: {} for namespace in CLIENT_NAMESPACES
+    }
+    for key, value in properties.items():
+        namespace, _, name = key.partition(".")
+        target = (
+            scoped[namespace] if namespace in CLIENT_NAMESPACES and name else shared
+        )
+        name = name if target is not shared else key
+        if name in UNSUPPORTED_PROPERTIES:
+            logger.warning(f"Ignoring '{key}': {UNSUPPORTED_PROPERTIES[name]}")
+            continue
+        target[name] = value
+
+    errors: List[str] = []
+    accepted = set()
+    configs = {}
+    for namespace, client_class in CLIENT_NAMESPACES.items():
+        kwargs = producer_profile(profile) if namespace == "producer" else {}
+        for key, value in shared.items():
+            try:
+                translated = _translate(key, value, client_class)
+            except ValueError as e:
+                translated = None
+                if key not in accepted:
+                    errors.append(f"invalid value for '{key}': {e}")
+                accepted.add(key)
+            if translated is not None:
+                kwargs.update(translated)
+                accepted.add(key)
+        for key, value in scoped[namespace].items():
+            try:
+                translated = _translate(key, value, client_class)
+            except ValueError as e:
+                errors.append(f"invalid value for '{namespace}.{key}': {e}")
+                continue
+            if translated is None:
+                errors.append(
+                    f"'{namespace}.{key}' is not a {client_class.__name__} property"
+                )
+            else:
+                kwargs.update(translated)
+        kwargs.setdefault("bootstrap_servers", "localhost:9092")
+        kwargs.setdefault("client_id", "kafka-mcp-server")
+        configs[namespace] = kwargs
+
+    errors.extend(
+        f"'{key}' is not accepted by any Kafka client"
+        for key in shared
+        if key not in accepted
+    )
+    if errors:
+        raise ValueError("Invalid Kafka configuration: " + "; ".join(errors))
+    return configs
@@ -3,24 +3,118 @@
 Kafka Utilities - Core Kafka operations and management functionality
 """
 
+import base64
+import codecs
+import fnmatch
 import json
 import logging
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from kafka import KafkaProducer
-from kafka.admin import KafkaAdminClient, NewTopic
+from kafka import KafkaConsumer, KafkaProducer, TopicPartition
+from kafka.admin import (
+    ConfigResource,
+    ConfigResourceType,
+    KafkaAdminClient,
+    NewPartitions,
+    NewTopic,
+)
 from kafka.errors import (
     InvalidPartitionsError,
     InvalidReplicationFactorError,
     KafkaError,
+    KafkaTimeoutError,
+    NotControllerError,
     TopicAlreadyExistsError,
     UnknownTopicOrPartitionError,
+    for_code,
+)
+from kafka.protocol.admin import (
+    AlterConfigsRequest,
+    CreatePartitionsRequest,
+    CreateTopicsRequest,
+    DeleteTopicsRequest,
+)
+
+from backends import create_backend
+from delivery import (
+    DEFAULT_MAX_SAMPLES,
+    DEFAULT_MAX_TICKETS,
+    DeliveryTracker,
+    LatencyReservoir,
+    latency_summary,
 )
+from kafka_config import build_client_configs
+from record_files import RecordError, detect_format, open_lines, read_records
+from topic_export import Checkpoint, check_format, open_writer
+from topic_spec import diff_topic, load_spec_file, parse_spec
+from serializers import DEFAULT_SERIALIZER, get_serializer, serialize
 
 # Configure logging
 logger = logging.getLogger("kafka-utils")
 
+# Properties with this prefix configure the MCP server itself and are never
+# forwarded to the kafka-python clients
+MCP_CONFIG_PREFIX = "mcp."
+
+DEFAULT_METADATA_TTL_MS = 30000
+
+DEFAULT_CONSUMER_POOL_SIZE = 4
+CONSUMER_ACQUIRE_TIMEOUT_S = 30
+
+# Records produced from a file between producer flushes
+DEFAULT_FLUSH_EVERY = 10000
+# Longest a producer flush waits for outstanding acknowledgements
+FLUSH_TIMEOUT_S = 60
+
+# Serializers that leave an already-valid JSON line unchanged in meaning
+JSON_SERIALIZERS = ("json", "stdlib-json")
+
+# Records exported per partition between checkpoints
+DEFAULT_CHECKPOINT_EVERY = 100000
+
+# Longest run kafka_load_test accepts, and the number of distinct random
+# payloads it cycles through so batches don't compress unrealistically well
+MAX_LOAD_TEST_S = 600
+LOAD_TEST_PAYLOADS = 256
+# Acknowledgement latencies sampled across a whole load test
+LOAD_TEST_SAMPLES = 100000
+
+# Header that marks the canary records of kafka_e2e_latency_probe
+PROBE_HEADER = "mcp-latency-probe"
+
+# Topics per CreateTopics/DeleteTopics request in bulk operations, keeping
+# each request well inside the broker's request size and controller timeout
+DEFAULT_TOPIC_CHUNK_SIZE = 100
+
+# Topics per metadata request and concurrent requests for kafka_cluster_health
+DEFAULT_HEALTH_CHUNK_SIZE = 500
+DEFAULT_HEALTH_PARALLELISM = 4
+
+# Partition problems kafka_cluster_health reports, most severe first
+HEALTH_CATEGORIES = ("offline", "leaderless", "under_min_isr", "under_replicated")
+
+# DescribeConfigs (v1+) source of configs set on the topic itself
+TOPIC_CONFIG_SOURCE = 1
+
+# Broker configs giving the counts of topics created with -1 (broker default)
+BROKER_TOPIC_DEFAULTS = {
+    "partitions": "num.partitions",
+    "replication_factor": "default.replication.factor",
+}
+
+# Fields kafka_list_topics can sort by
+TOPIC_SORT_KEYS = ("name", "partitions", "replication_factor")
+
 
 class KafkaManager:
     """Manages Kafka connections and operations"""
@@ -28,8 +122,49 @@ class KafkaManager:
     def __init__(self, config_file: str):
         self.config_file = Path(config_file)
         self.config = self._load_config()
+        # Validated kwargs per client ("admin", "producer", "consumer"); built
+        # once so a bad property fails here rather than on first use
+        self.client_configs = build_client_configs(
+            {
+                k: v
+                for k, v in self.config.items()
+                if not k.startswith(MCP_CONFIG_PREFIX)
+            },
+            profile=self.config.get("mcp.producer.profile"),
+        )
+        # Creates the clients: real brokers, or an in-memory cluster
+        self.backend = create_backend(self.config)
         self.admin_client = None
         self.producer = None
+        self.consumers: List[KafkaConsumer] = []
+        # Tools run in a thread pool, so lazy client creation must be guarded
+        self._lock = threading.Lock()
+
+        # Topic metadata cache: topic name -> (fetched_at, describe result)
+        self.metadata_ttl = (
+            float(self.config.get("mcp.metadata.ttl.ms", DEFAULT_METADATA_TTL_MS))
+            / 1000
+        )
+        self._topic_metadata: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._all_topics_fetched_at: Optional[float] = None
+        self._metadata_lock = threading.Lock()
+
+        # Idle consumers ready to be reassigned; KafkaConsumer is not
+        # thread-safe, so each concurrent fetch borrows its own
+        self.consumer_pool_size = int(
+            self.config.get("mcp.consumer.pool.size", DEFAULT_CONSUMER_POOL_SIZE)
+        )
+        self._idle_consumers: "queue.LifoQueue[KafkaConsumer]" = queue.LifoQueue()
+
+        # Acknowledgements of fire-and-forget sends, grouped by ticket
+        self.deliveries = DeliveryTracker(
+            max_tickets=int(
+                self.config.get("mcp.delivery.max.tickets", DEFAULT_MAX_TICKETS)
+            ),
+            max_samples=int(
+                self.config.get("mcp.delivery.max.samples", DEFAULT_MAX_SAMPLES)
+            ),
+        )
 
     def _load_config(self) -> Dict[str, Any]:
         """Load Kafka configuration from properties file"""
@@ -50,63 +185,253 @@ class KafkaManager:
 
     def _get_admin_client(self) -> KafkaAdminClient:
         """Get or create Kafka admin client"""
-        if self.admin_client is None:
-            self.admin_client = KafkaAdminClient(
-                bootstrap_servers=self.config.get(
-                    "bootstrap.servers", "localhost:9092"
-                ),
-                client_id=self.config.get("client.id", "kafka-mcp-server"),
-                **{
-                    k: v
-                    for k, v in self.config.items()
-                    if k not in ["bootstrap.servers", "client.id"]
-                },
-            )
+        with self._lock:
+            if self.admin_client is None:
+                self.admin_client = self.backend.admin_client(
+                    **self.client_configs["admin"]
+                )
         return self.admin_client
 
     def _get_producer(self) -> KafkaProducer:
-        """Get or create Kafka producer"""
-        if self.producer is None:
-            self.producer = KafkaProducer(
-                bootstrap_servers=self.config.get(
-                    "bootstrap.servers", "localhost:9092"
-                ),
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-                **{
-                    k: v
-                    for k, v in self.config.items()
-                    if k not in ["bootstrap.servers", "client.id"]
-                },
-            )
+        """Get or create Kafka producer
+
+        ``mcp.producer.profile`` (throughput, latency or durability) supplies
+        tuning defaults that explicit shared or ``producer.*`` properties
+        override.
+        """
+        with self._lock:
+            if self.producer is None:
+                self.producer = self.backend.producer(**self.client_configs["producer"])
         return self.producer
 
-    def list_topics(self) -> List[Dict[str, Any]]:
+    def _is_fresh(self, fetched_at: Optional[float]) -> bool:
+        """Check whether a metadata cache timestamp is still within the TTL"""
+        return (
+            fetched_at is not None and time.monotonic() - fetched_at < self.metadata_ttl
+        )
+
+    def _describe_topics(
+        self, topics: Optional[List[str]] = None, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Describe topics, serving fresh entries from the metadata cache
+
+        ``topics=None`` describes every topic in the cluster.
+        """
+        if topics is None:
+            with self._metadata_lock:
+                if not refresh and self._is_fresh(self._all_topics_fetched_at):
+                    return [entry for _, entry in self._topic_metadata.values()]
+
+            metadata = self._get_admin_client().describe_topics() or []
+            fetched_at = time.monotonic()
+            with self._metadata_lock:
+                self._topic_metadata = {
+                    topic_metadata.get("topic"): (fetched_at, topic_metadata)
+                    for topic_metadata in metadata
+                }
+                self._all_topics_fetched_at = fetched_at
+            return metadata
+
+        cached = {}
+        with self._metadata_lock:
+            if not refresh:
+                for name in topics:
+                    entry = self._topic_metadata.get(name)
+                    if entry and self._is_fresh(entry[0]):
+                        cached[name] = entry[1]
+
+        missing = [name for name in topics if name not in cached]
+        if missing:
+            metadata = self._get_admin_client().describe_topics(missing) or []
+            fetched_at = time.monotonic()
+            with self._metadata_lock:
+                for topic_metadata in metadata:
+                    name = topic_metadata.get("topic")
+                    cached[name] = topic_metadata
+                    # Unknown topics come back with an error code; don't cache them
+                    if not topic_metadata.get("error_code"):
+                        self._topic_metadata[name] = (fetched_at, topic_metadata)
+
+        return [cached[name] for name in topics if name in cached]
+
+    def _invalidate_topic_metadata(self, name: str):
+        """Drop cached metadata after a topic is created or deleted"""
+        with self._metadata_lock:
+            self._topic_metadata.pop(name, None)
+            self._all_topics_fetched_at = None
+
+    def list_topic_names(
+        self, refresh: bool = False, include_internal: bool = True
+    ) -> List[str]:
+        """List topic names only, without building partition details
+
+        Internal topics are the ones the brokers flag as ``is_internal``
+        (e.g. __consumer_offsets), whatever their names.
+        """
+        try:
+            # list_topics() sends the same metadata request but drops
+            # is_internal; describing every topic also caches each topic's
+            # metadata, so describing listed topics next sends no request
+            return sorted(
+                topic_metadata["topic"]
+                for topic_metadata in self._describe_topics(refresh=refresh)
+                if include_internal or not topic_metadata.get("is_internal")
+            )
+        except Exception as e:
+            logger.error(f"Failed to list topic names: {e}")
+            raise
+
+    @contextmanager
+    def _get_consumer(self) -> Iterator[KafkaConsumer]:
+        """Borrow a consumer from the pool, creating one if the pool has room
+
+        Consumers have no group id and are positioned with assign/seek, so
+        reusing one costs no group join or rebalance.
+        """
+        consumer = None
+        try:
+            consumer = self._idle_consumers.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self.consumers) < self.consumer_pool_size:
+                    consumer = self.backend.consumer(
+                        **{
+                            **self.client_configs["consumer"],
+                            "group_id": None,
+                            "enable_auto_commit": False,
+                        }
+                    )
+                    self.consumers.append(consumer)
+            if consumer is None:
+                try:
+                    consumer = self._idle_consumers.get(
+                        timeout=CONSUMER_ACQUIRE_TIMEOUT_S
+                    )
+                except queue.Empty:
+                    raise KafkaTimeoutError(
+                        f"All {self.consumer_pool_size} pooled consumers stayed busy "
+                        f"for {CONSUMER_ACQUIRE_TIMEOUT_S}s; retry later or raise "
+                        "mcp.consumer.pool.size"
+                    ) from None
+
+        try:
+            yield consumer
+        finally:
+            self._idle_consumers.put(consumer)
+
+    def _reader_count(self, partitions: int) -> int:
+        """Consumers one call may borrow to read partitions in parallel
+
+        One pooled consumer is left for concurrent calls, so a parallel
+        search or export can't starve every other read tool.
+        """
+        return max(1, min(partitions, self.consumer_pool_size - 1))
+
+    def list_topics(
+        self,
+        refresh: bool = False,
+        pattern: Optional[str] = None,
+        prefix: Optional[str] = None,
+        include_internal: bool = True,
+        sort: str = "name",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """List all topics in the Kafka cluster"""
+        return self.list_topics_page(
+            pattern=pattern,
+            prefix=prefix,
+            include_internal=include_internal,
+            sort=sort,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+            refresh=refresh,
+        )["topics"]
+
+    def list_topics_page(
+        self,
+        pattern: Optional[str] = None,
+        prefix: Optional[str] = None,
+        include_internal: bool = True,
+        sort: str = "name",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        names_only: bool = False,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """List one page of topics matching the given filters
+
+        Names and details come from one describe of every topic, which the
+        metadata cache keeps, so paging through the topics sends no further
+        requests while the cache is fresh. Filtering and pagination are
+        applied to the names; only the returned page is summarized.
+        """
+        if sort not in TOPIC_SORT_KEYS:
+            raise ValueError(
+                f"Invalid sort '{sort}'. Use one of: {', '.join(TOPIC_SORT_KEYS)}"
+            )
+        if offset < 0 or (limit is not None and limit < 1):
+            raise ValueError("offset must be >= 0 and limit must be >= 1")
+        regex = re.compile(pattern) if pattern else None
+
         try:
-            admin = self._get_admin_client()
-            metadata = admin.describe_topics()
+            metadata = {
+                topic_metadata["topic"]: topic_metadata
+                for topic_metadata in self._describe_topics(refresh=refresh)
+                if include_internal or not topic_metadata.get("is_internal")
+            }
+            names = [
+                name
+                for name in metadata
+                if (not prefix or name.startswith(prefix))
+                and (not regex or regex.search(name))
+            ]
 
-            if metadata is None:
-                return []
-            topics = []
-            for topic_metadata in metadata:
-                topics.append(
-                    {
-                        "name": topic_metadata.get("topic"),
-                        "partitions": len(topic_metadata.get("partitions")),
-                        "replication_factor": (
-                            len(topic_metadata.get("partitions")[0].get("replicas"))
-                            if topic_metadata.get("partitions")
-                            else 0
-                        ),
-                    }
-                )
+            end = offset + limit if limit else None
+            total = len(names)
+            if sort == "name" or names_only:
+                page = sorted(names, reverse=descending)[offset:end]
+                page_topics = [
+                    (
+                        {"name": name}
+                        if names_only
+                        else self._summarize_topic(metadata[name])
+                    )
+                    for name in page
+                ]
+            else:
+                page_topics = sorted(
+                    (self._summarize_topic(metadata[name]) for name in names),
+                    key=lambda x: (-x[sort] if descending else x[sort], x["name"]),
+                )[offset:end]
+            next_offset = offset + len(page_topics)
 
-            return sorted(topics, key=lambda x: x["name"])
+            return {
+                "topics": page_topics,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": next_offset if next_offset < total else None,
+            }
         except Exception as e:
             logger.error(f"Failed to list topics: {e}")
             raise
 
+    @staticmethod
+    def _summarize_topic(topic_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a describe_topics entry to name, partition count and replication"""
+        partitions = topic_metadata.get("partitions") or []
+        return {
+            "name": topic_metadata.get("topic"),
+            "partitions": len(partitions),
+            "replication_factor": (
+                len(partitions[0].get("replicas")) if partitions else 0
+            ),
+        }
+
     def create_topic(
         self,
         name: str,
@@ -138,6 +463,7 @@ class KafkaManager:
 
             response = admin.create_topics([topic])
             logger.info(f"Create Topics response: {response}")
+            self._invalidate_topic_metadata(name)
 
             return {
                 "status": "success",
@@ -183,6 +509,7 @@ class KafkaManager:
             admin = self._get_admin_client()
             response = admin.delete_topics([name])
             logger.info(f"Delete Topic response: {response}")
+            self._invalidate_topic_metadata(name)
 
             return {
                 "status": "success",
@@ -208,14 +535,645 @@ class KafkaManager:
                 "message": f"Failed to initiate topic deletion: {str(e)}",
             }
 
-    def get_topic_info(self, name: str) -> Dict[str, Any]:
+    def create_topics(
+        self,
+        topics: List[Any],
+        partitions: int = 1,
+        replication_factor: int = 1,
+        config: Optional[Dict[str, str]] = None,
+        chunk_size: int = DEFAULT_TOPIC_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """Create many topics with one admin request per chunk
+
+        Each entry is a topic name or a dict with ``name`` and optional
+        ``partitions``, ``replication_factor`` and ``config`` overriding the
+        defaults. Counts of -1 take the brokers' defaults. Topics that
+        already exist are reported without being sent, and every topic gets
+        its own result: invalid entries fail on their own without failing
+        the batch.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        new_topics: List[NewTopic] = []
+        defaults: Dict[str, int] = {}
+        try:
+            existing = set(self.list_topic_names(refresh=True))
+        except Exception as e:
+            return {"status": "error", "message": f"Failed to create topics: {str(e)}"}
+
+        for entry in topics:
+            spec = {"name": entry} if isinstance(entry, str) else dict(entry)
+            name = spec.get("name")
+            num_partitions = spec.get("partitions", partitions)
+            replication = spec.get("replication_factor", replication_factor)
+            if name in results:
+                # Repeated names are created once, as listed first
+                continue
+            if not name:
+                error = "Topic name is required"
+            elif not self._is_count(num_partitions):
+                error = "Number of partitions must be an integer, at least 1 or -1 for default."
+            elif not self._is_count(replication):
+                error = "Replication factor must be an integer, at least 1 or -1 for default."
+            else:
+                error = None
+            if error:
+                results[name or f"#{len(results)}"] = {
+                    "status": "error",
+                    "error": error,
+                }
+            elif name in existing:
+                results[name] = {"status": "exists"}
+            else:
+                try:
+                    new_topics.append(
+                        self._new_topic(
+                            name,
+                            num_partitions,
+                            replication,
+                            {**(config or {}), **spec.get("config", {})},
+                            defaults,
+                        )
+                    )
+                except Exception as e:
+                    results[name] = {"status": "error", "error": str(e)}
+                else:
+                    results[name] = {"status": "created"}
+
+        requests = 0
+        if new_topics:
+            try:
+                errors, requests = self._submit_topic_changes(
+                    "create", new_topics, chunk_size
+                )
+            except Exception as e:
+                logger.error(f"Failed to create topics: {e}")
+                errors = {topic.name: str(e) for topic in new_topics}
+            for topic in new_topics:
+                self._invalidate_topic_metadata(topic.name)
+                if errors.get(topic.name):
+                    results[topic.name] = {
+                        "status": "error",
+                        "error": errors[topic.name],
+                    }
+
+        return self._bulk_topic_result("created", results, requests)
+
+    def delete_topics(
+        self,
+        names: Optional[List[str]] = None,
+        pattern: Optional[str] = None,
+        include_internal: bool = False,
+        dry_run: bool = False,
+        chunk_size: int = DEFAULT_TOPIC_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """Delete listed topics and/or every topic matching a glob pattern
+
+        Pattern matches skip the topics the brokers flag as internal unless
+        include_internal is set. With dry_run the matching topics are
+        only listed.
+        """
+        if not names and not pattern:
+            return {"status": "error", "message": "Provide names and/or a pattern."}
+
+        try:
+            existing = set(self.list_topic_names(refresh=True))
+            # Served from the names just listed
+            candidates = self.list_topic_names(include_internal=include_internal)
+        except Exception as e:
+            return {"status": "error", "message": f"Failed to delete topics: {str(e)}"}
+
+        selected = list(dict.fromkeys(names or []))
+        if pattern:
+            selected += [
+                name
+                for name in candidates
+                if fnmatch.fnmatchcase(name, pattern) and name not in selected
+            ]
+        if dry_run:
+            return {
+                "status": "success",
+                "message": f"Dry run: {len(selected)} topic(s) would be deleted",
+                "dry_run": True,
+                "topics": selected,
+                "missing": [name for name in selected if name not in existing],
+            }
+
+        results = {
+            name: {"status": "deleted" if name in existing else "missing"}
+            for name in selected
+        }
+        to_delete = [name for name in selected if name in existing]
+        requests = 0
+        if to_delete:
+            try:
+                errors, requests = self._submit_topic_changes(
+                    "delete", to_delete, chunk_size
+                )
+            except Exception as e:
+                logger.error(f"Failed to delete topics: {e}")
+                errors = {name: str(e) for name in to_delete}
+            for name in to_delete:
+                self._invalidate_topic_metadata(name)
+                if errors.get(name):
+                    results[name] = {"status": "error", "error": errors[name]}
+
+        return self._bulk_topic_result("deleted", results, requests)
+
+    @staticmethod
+    def _bulk_topic_result(
+        done: str, results: Dict[str, Dict[str, Any]], requests: int
+    ) -> Dict[str, Any]:
+        """Summarize per-topic results of a bulk create or delete"""
+        counts: Dict[str, int] = {}
+        for result in results.values():
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        failed = counts.get("error", 0)
+        return {
+            "status": (
+                "success"
+                if not failed
+                else ("partial" if counts.get(done) else "error")
+            ),
+            "message": f"{done.capitalize()} {counts.get(done, 0)} of {len(results)} topics",
+            "summary": {"requested": len(results), "requests": requests, **counts},
+            "topics": [{"name": name, **result} for name, result in results.items()],
+        }
+
+    @staticmethod
+    def _error_text(code: int, message: Optional[str] = None) -> Optional[str]:
+        """Describe a protocol error code, or None for no error"""
+        if not code:
+            return None
+        error = for_code(code)
+        return f"{error.__name__}: {message or error.description}"
+
+    @staticmethod
+    def _is_count(value: Any) -> bool:
+        """A partition count or replication factor: >= 1, or -1 for default"""
+        return (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and (value >= 1 or value == -1)
+        )
+
+    def _submit_topic_changes(
+        self, action: str, items: List[Any], chunk_size: int
+    ) -> Tuple[Dict[str, Optional[str]], int]:
+        """Send CreateTopics/DeleteTopics/CreatePartitions requests in chunks
+
+        items are NewTopic objects to create, topic names to delete or
+        (name, NewPartitions) pairs for "partitions". Returns the error (or
+        None) of every topic and the number of requests sent.
+        KafkaAdminClient's create_topics/delete_topics/create_partitions
+        raise on the first failed topic and discard the rest of the
+        response, so the requests are built and sent directly: every chunk
+        is in flight at once and each topic keeps its own result. Clients
+        without those internals (e.g. other backends) fall back to one call
+        per topic.
+        """
+        admin = self._get_admin_client()
+
+        def name_of(item: Any) -> str:
+            if action == "create":
+                return item.name
+            if action == "partitions":
+                return item[0]
+            return item
+
+        if not hasattr(admin, "_send_request_to_node"):
+            errors = {}
+            for item in items:
+                try:
+                    if action == "create":
+                        admin.create_topics([item])
+                    elif action == "partitions":
+                        admin.create_partitions(dict([item]))
+                    else:
+                        admin.delete_topics([item])
+                    errors[name_of(item)] = None
+                except Exception as e:
+                    errors[name_of(item)] = f"{type(e).__name__}: {e}"
+            return errors, len(items)
+
+        timeout_ms = admin._validate_timeout(None)
+        if action == "create":
+            version = admin._client.api_version(CreateTopicsRequest, max_version=3)
+            extra = {"validate_only": False} if version > 0 else {}
+
+            def build(chunk: List[Any]):
+                return CreateTopicsRequest[version](
+                    create_topic_requests=[
+                        admin._convert_new_topic_request(topic) for topic in chunk
+                    ],
+                    timeout=timeout_ms,
+                    **extra,
+                )
+
+        elif action == "partitions":
+            version = admin._client.api_version(CreatePartitionsRequest, max_version=1)
+
+            def build(chunk: List[Any]):
+                return CreatePartitionsRequest[version](
+                    topic_partitions=[
+                        admin._convert_create_partitions_request(name, new_partitions)
+                        for name, new_partitions in chunk
+                    ],
+                    timeout=timeout_ms,
+                    validate_only=False,
+                )
+
+        else:
+            version = admin._client.api_version(DeleteTopicsRequest, max_version=3)
+
+            def build(chunk: List[Any]):
+                return DeleteTopicsRequest[version](topics=chunk, timeout=timeout_ms)
+
+        chunk_size = max(1, chunk_size)
+        errors: Dict[str, Optional[str]] = {}
+        requests = 0
+        pending = list(items)
+        # Topics bounced because the cached controller id is stale are retried once
+        for attempt in range(2):
+            chunks = [
+                pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)
+            ]
+            futures = [
+                admin._send_request_to_node(admin._controller_id, build(chunk))
+                for chunk in chunks
+            ]
+            requests += len(futures)
+            retry = []
+            for chunk, future in zip(chunks, futures):
+                try:
+                    # Raises if this chunk's request failed; the others keep
+                    # their own results
+                    admin._wait_for_futures([future])
+                except Exception as e:
+                    for item in chunk:
+                        errors[name_of(item)] = f"{type(e).__name__}: {e}"
+                    continue
+                by_name = {name_of(item): item for item in chunk}
+                for error in getattr(future.value, "topic_errors", None) or getattr(
+                    future.value, "topic_error_codes", []
+                ):
+                    if attempt == 0 and for_code(error[1]) is NotControllerError:
+                        retry.append(by_name[error[0]])
+                    else:
+                        errors[error[0]] = self._error_text(
+                            error[1], error[2] if len(error) > 2 else None
+                        )
+            if not retry:
+                break
+            try:
+                admin._refresh_controller_id()
+            except Exception as e:
+                for item in retry:
+                    errors[name_of(item)] = f"{type(e).__name__}: {e}"
+                break
+            pending = retry
+
+        return errors, requests
+
+    def _describe_topic_configs(
+        self, names: List[str], chunk_size: int, keys: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Describe the configs of topics, chunk_size topics per request
+
+        Maps every topic to (effective configs, configs set on the topic),
+        or to an error message if it couldn't be described. keys limits the
+        description to those configs.
+        """
+        admin = self._get_admin_client()
+        chunk_size = max(1, chunk_size)
+        configs: Dict[str, Any] = {}
+        for i in range(0, len(names), chunk_size):
+            responses = admin.describe_configs(
+                [
+                    ConfigResource(
+                        ConfigResourceType.TOPIC,
+                        name,
+                        configs=dict.fromkeys(keys) if keys else None,
+                    )
+                    for name in names[i : i + chunk_size]
+                ]
+            )
+            for response in responses:
+                for code, message, _, name, entries in response.resources:
+                    if code:
+                        configs[name] = self._error_text(code, message)
+                        continue
+                    # v0 flags defaults; later versions give the config source
+                    overrides = {
+                        entry[0]: entry[1]
+                        for entry in entries
+                        if (
+                            entry[3] == TOPIC_CONFIG_SOURCE
+                            if response.API_VERSION
+                            else not entry[3]
+                        )
+                    }
+                    configs[name] = (
+                        {entry[0]: entry[1] for entry in entries},
+                        overrides,
+                    )
+        return configs
+
+    def _broker_topic_defaults(self) -> Dict[str, int]:
+        """The partitions and replication factor brokers give new topics
+
+        kafka-python's NewTopic refuses -1 without a replica assignment, so
+        -1 is replaced with a broker's num.partitions and
+        default.replication.factor before topics are created.
+        """
+        admin = self._get_admin_client()
+        broker = admin.describe_cluster()["brokers"][0]["node_id"]
+        values: Dict[str, str] = {}
+        for response in admin.describe_configs(
+            [
+                ConfigResource(
+                    ConfigResourceType.BROKER,
+                    str(broker),
+                    configs=dict.fromkeys(BROKER_TOPIC_DEFAULTS.values()),
+                )
+            ]
+        ):
+            for code, message, _, _, entries in response.resources:
+                if code:
+                    raise KafkaError(self._error_text(code, message))
+                values.update((entry[0], entry[1]) for entry in entries)
+        return {field: int(values[key]) for field, key in BROKER_TOPIC_DEFAULTS.items()}
+
+    def _new_topic(
+        self,
+        name: str,
+        partitions: int,
+        replication_factor: int,
+        configs: Dict[str, str],
+        defaults: Dict[str, int],
+    ) -> NewTopic:
+        """A NewTopic with counts of -1 replaced by the broker defaults
+
+        defaults is filled on first use, so a batch asks the brokers once.
+        """
+        if -1 in (partitions, replication_factor) and not defaults:
+            defaults.update(self._broker_topic_defaults())
+        return NewTopic(
+            name=name,
+            num_partitions=defaults["partitions"] if partitions == -1 else partitions,
+            replication_factor=(
+                defaults["replication_factor"]
+                if replication_factor == -1
+                else replication_factor
+            ),
+            topic_configs=configs,
+        )
+
+    def _alter_topic_configs(
+        self, configs: Dict[str, Dict[str, str]], chunk_size: int
+    ) -> Tuple[Dict[str, Optional[str]], int]:
+        """Set the configs of topics with AlterConfigs requests in chunks
+
+        AlterConfigs replaces every config set on a topic, so each topic's
+        entry must include the overrides it keeps. Returns the error (or
+        None) of every topic and the number of requests sent. Requests are
+        built at version 0 and sent concurrently: kafka-python decodes v1
+        responses with the request schema.
+        """
+        admin = self._get_admin_client()
+        resources = [
+            ConfigResource(ConfigResourceType.TOPIC, name, configs=values)
+            for name, values in configs.items()
+        ]
+        chunk_size = max(1, chunk_size)
+        chunks = [
+            resources[i : i + chunk_size] for i in range(0, len(resources), chunk_size)
+        ]
+        if hasattr(admin, "_send_request_to_node"):
+            version = admin._client.api_version(AlterConfigsRequest, max_version=0)
+            futures = [
+                admin._send_request_to_node(
+                    admin._client.least_loaded_node(),
+                    AlterConfigsRequest[version](
+                        resources=[
+                            admin._convert_alter_config_resource_request(resource)
+                            for resource in chunk
+                        ],
+                        validate_only=False,
+                    ),
+                )
+                for chunk in chunks
+            ]
+            admin._wait_for_futures(futures)
+            responses = [future.value for future in futures]
+        else:
+            responses = [admin.alter_configs(chunk) for chunk in chunks]
+
+        errors = {
+            name: self._error_text(code, message)
+            for response in responses
+            for code, message, _, name in response.resources
+        }
+        return errors, len(chunks)
+
+    def apply_topic_spec(
+        self,
+        spec_file: Optional[str] = None,
+        spec: Optional[Dict[str, Any]] = None,
+        dry_run: bool = False,
+        chunk_size: int = DEFAULT_TOPIC_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """Reconcile the cluster's topics with a spec of desired topics
+
+        The spec is read from spec_file (YAML or JSON) or given inline. The
+        listed topics are described in one batch and compared with the
+        spec; only the differences are applied, in batched requests: missing
+        topics are created, partition counts grown and changed configs set.
+        Configs not named in the spec are left alone. Changes that can't be
+        applied (fewer partitions, another replication factor) are reported
+        as conflicts. Counts of -1 take the brokers' defaults, which the
+        plan shows. With dry_run the plan is returned without changes.
+        """
+        try:
+            if spec is None:
+                if not spec_file:
+                    return {
+                        "status": "error",
+                        "message": "Provide spec_file or spec.",
+                    }
+                spec = load_spec_file(Path(spec_file).expanduser())
+            desired = parse_spec(spec)
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Failed to read topic spec: {str(e)}",
+            }
+
+        try:
+            existing = set(self.list_topic_names(refresh=True))
+            present = [topic["name"] for topic in desired if topic["name"] in existing]
+            metadata = {
+                topic_metadata["topic"]: topic_metadata
+                for topic_metadata in (
+                    self._describe_topics(present, refresh=True) if present else []
+                )
+            }
+            configs = self._describe_topic_configs(
+                [
+                    topic["name"]
+                    for topic in desired
+                    if topic["name"] in existing and topic["config"]
+                ],
+                chunk_size,
+            )
+        except Exception as e:
+            logger.error(f"Failed to describe topics for spec: {e}")
+            return {
+                "status": "error",
+                "message": f"Failed to describe topics: {str(e)}",
+            }
+
+        changes: List[Dict[str, Any]] = []
+        conflicts: List[Dict[str, str]] = []
+        creates, grows, alters = [], [], {}
+        defaults: Dict[str, int] = {}
+        for topic in desired:
+            name = topic["name"]
+            if name not in existing:
+                change = {"name": name, "action": "create", **topic}
+                try:
+                    new_topic = self._new_topic(
+                        name,
+                        topic["partitions"],
+                        topic["replication_factor"],
+                        topic["config"],
+                        defaults,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to plan topic '{name}': {e}")
+                    change.update(status="error", error=str(e))
+                else:
+                    creates.append(new_topic)
+                    change.update(
+                        partitions=new_topic.num_partitions,
+                        replication_factor=new_topic.replication_factor,
+                    )
+                changes.append(change)
+                continue
+
+            topic_metadata = metadata.get(name)
+            if not topic_metadata or topic_metadata.get("error_code"):
+                conflicts.append({"name": name, "reason": "could not be described"})
+                continue
+            topic_configs = configs.get(name)
+            if isinstance(topic_configs, str):
+                conflicts.append(
+                    {"name": name, "reason": f"configs unavailable: {topic_configs}"}
+                )
+            summary = self._summarize_topic(topic_metadata)
+            diff = diff_topic(
+                topic,
+                summary["partitions"],
+                summary["replication_factor"],
+                topic_configs[0] if isinstance(topic_configs, tuple) else None,
+            )
+            if diff["partitions"]:
+                grows.append((name, NewPartitions(diff["partitions"])))
+                changes.append(
+                    {
+                        "name": name,
+                        "action": "add_partitions",
+                        "from": summary["partitions"],
+                        "to": diff["partitions"],
+                    }
+                )
+            if diff["config"]:
+                alters[name] = {**topic_configs[1], **topic["config"]}
+                changes.append(
+                    {"name": name, "action": "alter_config", "config": diff["config"]}
+                )
+            conflicts.extend(
+                {"name": name, "reason": reason} for reason in diff["conflicts"]
+            )
+
+        requests = 0
+        if not dry_run:
+            errors: Dict[str, Dict[str, Optional[str]]] = {}
+            for action, items in (
+                ("create", creates),
+                ("add_partitions", grows),
+                ("alter_config", alters),
+            ):
+                if not items:
+                    continue
+                try:
+                    if action == "alter_config":
+                        errors[action], sent = self._alter_topic_configs(
+                            items, chunk_size
+                        )
+                    else:
+                        errors[action], sent = self._submit_topic_changes(
+                            "create" if action == "create" else "partitions",
+                            items,
+                            chunk_size,
+                        )
+                    requests += sent
+                except Exception as e:
+                    logger.error(f"Failed to apply topic spec ({action}): {e}")
+                    errors[action] = {
+                        change["name"]: str(e)
+                        for change in changes
+                        if change["action"] == action
+                    }
+            for change in changes:
+                if change.get("status") == "error":
+                    # Never sent
+                    continue
+                if change["action"] != "alter_config":
+                    self._invalidate_topic_metadata(change["name"])
+                error = errors.get(change["action"], {}).get(change["name"])
+                change["status"] = "error" if error else "applied"
+                if error:
+                    change["error"] = error
+
+        failed = sum(1 for change in changes if change.get("status") == "error")
+        counts = {"create": 0, "add_partitions": 0, "alter_config": 0}
+        for change in changes:
+            counts[change["action"]] += 1
+        changed = {change["name"] for change in changes}
+        conflicted = {conflict["name"] for conflict in conflicts}
+        if changes and failed == len(changes):
+            status = "error"
+        elif failed or conflicts:
+            status = "partial"
+        else:
+            status = "success"
+        if dry_run:
+            message = f"Dry run: {len(changes)} change(s) planned"
+        else:
+            message = f"Applied {len(changes) - failed} of {len(changes)} change(s)"
+        return {
+            "status": status,
+            "message": f"{message}, {len(conflicts)} conflict(s)",
+            "dry_run": dry_run,
+            "summary": {
+                "topics": len(desired),
+                "unchanged": len(desired) - len(changed | conflicted),
+                **counts,
+                "conflicts": len(conflicts),
+                "failed": failed,
+                "requests": requests,
+            },
+            "changes": changes,
+            "conflicts": conflicts,
+        }
+
+    def get_topic_info(self, name: str, refresh: bool = False) -> Dict[str, Any]:
         """Get detailed information about a specific topic"""
         try:
-            admin = self._get_admin_client()
-            metadata = admin.describe_topics([name])
+            metadata = self._describe_topics([name], refresh=refresh)
 
             logger.info(metadata)
-            if metadata is None:
+            if not metadata:
                 return {"status": "error", "message": f"Topic '{name}' not found"}
 
             topic_metadata = metadata[0]
@@ -249,15 +1207,54 @@ class KafkaManager:
                 "message": f"Failed to get topic info for '{name}': {str(e)}",
             }
 
+    def _serializer_for(self, topic: str, serializer: Optional[str] = None) -> str:
+        """Resolve the serializer spec: per call, then per topic, then default
+
+        Per-topic and default serializers come from the
+        ``mcp.serializer.topic.<topic>`` and ``mcp.serializer.default``
+        properties.
+        """
+        return (
+            serializer
+            or self.config.get(f"mcp.serializer.topic.{topic}")
+            or self.config.get("mcp.serializer.default", DEFAULT_SERIALIZER)
+        )
+
     def send_message(
-        self, topic: str, message: Optional[Any], key: Optional[str] = None
+        self,
+        topic: str,
+        message: Optional[Any],
+        key: Optional[str] = None,
+        serializer: Optional[str] = None,
+        wait: bool = True,
+        ticket: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Send a message to a Kafka topic"""
+        """Send a message to a Kafka topic
+
+        With ``wait=False`` the message is only queued in the producer and a
+        delivery ticket is returned instead of the record metadata; passing
+        an existing ``ticket`` adds the send to it. Acknowledgements are
+        aggregated per ticket and reported by ``delivery_status``.
+        """
+        delivery = None
         try:
             producer = self._get_producer()
+            if not wait:
+                delivery = self.deliveries.open(topic, ticket)
+            started = time.perf_counter()
             future = producer.send(
-                topic, value=message, key=key.encode("utf-8") if key else None
+                topic,
+                value=serialize(message, self._serializer_for(topic, serializer)),
+                key=key.encode("utf-8") if key else None,
             )
+            if delivery is not None:
+                self.deliveries.track(delivery, future, started)
+                return {
+                    "status": "success",
+                    "message": f"Message queued for topic '{topic}'",
+                    "ticket": delivery.ticket_id,
+                }
+
             record_metadata = future.get(timeout=10)
 
             return {
@@ -271,11 +1268,1553 @@ class KafkaManager:
             }
         except Exception as e:
             logger.error(f"Failed to send message to topic '{topic}': {e}")
+            if delivery is not None:
+                self.deliveries.record_failure(delivery, e)
             return {"status": "error", "message": f"Failed to send message: {str(e)}"}
 
+    def delivery_status(self, ticket: Optional[str] = None) -> Dict[str, Any]:
+        """Report acknowledgements of fire-and-forget sends for one or all tickets"""
+        return self.deliveries.status(ticket)
+
+    def send_messages(
+        self,
+        topic: str,
+        records: List[Dict[str, Any]],
+        max_errors: int = 10,
+        serializer: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send a batch of messages to a Kafka topic in one pipelined call
+
+        Each record is a dict with a required ``value`` and optional ``key``,
+        ``headers`` (dict of str -> str) and ``partition``. All records are
+        handed to the producer first and flushed once, so the batch costs a
+        handful of produce requests instead of one round trip per record.
+        """
+        try:
+            producer = self._get_producer()
+            spec = self._serializer_for(topic, serializer)
+            get_serializer(spec)
+        except Exception as e:
+            logger.error(f"Failed to prepare messages for topic '{topic}': {e}")
+            return {"status": "error", "message": f"Failed to send messages: {str(e)}"}
+
+        futures = []
+        failures = []
+        for index, record in enumerate(records):
+            try:
+                key = record.get("key")
+                headers = record.get("headers") or {}
+                future = producer.send(
+                    topic,
+                    value=serialize(record.get("value"), spec),
+                    key=key.encode("utf-8") if key else None,
+                    headers=[(k, str(v).encode("utf-8")) for k, v in headers.items()],
+                    partition=record.get("partition"),
+                )
+                futures.append((index, future))
+            except Exception as e:
+                failures.append({"index": index, "error": str(e)})
+
+        flush_error = None
+        try:
+            producer.flush()
+        except Exception as e:
+            # Keep the acknowledgements already received; records still in
+            # flight are reported as failed below
+            logger.error(f"Failed to flush messages to topic '{topic}': {e}")
+            flush_error = str(e)
+
+        partitions: Dict[int, Dict[str, int]] = {}
+        for index, future in futures:
+            if flush_error is not None and not future.is_done:
+                failures.append(
+                    {"index": index, "error": f"Flush failed: {flush_error}"}
+                )
+                continue
+            try:
+                record_metadata = future.get(timeout=10)
+            except Exception as e:
+                failures.append({"index": index, "error": str(e)})
+                continue
+            offsets = partitions.setdefault(
+                record_metadata.partition,
+                {
+                    "first_offset": record_metadata.offset,
+                    "last_offset": record_metadata.offset,
+                    "count": 0,
+                },
+            )
+            offsets["first_offset"] = min(
+                offsets["first_offset"], record_metadata.offset
+            )
+            offsets["last_offset"] = max(offsets["last_offset"], record_metadata.offset)
+            offsets["count"] += 1
+
+        sent = len(records) - len(failures)
+        if failures:
+            logger.error(
+                f"Failed to send {len(failures)} of {len(records)} messages to topic '{topic}'"
+            )
+        failures.sort(key=lambda x: x["index"])
+
+        summary = {
+            "topic": topic,
+            "count": len(records),
+            "sent": sent,
+            "failed": len(failures),
+            "partitions": {
+                str(partition): offsets
+                for partition, offsets in sorted(partitions.items())
+            },
+            "failures": failures[:max_errors],
+        }
+        if flush_error is not None:
+            summary["flush_error"] = flush_error
+        return {
+            "status": "success" if not failures else ("partial" if sent else "error"),
+            "message": f"Sent {sent} of {len(records)} messages to topic '{topic}'",
+            "summary": summary,
+        }
+
+    def load_test(
+        self,
+        topic: str,
+        duration_s: float = 10.0,
+        rate: Optional[float] = None,
+        message_size: int = 1024,
+        key_cardinality: Optional[int] = None,
+        partitions: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """Produce synthetic records for a duration and measure throughput and ack latency
+
+        Records are sent through the server's own producer, so the result
+        reflects its configuration. ``rate`` is a target in messages per
+        second (unlimited when None). Values are random bytes of
+        ``message_size``; with ``key_cardinality`` keys cycle through that
+        many distinct values, and ``partitions`` sends records round-robin
+        to the listed partitions instead of using the partitioner.
+        """
+        if not 0 < duration_s <= MAX_LOAD_TEST_S:
+            return {
+                "status": "error",
+                "message": f"duration_s must be between 0 and {MAX_LOAD_TEST_S}.",
+            }
+        if rate is not None and rate <= 0:
+            return {"status": "error", "message": "rate must be positive."}
+        if message_size < 0:
+            return {"status": "error", "message": "message_size must not be negative."}
+        if key_cardinality is not None and key_cardinality < 1:
+            return {"status": "error", "message": "key_cardinality must be at least 1."}
+
+        try:
+            producer = self._get_producer()
+            if partitions:
+                available = producer.partitions_for(topic)
+                unknown = sorted(set(partitions) - set(available))
+                if unknown:
+                    return {
+                        "status": "error",
+                        "message": f"Topic '{topic}' has no partition(s) {unknown}",
+                    }
+        except Exception as e:
+            logger.error(f"Failed to prepare load test on topic '{topic}': {e}")
+            return {"status": "error", "message": f"Failed to run load test: {str(e)}"}
+
+        payloads = [os.urandom(message_size) for _ in range(LOAD_TEST_PAYLOADS)]
+        keys = (
+            [f"key-{i}".encode("utf-8") for i in range(key_cardinality)]
+            if key_cardinality
+            else None
+        )
+        # A tracker of its own, so a run doesn't evict the tickets of
+        # kafka_send_message callers from the shared one
+        deliveries = DeliveryTracker(max_tickets=1)
+        delivery = deliveries.open(topic, samples=LatencyReservoir(LOAD_TEST_SAMPLES))
+
+        sent = 0
+        started = time.perf_counter()
+        stop_at = started + duration_s
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            if rate is not None:
+                # Pace sends against the schedule rather than per message, so
+                # slow sends are caught up on instead of lowering the rate
+                due = started + sent / rate
+                if due > now:
+                    time.sleep(min(due, stop_at) - now)
+                    continue
+            try:
+                future = producer.send(
+                    topic,
+                    value=payloads[sent % LOAD_TEST_PAYLOADS],
+                    key=keys[sent % key_cardinality] if keys else None,
+                    partition=(
+                        partitions[sent % len(partitions)] if partitions else None
+                    ),
+                )
+                deliveries.track(delivery, future, now)
+            except Exception as e:
+                deliveries.record_failure(delivery, e)
+            sent += 1
+        send_elapsed = time.perf_counter() - started
+        flush_error = None
+        try:
+            producer.flush(timeout=FLUSH_TIMEOUT_S)
+        except Exception as e:
+            logger.error(f"Failed to flush load test records to topic '{topic}': {e}")
+            flush_error = str(e)
+        elapsed = time.perf_counter() - started
+
+        report = delivery.report()
+        if not report["acked"]:
+            status = "error"
+        else:
+            status = (
+                "partial" if report["failed"] or flush_error is not None else "success"
+            )
+        message = (
+            f"Sent {sent} messages to topic '{topic}' in {round(send_elapsed, 3)} s, "
+            f"{report['acked']} acknowledged"
+        )
+        if flush_error is not None:
+            message += f", {report['pending']} still pending after the flush failed: {flush_error}"
+        return {
+            "status": status,
+            "message": message,
+            "summary": {
+                "topic": topic,
+                "duration_s": duration_s,
+                "target_rate": rate,
+                "message_size": message_size,
+                "key_cardinality": key_cardinality,
+                "partitions": partitions,
+                "sent": sent,
+                "acked": report["acked"],
+                "failed": report["failed"],
+                "pending": report["pending"],
+                "flush_error": flush_error,
+                "send_rate": round(sent / send_elapsed, 1),
+                # Acknowledged throughput, including the final flush
+                "elapsed_s": round(elapsed, 3),
+                "ack_rate": round(report["acked"] / elapsed, 1),
+                "ack_mb_per_s": round(
+                    report["acked"] * message_size / elapsed / 1048576, 3
+                ),
+                "latency_ms": report["latency_ms"],
+                "last_errors": report["last_errors"],
+            },
+        }
+
+    def e2e_latency_probe(
+        self,
+        topic: str,
+        count: int = 10,
+        partitions: Optional[List[int]] = None,
+        interval_ms: int = 100,
+        timeout_ms: int = 30000,
+    ) -> Dict[str, Any]:
+        """Produce canary records to each partition and time them until consumed
+
+        Runs ``count`` rounds; each round sends one canary to every selected
+        partition and waits for all of them to be read back before the next
+        round starts ``interval_ms`` later. For each canary it measures the
+        produce acknowledgement latency, the end-to-end latency from send to
+        consume, and the fetch latency from acknowledgement to consume.
+        """
+        if count < 1:
+            return {"status": "error", "message": "count must be at least 1."}
+
+        try:
+            producer = self._get_producer()
+            with self._get_consumer() as consumer:
+                available = consumer.partitions_for_topic(topic)
+                if not available:
+                    return {"status": "error", "message": f"Topic '{topic}' not found"}
+                selected = sorted(available if partitions is None else set(partitions))
+                unknown = [p for p in selected if p not in available]
+                if unknown:
+                    return {
+                        "status": "error",
+                        "message": f"Topic '{topic}' has no partition(s) {unknown}",
+                    }
+
+                # Only canaries produced from here on are read back
+                tps = [TopicPartition(topic, p) for p in selected]
+                consumer.assign(tps)
+                for tp, end in consumer.end_offsets(tps).items():
+                    consumer.seek(tp, end)
+
+                probe_id = uuid.uuid4().hex[:12]
+                sent_at: Dict[Tuple[int, int], float] = {}
+                acked_at: Dict[Tuple[int, int], float] = {}
+                received_at: Dict[Tuple[int, int], float] = {}
+                errors: List[Dict[str, Any]] = []
+                waiting = set()
+                lock = threading.Lock()
+
+                def on_ack(canary: Tuple[int, int], record_metadata) -> None:
+                    with lock:
+                        acked_at[canary] = time.perf_counter()
+
+                def on_error(canary: Tuple[int, int], exc: BaseException) -> None:
+                    with lock:
+                        waiting.discard(canary)
+                        errors.append(
+                            {
+                                "partition": canary[0],
+                                "sequence": canary[1],
+                                "error": f"{type(exc).__name__}: {exc}",
+                            }
+                        )
+
+                deadline = time.monotonic() + timeout_ms / 1000
+                rounds = 0
+                while rounds < count and time.monotonic() < deadline:
+                    for partition in selected:
+                        canary = (partition, rounds)
+                        with lock:
+                            waiting.add(canary)
+                        sent_at[canary] = time.perf_counter()
+                        producer.send(
+                            topic,
+                            value=json.dumps(
+                                {
+                                    "probe": probe_id,
+                                    "sequence": rounds,
+                                    "sent_at": int(time.time() * 1000),
+                                }
+                            ).encode("utf-8"),
+                            partition=partition,
+                            headers=[
+                                (PROBE_HEADER, f"{probe_id}:{rounds}".encode("utf-8"))
+                            ],
+                        ).add_callback(on_ack, canary).add_errback(on_error, canary)
+                    rounds += 1
+
+                    while waiting and time.monotonic() < deadline:
+                        batch = consumer.poll(timeout_ms=100)
+                        now = time.perf_counter()
+                        for record in (
+                            r for records in batch.values() for r in records
+                        ):
+                            marker = dict(record.headers or []).get(PROBE_HEADER, b"")
+                            probe, _, sequence = marker.decode(
+                                errors="replace"
+                            ).partition(":")
+                            if probe != probe_id or not sequence.isdigit():
+                                continue
+                            canary = (record.partition, int(sequence))
+                            received_at.setdefault(canary, now)
+                            with lock:
+                                waiting.discard(canary)
+                    if rounds < count:
+                        time.sleep(interval_ms / 1000)
+                producer.flush()
+        except Exception as e:
+            logger.error(f"Failed to probe latency on topic '{topic}': {e}")
+            return {"status": "error", "message": f"Failed to probe latency: {str(e)}"}
+
+        def measure(canaries) -> Dict[str, Any]:
+            ack, fetch, e2e = [], [], []
+            for canary in canaries:
+                if canary in acked_at:
+                    ack.append((acked_at[canary] - sent_at[canary]) * 1000)
+                if canary in received_at:
+                    e2e.append((received_at[canary] - sent_at[canary]) * 1000)
+                    if canary in acked_at:
+                        # A canary can be fetched before its ack callback runs
+                        fetch.append(
+                            max(0.0, (received_at[canary] - acked_at[canary]) * 1000)
+                        )
+            return {
+                "sent": len(canaries),
+                "received": sum(canary in received_at for canary in canaries),
+                "produce_ack_ms": latency_summary(ack),
+                "fetch_ms": latency_summary(fetch),
+                "end_to_end_ms": latency_summary(e2e),
+            }
+
+        overall = measure(list(sent_at))
+        lost = overall["sent"] - overall["received"]
+        return {
+            "status": "success" if not lost else "partial",
+            "message": (
+                f"Received {overall['received']} of {overall['sent']} canaries "
+                f"from topic '{topic}'"
+            ),
+            "topic": topic,
+            "probe": probe_id,
+            "rounds": rounds,
+            **overall,
+            "partitions": [
+                {
+                    "partition": partition,
+                    **measure([c for c in sent_at if c[0] == partition]),
+                }
+                for partition in selected
+            ],
+            "errors": errors[:10],
+        }
+
+    def produce_from_file(
+        self,
+        topic: str,
+        path: str,
+        file_format: Optional[str] = None,
+        key_field: Optional[str] = None,
+        value_field: Optional[str] = None,
+        key_separator: Optional[str] = None,
+        serializer: Optional[str] = None,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        max_records: Optional[int] = None,
+        encoding: str = "utf-8",
+    ) -> Dict[str, Any]:
+        """Stream a local JSONL, JSON array, CSV or raw-lines file into a topic
+
+        The file is memory-mapped and fed through a generator pipeline, so
+        only the producer's buffer is ever held in memory. Keys come from
+        ``key_field`` (a dotted path for JSON, a column for CSV) or, for raw
+        lines, from the text before ``key_separator``. Raw lines are sent
+        as-is, so they can't be combined with ``serializer``. The producer is
+        flushed every ``flush_every`` records; acknowledgements are counted
+        through a delivery ticket, whose report is returned once the file is
+        done.
+        """
+        try:
+            file_path = Path(path).expanduser()
+            file_format = detect_format(file_path, file_format)
+            if flush_every < 1:
+                raise ValueError("flush_every must be at least 1")
+            if file_format == "lines" and serializer:
+                raise ValueError(
+                    "Raw lines are sent as-is; serializer needs a jsonl, json "
+                    "or csv file"
+                )
+            codecs.lookup(encoding)
+            producer = self._get_producer()
+            spec = self._serializer_for(topic, serializer)
+            get_serializer(spec)
+        except Exception as e:
+            logger.error(f"Failed to prepare producing from '{path}': {e}")
+            return {
+                "status": "error",
+                "message": f"Failed to produce from file: {str(e)}",
+            }
+
+        delivery = self.deliveries.open(topic)
+        records = 0
+        bytes_read = 0
+        error = None
+        started = time.perf_counter()
+        try:
+            with open_lines(file_path) as lines:
+                for line, key, value in read_records(
+                    lines.blocks() if file_format == "json" else lines,
+                    file_format,
+                    key_field=key_field,
+                    value_field=value_field,
+                    key_separator=key_separator,
+                    # JSON records are sent as they are rather than re-encoded
+                    raw_values=spec in JSON_SERIALIZERS,
+                    encoding=encoding,
+                ):
+                    if max_records is not None and records >= max_records:
+                        break
+                    records += 1
+                    if isinstance(value, RecordError):
+                        self.deliveries.record_failure(delivery, value)
+                        continue
+                    try:
+                        sent_at = time.perf_counter()
+                        future = producer.send(
+                            topic,
+                            value=serialize(value, spec),
+                            key=key.encode(encoding) if key is not None else None,
+                        )
+                        self.deliveries.track(delivery, future, sent_at)
+                    except Exception as e:
+                        self.deliveries.record_failure(
+                            delivery, RecordError(line, str(e))
+                        )
+                    if records % flush_every == 0:
+                        producer.flush(timeout=FLUSH_TIMEOUT_S)
+                bytes_read = lines.bytes_read
+        except Exception as e:
+            logger.error(f"Failed to read '{file_path}': {e}")
+            error = str(e)
+
+        flush_error = None
+        try:
+            producer.flush(timeout=FLUSH_TIMEOUT_S)
+        except Exception as e:
+            # Unacknowledged records stay pending in the delivery report
+            logger.error(f"Failed to flush records from '{file_path}': {e}")
+            flush_error = str(e)
+        elapsed = time.perf_counter() - started
+
+        report = delivery.report()
+        if error is not None:
+            status = "error"
+        elif report["failed"] or flush_error is not None:
+            status = "partial" if report["acked"] else "error"
+        else:
+            status = "success"
+        if error is not None:
+            message = f"Failed to read '{file_path}' after {records} records: {error}"
+        else:
+            message = f"Produced {report['acked']} of {records} records from '{file_path}' to topic '{topic}'"
+            if flush_error is not None:
+                message += f"; {report['pending']} still pending after the flush failed: {flush_error}"
+        summary = {
+            "file": str(file_path),
+            "format": file_format,
+            "records": records,
+            "bytes_read": bytes_read,
+            "elapsed_s": round(elapsed, 3),
+            "records_per_s": round(records / elapsed, 1) if elapsed else None,
+            "mb_per_s": round(bytes_read / elapsed / 1048576, 3) if elapsed else None,
+            "delivery": report,
+        }
+        if flush_error is not None:
+            summary["flush_error"] = flush_error
+        return {"status": status, "message": message, "summary": summary}
+
+    def consume_messages(
+        self,
+        topic: str,
+        partition: int = 0,
+        offset: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        last_n: Optional[int] = None,
+        max_messages: int = 10,
+        max_bytes: int = 1048576,
+        max_wait_ms: int = 5000,
+    ) -> Dict[str, Any]:
+        """Fetch up to max_messages records from a single topic partition
+
+        Reading starts at ``offset``, at the first record at or after
+        ``timestamp_ms``, or ``last_n`` records before the end of the
+        partition; with none of them it starts at the earliest offset. The
+        fetch stops at the end offset seen when the call started, after
+        max_bytes of keys and values, or after max_wait_ms.
+        """
+        if sum(x is not None for x in (offset, timestamp_ms, last_n)) > 1:
+            return {
+                "status": "error",
+                "message": "Specify at most one of offset, timestamp_ms or last_n.",
+            }
+        if max_messages < 1:
+            return {"status": "error", "message": "max_messages must be at least 1."}
+
+        try:
+            with self._get_consumer() as consumer:
+                available = consumer.partitions_for_topic(topic)
+                if not available:
+                    return {"status": "error", "message": f"Topic '{topic}' not found"}
+                if partition not in available:
+                    return {
+                        "status": "error",
+                        "message": f"Topic '{topic}' has no partition {partition}",
+                    }
+
+                tp = TopicPartition(topic, partition)
+                beginning = consumer.beginning_offsets([tp])[tp]
+                end = consumer.end_offsets([tp])[tp]
+
+                if offset is not None:
+                    start = min(max(offset, beginning), end)
+                elif timestamp_ms is not None:
+                    found = consumer.offsets_for_times({tp: timestamp_ms})[tp]
+                    start = found.offset if found else end
+                elif last_n is not None:
+                    start = max(beginning, end - last_n)
+                else:
+                    start = beginning
+
+                records = []
+                total_bytes = 0
+                next_offset = start
+                deadline = time.monotonic() + max_wait_ms / 1000
+                for record in self._read_partition(
+                    consumer, tp, start, end, deadline, max_records=max_messages
+                ):
+                    records.append(self._format_record(record))
+                    total_bytes += self._record_size(record)
+                    next_offset = record.offset + 1
+                    if len(records) >= max_messages or total_bytes >= max_bytes:
+                        break
+
+            return {
+                "status": "success",
+                "topic": topic,
+                "partition": partition,
+                "start_offset": start,
+                "next_offset": next_offset,
+                "end_offset": end,
+                "count": len(records),
+                "bytes": total_bytes,
+                "records": records,
+            }
+        except Exception as e:
+            logger.error(f"Failed to consume messages from topic '{topic}': {e}")
+            return {
+                "status": "error",
+                "message": f"Failed to consume messages: {str(e)}",
+            }
+
+    def search_topic(
+        self,
+        topic: str,
+        key_pattern: Optional[str] = None,
+        value_contains: Optional[str] = None,
+        value_pattern: Optional[str] = None,
+        json_path: Optional[str] = None,
+        json_value: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        partitions: Optional[List[int]] = None,
+        max_hits: int = 10,
+        max_scan_per_partition: int = 10000,
+        max_wait_ms: int = 30000,
+    ) -> Dict[str, Any]:
+        """Scan the most recent records of a topic for matches, one worker per partition
+
+        Every given criterion must match. ``json_path`` is a dotted path into
+        a JSON value (list indexes allowed, e.g. ``items.0.sku``); with
+        ``json_value`` the element must also equal it. ``headers`` maps
+        header names to substrings their values must contain. Each partition
+        scans at most its last max_scan_per_partition records and all
+        workers stop once max_hits matches are found or max_wait_ms passes.
+        """
+        try:
+            key_regex = re.compile(key_pattern) if key_pattern else None
+            value_regex = re.compile(value_pattern) if value_pattern else None
+        except re.error as e:
+            return {"status": "error", "message": f"Invalid pattern: {str(e)}"}
+        if max_hits < 1:
+            return {"status": "error", "message": "max_hits must be at least 1."}
+
+        def matches(record) -> bool:
+            if key_regex and not key_regex.search(self._record_text(record.key)):
+                return False
+            if value_contains or value_regex:
+                text = self._record_text(record.value)
+                if value_contains and value_contains not in text:
+                    return False
+                if value_regex and not value_regex.search(text):
+                    return False
+            if json_path:
+                found, element = self._lookup_json_path(record.value, json_path)
+                if not found or (json_value is not None and element != json_value):
+                    return False
+            if headers:
+                record_headers = {
+                    k: self._record_text(v) for k, v in record.headers or []
+                }
+                for name, expected in headers.items():
+                    if (
+                        name not in record_headers
+                        or expected not in record_headers[name]
+                    ):
+                        return False
+            return True
+
+        hits = []
+        hits_lock = threading.Lock()
+        done = threading.Event()
+        deadline = time.monotonic() + max_wait_ms / 1000
+
+        def scan(partition: int) -> Dict[str, Any]:
+            tp = TopicPartition(topic, partition)
+            with self._get_consumer() as consumer:
+                end = consumer.end_offsets([tp])[tp]
+                start = max(
+                    consumer.beginning_offsets([tp])[tp], end - max_scan_per_partition
+                )
+                scanned = 0
+                for record in self._read_partition(consumer, tp, start, end, deadline):
+                    if done.is_set():
+                        break
+                    scanned += 1
+                    if matches(record):
+                        with hits_lock:
+                            hits.append(self._format_record(record))
+                            if len(hits) >= max_hits:
+                                done.set()
+            return {"partition": partition, "start_offset": start, "scanned": scanned}
+
+        try:
+            with self._get_consumer() as consumer:
+                available = consumer.partitions_for_topic(topic)
+            if not available:
+                return {"status": "error", "message": f"Topic '{topic}' not found"}
+            selected = sorted(available if partitions is None else set(partitions))
+            unknown = [p for p in selected if p not in available]
+            if unknown:
+                return {
+                    "status": "error",
+                    "message": f"Topic '{topic}' has no partition(s) {unknown}",
+                }
+
+            with ThreadPoolExecutor(
+                max_workers=self._reader_count(len(selected))
+            ) as executor:
+                scanned = list(executor.map(scan, selected))
+
+            hits.sort(key=lambda x: (x["timestamp"], x["partition"], x["offset"]))
+            return {
+                "status": "success",
+                "topic": topic,
+                "hits": hits[:max_hits],
+                "hit_count": min(len(hits), max_hits),
+                "max_hits_reached": done.is_set(),
+                "timed_out": not done.is_set() and time.monotonic() >= deadline,
+                "scanned": sum(p["scanned"] for p in scanned),
+                "partitions": scanned,
+            }
+        except Exception as e:
+            logger.error(f"Failed to search topic '{topic}': {e}")
+            return {"status": "error", "message": f"Failed to search topic: {str(e)}"}
+
+    def export_topic(
+        self,
+        topic: str,
+        output_dir: str,
+        file_format: str = "jsonl",
+        partitions: Optional[List[int]] = None,
+        start_offset: Optional[int] = None,
+        end_offset: Optional[int] = None,
+        start_timestamp_ms: Optional[int] = None,
+        end_timestamp_ms: Optional[int] = None,
+        resume: bool = True,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        max_wait_ms: int = 600000,
+    ) -> Dict[str, Any]:
+        """Export a range of a topic to per-partition files, one reader per partition
+
+        The range starts at ``start_offset`` or ``start_timestamp_ms`` (default
+        the earliest offset) and ends before ``end_offset`` or the first record
+        at ``end_timestamp_ms`` (default the end offset when the export
+        starts). Progress is checkpointed every ``checkpoint_every`` records
+        per partition; when ``output_dir`` already holds a checkpoint and
+        ``resume`` is set, the export continues from it and the range
+        arguments are ignored.
+        """
+        if start_offset is not None and start_timestamp_ms is not None:
+            return {
+                "status": "error",
+                "message": "Specify at most one of start_offset or start_timestamp_ms.",
+            }
+        if end_offset is not None and end_timestamp_ms is not None:
+            return {
+                "status": "error",
+                "message": "Specify at most one of end_offset or end_timestamp_ms.",
+            }
+        if checkpoint_every < 1:
+            return {
+                "status": "error",
+                "message": "checkpoint_every must be at least 1.",
+            }
+
+        try:
+            check_format(file_format)
+            directory = Path(output_dir).expanduser()
+            directory.mkdir(parents=True, exist_ok=True)
+            checkpoint = Checkpoint.load(directory) if resume else None
+            resumed = checkpoint is not None
+            if checkpoint is not None:
+                exported = (checkpoint.state["topic"], checkpoint.state["format"])
+                if exported != (topic, file_format):
+                    return {
+                        "status": "error",
+                        "message": (
+                            f"'{directory}' holds a {exported[1]} export of topic "
+                            f"'{exported[0]}'; use another output_dir or resume=false"
+                        ),
+                    }
+            else:
+                ranges = self._export_ranges(
+                    topic,
+                    partitions,
+                    start_offset,
+                    end_offset,
+                    start_timestamp_ms,
+                    end_timestamp_ms,
+                )
+                if "status" in ranges:
+                    return ranges
+                checkpoint = Checkpoint(
+                    directory,
+                    {
+                        "topic": topic,
+                        "format": file_format,
+                        "created_at": int(time.time() * 1000),
+                        "partitions": {
+                            str(partition): {
+                                "start_offset": start,
+                                "end_offset": end,
+                                "next_offset": start,
+                                "records": 0,
+                                "bytes": 0,
+                            }
+                            for partition, (start, end) in ranges.items()
+                        },
+                    },
+                )
+                checkpoint.save()
+        except Exception as e:
+            logger.error(f"Failed to prepare export of topic '{topic}': {e}")
+            return {"status": "error", "message": f"Failed to export topic: {str(e)}"}
+
+        deadline = time.monotonic() + max_wait_ms / 1000
+
+        def export_partition(partition: int) -> Dict[str, Any]:
+            progress = checkpoint.partition(partition)
+            end = progress["end_offset"]
+            next_offset = progress["next_offset"]
+            records = total_bytes = 0
+
+            def commit() -> None:
+                checkpoint.update(
+                    partition,
+                    {
+                        **writer.checkpoint(),
+                        "next_offset": next_offset,
+                        "records": progress["records"] + records,
+                        "bytes": progress["bytes"] + total_bytes,
+                    },
+                )
+
+            writer = open_writer(
+                file_format,
+                directory,
+                topic,
+                partition,
+                progress,
+                format_record=self._format_record,
+            )
+            try:
+                if next_offset < end:
+                    tp = TopicPartition(topic, partition)
+                    with self._get_consumer() as consumer:
+                        for record in self._read_partition(
+                            consumer, tp, next_offset, end, deadline
+                        ):
+                            writer.write(record)
+                            records += 1
+                            total_bytes += self._record_size(record)
+                            next_offset = record.offset + 1
+                            if records % checkpoint_every == 0:
+                                commit()
+                        # Also step over trailing offsets that hold no records
+                        next_offset = max(next_offset, min(consumer.position(tp), end))
+                commit()
+            finally:
+                writer.close()
+
+            return {
+                "partition": partition,
+                "start_offset": progress["start_offset"],
+                "end_offset": end,
+                "next_offset": next_offset,
+                "complete": next_offset >= end,
+                "records": progress["records"] + records,
+                "exported_records": records,
+                "exported_bytes": total_bytes,
+            }
+
+        started = time.perf_counter()
+        try:
+            selected = sorted(int(p) for p in checkpoint.state["partitions"])
+            with ThreadPoolExecutor(
+                max_workers=self._reader_count(len(selected))
+            ) as executor:
+                results = list(executor.map(export_partition, selected))
+        except Exception as e:
+            logger.error(f"Failed to export topic '{topic}': {e}")
+            return {
+                "status": "error",
+                "message": (
+                    f"Failed to export topic: {str(e)}. Progress up to the last "
+                    "checkpoint is kept; call again with the same output_dir to resume."
+                ),
+            }
+        elapsed = time.perf_counter() - started
+
+        complete = all(p["complete"] for p in results)
+        records = sum(p["exported_records"] for p in results)
+        total_bytes = sum(p["exported_bytes"] for p in results)
+        return {
+            "status": "success" if complete else "partial",
+            "message": (
+                f"Exported topic '{topic}' to '{directory}'"
+                if complete
+                else f"Export of topic '{topic}' stopped after {max_wait_ms} ms; "
+                "call again with the same output_dir to resume"
+            ),
+            "summary": {
+                "output_dir": str(directory),
+                "format": file_format,
+                "resumed": resumed,
+                "complete": complete,
+                "records": records,
+                "bytes": total_bytes,
+                "elapsed_s": round(elapsed, 3),
+                "records_per_s": round(records / elapsed, 1) if elapsed else None,
+                "mb_per_s": (
+                    round(total_bytes / elapsed / 1048576, 3) if elapsed else None
+                ),
+                "partitions": results,
+            },
+        }
+
+    def _export_ranges(
+        self,
+        topic: str,
+        partitions: Optional[List[int]],
+        start_offset: Optional[int],
+        end_offset: Optional[int],
+        start_timestamp_ms: Optional[int],
+        end_timestamp_ms: Optional[int],
+    ) -> Dict[Any, Any]:
+        """Resolve the [start, end) offsets to export for each selected partition
+
+        Returns partition -> (start, end), or an error dict.
+        """
+        with self._get_consumer() as consumer:
+            available = consumer.partitions_for_topic(topic)
+            if not available:
+                return {"status": "error", "message": f"Topic '{topic}' not found"}
+            selected = sorted(available if partitions is None else set(partitions))
+            unknown = [p for p in selected if p not in available]
+            if unknown:
+                return {
+                    "status": "error",
+                    "message": f"Topic '{topic}' has no partition(s) {unknown}",
+                }
+
+            tps = [TopicPartition(topic, p) for p in selected]
+            beginning = consumer.beginning_offsets(tps)
+            end = consumer.end_offsets(tps)
+
+            def by_time(timestamp_ms: int) -> Dict[TopicPartition, int]:
+                found = consumer.offsets_for_times({tp: timestamp_ms for tp in tps})
+                return {tp: found[tp].offset if found[tp] else end[tp] for tp in tps}
+
+            starts = (
+                by_time(start_timestamp_ms) if start_timestamp_ms is not None else {}
+            )
+            ends = by_time(end_timestamp_ms) if end_timestamp_ms is not None else {}
+
+        ranges = {}
+        for tp in tps:
+            low, high = beginning[tp], end[tp]
+            stop = min(
+                max(end_offset if end_offset is not None else ends.get(tp, high), low),
+                high,
+            )
+            start = min(
+                max(
+                    start_offset if start_offset is not None else starts.get(tp, low),
+                    low,
+                ),
+                stop,
+            )
+            ranges[tp.partition] = (start, stop)
+        return ranges
+
+    def cluster_health(
+        self,
+        chunk_size: int = DEFAULT_HEALTH_CHUNK_SIZE,
+        parallelism: int = DEFAULT_HEALTH_PARALLELISM,
+        include_internal: bool = True,
+        max_partitions: int = 100,
+        refresh: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Scan every partition in the cluster for replication and leader problems
+
+        Every topic's metadata comes from one describe of all topics, served
+        from the cache kafka_list_topics fills unless refresh is set. Their
+        min.insync.replicas are described chunk_size topics at a time with up
+        to parallelism requests in flight, and progress(topics_scanned,
+        total_topics) is called after every chunk. Partitions are reported
+        as:
+
+        * offline - no leader and no in-sync replica on a live broker (the
+          last in-sync replica stays listed in the ISR after its broker dies)
+        * leaderless - no leader yet, but an in-sync replica is alive
+        * under_min_isr - fewer in-sync replicas than min.insync.replicas,
+          so acks=all produce requests fail; this includes fully replicated
+          topics whose replication factor is below min.insync.replicas
+        * under_replicated - fewer in-sync replicas than replicas
+
+        Leader skew counts the partitions each broker leads and the
+        partitions not led by their preferred (first) replica. Each list
+        holds at most max_partitions entries; the summary has full counts.
+        """
+        if chunk_size < 1 or parallelism < 1 or max_partitions < 0:
+            return {
+                "status": "error",
+                "message": "chunk_size and parallelism must be at least 1 and max_partitions at least 0.",
+            }
+
+        started = time.perf_counter()
+        try:
+            brokers = [
+                broker["node_id"]
+                for broker in self._get_admin_client().describe_cluster()["brokers"]
+            ]
+            topics = sorted(
+                (
+                    topic_metadata
+                    for topic_metadata in self._describe_topics(refresh=refresh)
+                    if include_internal or not topic_metadata.get("is_internal")
+                ),
+                key=lambda topic_metadata: topic_metadata["topic"],
+            )
+        except Exception as e:
+            logger.error(f"Failed to scan cluster health: {e}")
+            return {"status": "error", "message": f"Failed to scan cluster: {str(e)}"}
+
+        counts = dict.fromkeys(HEALTH_CATEGORIES, 0)
+        found: Dict[str, List[Dict[str, Any]]] = {key: [] for key in HEALTH_CATEGORIES}
+        leaders = Counter(dict.fromkeys(brokers, 0))
+        not_preferred = 0
+        partitions = 0
+        errors: List[Dict[str, Any]] = []
+        live = set(brokers)
+
+        def report(category: str, entry: Dict[str, Any]) -> None:
+            counts[category] += 1
+            if len(found[category]) < max_partitions:
+                found[category].append(entry)
+
+        def describe(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+            """min.insync.replicas of a chunk of described topics"""
+            described = [
+                topic_metadata["topic"]
+                for topic_metadata in chunk
+                if not topic_metadata.get("error_code")
+            ]
+            try:
+                return self._describe_topic_configs(
+                    described, chunk_size, keys=["min.insync.replicas"]
+                )
+            except Exception as e:
+                logger.error(f"Failed to describe min.insync.replicas: {e}")
+                return dict.fromkeys(described, str(e))
+
+        chunks = [topics[i : i + chunk_size] for i in range(0, len(topics), chunk_size)]
+        scanned = 0
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(parallelism, len(chunks)))
+        ) as executor:
+            futures = {executor.submit(describe, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                scanned += len(chunk)
+                configs = future.result()
+
+                for topic_metadata in chunk:
+                    name = topic_metadata.get("topic")
+                    if topic_metadata.get("error_code"):
+                        errors.append(
+                            {
+                                "topic": name,
+                                "error": self._error_text(topic_metadata["error_code"]),
+                            }
+                        )
+                        continue
+                    topic_configs = configs.get(name)
+                    if isinstance(topic_configs, tuple):
+                        min_isr = int(topic_configs[0].get("min.insync.replicas") or 1)
+                    else:
+                        min_isr = None
+                        errors.append(
+                            {
+                                "topic": name,
+                                "error": "min.insync.replicas unavailable: "
+                                f"{topic_configs}",
+                            }
+                        )
+                    for partition in topic_metadata.get("partitions") or []:
+                        partitions += 1
+                        leader = partition.get("leader")
+                        replicas = partition.get("replicas") or []
+                        isr = partition.get("isr") or []
+                        entry = {
+                            "topic": name,
+                            "partition": partition.get("partition"),
+                            "leader": leader,
+                            "replicas": replicas,
+                            "isr": isr,
+                        }
+                        offline_replicas = partition.get("offline_replicas") or []
+                        if offline_replicas:
+                            entry["offline_replicas"] = offline_replicas
+
+                        if leader is None or leader < 0:
+                            # A dead broker can remain the ISR's last member
+                            alive = [
+                                replica
+                                for replica in isr
+                                if replica in live and replica not in offline_replicas
+                            ]
+                            report("leaderless" if alive else "offline", entry)
+                        else:
+                            leaders[leader] += 1
+                            not_preferred += bool(replicas) and leader != replicas[0]
+                        if min_isr is not None and len(isr) < min_isr:
+                            report(
+                                "under_min_isr",
+                                {**entry, "min_insync_replicas": min_isr},
+                            )
+                        if len(isr) < len(replicas):
+                            report("under_replicated", entry)
+
+                if progress:
+                    progress(scanned, len(topics))
+
+        led = sum(leaders.values())
+        mean = led / len(leaders) if leaders else 0
+        problems = [
+            f"{counts[key]} {key.replace('_', ' ')}"
+            for key in HEALTH_CATEGORIES
+            if counts[key]
+        ]
+        return {
+            "status": "partial" if errors else "success",
+            "message": (
+                f"Scanned {partitions} partitions in {len(topics)} topics: "
+                + (", ".join(problems) if problems else "all partitions healthy")
+            ),
+            "healthy": not problems,
+            "summary": {
+                "brokers": len(brokers),
+                "topics": len(topics),
+                "partitions": partitions,
+                **counts,
+                "chunks": len(chunks),
+                "elapsed_s": round(time.perf_counter() - started, 3),
+            },
+            "leader_skew": {
+                "leaders_by_broker": {
+                    str(broker): count for broker, count in sorted(leaders.items())
+                },
+                "max": max(leaders.values(), default=0),
+                "min": min(leaders.values(), default=0),
+                "mean": round(mean, 1),
+                "max_to_mean": round(max(leaders.values()) / mean, 2) if mean else None,
+                "not_preferred_leader": not_preferred,
+            },
+            "partitions": found,
+            "errors": errors[:max_partitions],
+        }
+
+    def consumer_group_lag(
+        self,
+        group_ids: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        include_partitions: bool = True,
+    ) -> Dict[str, Any]:
+        """Compute per-partition and total lag for one or many consumer groups
+
+        With no group_ids every consumer group in the cluster is reported.
+        Committed offsets for all groups are fetched with pipelined requests
+        and end offsets for every partition involved are looked up in a
+        single call, which sends one ListOffsets request per leader broker.
+        """
+        try:
+            admin = self._get_admin_client()
+            if group_ids is None:
+                group_ids = sorted(
+                    group_id for group_id, _ in admin.list_consumer_groups()
+                )
+            if not group_ids:
+                return {"status": "success", "groups": [], "total_lag": 0}
+
+            committed = self._fetch_group_offsets(admin, group_ids)
+            partitions = {
+                tp
+                for offsets in committed.values()
+                for tp in offsets
+                if topics is None or tp.topic in topics
+            }
+            end_offsets = {}
+            if partitions:
+                with self._get_consumer() as consumer:
+                    end_offsets = consumer.end_offsets(list(partitions))
+
+            groups = []
+            for group_id in group_ids:
+                group_partitions = []
+                topic_lag: Dict[str, int] = {}
+                for tp, offset_metadata in sorted(committed[group_id].items()):
+                    if tp not in partitions:
+                        continue
+                    end = end_offsets.get(tp)
+                    # -1 means the group has no committed offset for the partition
+                    has_offset = offset_metadata.offset >= 0 and end is not None
+                    lag = max(end - offset_metadata.offset, 0) if has_offset else None
+                    if lag is not None:
+                        topic_lag[tp.topic] = topic_lag.get(tp.topic, 0) + lag
+                    group_partitions.append(
+                        {
+                            "topic": tp.topic,
+                            "partition": tp.partition,
+                            "committed_offset": offset_metadata.offset,
+                            "end_offset": end,
+                            "lag": lag,
+                        }
+                    )
+                group = {
+                    "group_id": group_id,
+                    "total_lag": sum(topic_lag.values()),
+                    "topics": topic_lag,
+                }
+                if include_partitions:
+                    group["partitions"] = group_partitions
+                groups.append(group)
+
+            return {
+                "status": "success",
+                "groups": groups,
+                "total_lag": sum(group["total_lag"] for group in groups),
+            }
+        except Exception as e:
+            logger.error(f"Failed to compute consumer group lag: {e}")
+            return {
+                "status": "error",
+                "message": f"Failed to compute consumer group lag: {str(e)}",
+            }
+
+    @staticmethod
+    def _fetch_group_offsets(
+        admin: KafkaAdminClient, group_ids: List[str]
+    ) -> Dict[str, Dict[TopicPartition, Any]]:
+        """Fetch committed offsets for many groups with pipelined requests
+
+        KafkaAdminClient.list_consumer_group_offsets costs a FindCoordinator
+        and an OffsetFetch round trip per group. Its request/response halves
+        let all of those be in flight at once; clients without them (e.g.
+        other backends) fall back to one call per group.
+        """
+        if not hasattr(admin, "_list_consumer_group_offsets_send_request"):
+            return {
+                group_id: admin.list_consumer_group_offsets(group_id)
+                for group_id in group_ids
+            }
+
+        coordinators = admin._find_coordinator_ids(group_ids)
+        futures = {
+            group_id: admin._list_consumer_group_offsets_send_request(
+                group_id, coordinators[group_id]
+            )
+            for group_id in group_ids
+        }
+        admin._wait_for_futures(list(futures.values()))
+        return {
+            group_id: admin._list_consumer_group_offsets_process_response(future.value)
+            for group_id, future in futures.items()
+        }
+
+    @staticmethod
+    def _record_text(data: Optional[bytes]) -> str:
+        """Decode record bytes for text matching, never failing"""
+        return data.decode("utf-8", errors="replace") if data is not None else ""
+
+    @staticmethod
+    def _lookup_json_path(data: Optional[bytes], path: str) -> Tuple[bool, Any]:
+        """Resolve a dotted path in a JSON record value, returning (found, element)"""
+        try:
+            element = json.loads(data) if data is not None else None
+        except ValueError:
+            return False, None
+        for part in path.split("."):
+            if isinstance(element, dict) and part in element:
+                element = element[part]
+            elif (
+                isinstance(element, list)
+                and part.isdigit()
+                and int(part) < len(element)
+            ):
+                element = element[int(part)]
+            else:
+                return False, None
+        return True, element
+
+    @staticmethod
+    def _read_partition(
+        consumer: KafkaConsumer,
+        tp: TopicPartition,
+        start: int,
+        end: int,
+        deadline: float,
+        max_records: int = 500,
+    ) -> Iterator[Any]:
+        """Yield the records of one partition from start up to (not including) end
+
+        Stops early once the monotonic ``deadline`` has passed.
+        """
+        if consumer.assignment() != {tp}:
+            consumer.assign([tp])
+        consumer.seek(tp, start)
+        position = start
+        while position < end:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return
+            batch = consumer.poll(timeout_ms=remaining_ms, max_records=max_records)
+            for record in batch.get(tp, []):
+                if record.offset >= end:
+                    return
+                position = record.offset + 1
+                yield record
+            # Step over offsets that hold no records (compaction, transaction
+            # markers) so the loop ends instead of waiting for the deadline
+            position = max(position, consumer.position(tp))
+
+    @staticmethod
+    def _record_size(record) -> int:
+        """Serialized size of a record's key and value in bytes"""
+        return max(record.serialized_key_size, 0) + max(record.serialized_value_size, 0)
+
+    @staticmethod
+    def _decode_payload(data: Optional[bytes], parse_json: bool = True) -> Any:
+        """Decode a record key or value as JSON, then UTF-8 text, then base64"""
+        if data is None:
+            return None
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return {"base64": base64.b64encode(data).decode("ascii")}
+        if not parse_json:
+            return text
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+    def _format_record(self, record) -> Dict[str, Any]:
+        """Convert a ConsumerRecord into a JSON-friendly dict"""
+        return {
+            "partition": record.partition,
+            "offset": record.offset,
+            "timestamp": record.timestamp,
+            "key": self._decode_payload(record.key, parse_json=False),
+            "value": self._decode_payload(record.value),
+            "headers": {
+                k: self._decode_payload(v, parse_json=False)
+                for k, v in record.headers or []
+            },
+        }
+
+    def warm_up(self, connect_timeout_s: float = 5.0) -> Dict[str, Any]:
+        """Eagerly connect the admin client and producer and probe every broker
+
+        Both clients are created concurrently so the first real tool call
+        doesn't pay for bootstrap, metadata and API version negotiation.
+        Cluster metadata is then fetched once and the TCP connect latency to
+        each advertised broker is measured in parallel.
+        """
+
+        def timed(func):
+            started = time.perf_counter()
+            func()
+            return round((time.perf_counter() - started) * 1000, 2)
+
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                admin_ms = executor.submit(timed, self._get_admin_client)
+                producer_ms = executor.submit(timed, self._get_producer)
+                admin_ms, producer_ms = admin_ms.result(), producer_ms.result()
+
+            cluster = {}
+            metadata_ms = timed(
+                lambda: cluster.update(self._get_admin_client().describe_cluster())
+            )
+
+            def probe(broker: Dict[str, Any]) -> Dict[str, Any]:
+                result = {
+                    "node_id": broker.get("node_id"),
+                    "host": broker.get("host"),
+                    "port": broker.get("port"),
+                }
+                try:
+                    result["connect_ms"] = timed(
+                        lambda: self.backend.connect_broker(
+                            broker.get("host"), broker.get("port"), connect_timeout_s
+                        )
+                    )
+                except OSError as e:
+                    result["error"] = str(e)
+                return result
+
+            brokers = cluster.get("brokers") or []
+            with ThreadPoolExecutor(max_workers=max(len(brokers), 1)) as executor:
+                broker_latencies = list(executor.map(probe, brokers))
+
+            return {
+                "status": "success",
+                "cluster_id": cluster.get("cluster_id"),
+                "controller_id": cluster.get("controller_id"),
+                "admin_connect_ms": admin_ms,
+                "producer_connect_ms": producer_ms,
+                "metadata_ms": metadata_ms,
+                "brokers": broker_latencies,
+            }
+        except Exception as e:
+            logger.error(f"Failed to warm up Kafka connections: {e}")
+            return {"status": "error", "message": f"Warm-up failed: {str(e)}"}
+
     def close(self):
         """Close all connections"""
         if self.admin_client:
             self.admin_client.close()
         if self.producer:
             self.producer.close()
+        for consumer in self.consumers:
+            consumer.close()
+
+
+class KafkaManagerPool:
+    """Named pool of KafkaManagers, one per cluster, with LRU eviction
+
+    Tool calls lease a manager for their duration; a manager evicted while
+    leased is closed only when its last lease is returned.
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.max_size = max_size
+        self.default_cluster: Optional[str] = None
+        self._managers: "OrderedDict[str, KafkaManager]" = OrderedDict()
+        self._leases: "Counter[KafkaManager]" = Counter()
+        # Evicted managers waiting for their leases to be returned
+        self._retired: Set[KafkaManager] = set()
+        self._lock = threading.Lock()
+
+    def connect(
+        self, config_file: str, name: Optional[str] = None
+    ) -> Tuple[str, KafkaManager, bool]:
+        """Return the manager for a config file, creating it if needed
+
+        Managers are keyed by ``name`` or, without one, by the resolved config
+        file path. Connecting again with the same key and config file reuses
+        the existing manager and its open clients; the new connection becomes
+        the default cluster. Returns (cluster, manager, reused).
+        """
+        config_path = Path(config_file).resolve()
+        cluster = name or str(config_path)
+
+        with self._lock:
+            manager = self._managers.get(cluster)
+            if manager is not None and manager.config_file.resolve() == config_path:
+                self._managers.move_to_end(cluster)
+                self.default_cluster = cluster
+                return cluster, manager, True
+
+        new_manager = KafkaManager(config_file)
+
+        evicted = []
+        with self._lock:
+            replaced = self._managers.pop(cluster, None)
+            if replaced is not None:
+                evicted.append(replaced)
+            self._managers[cluster] = new_manager
+            self.default_cluster = cluster
+            while len(self._managers) > self.max_size:
+                old_cluster, old_manager = self._managers.popitem(last=False)
+                logger.info(f"Evicting least recently used cluster '{old_cluster}'")
+                evicted.append(old_manager)
+            # Managers still used by tool calls are closed by the last lease
+            in_use = {manager for manager in evicted if self._leases[manager]}
+            self._retired |= in_use
+
+        for old_manager in evicted:
+            if old_manager not in in_use:
+                self._close_manager(old_manager)
+        return cluster, new_manager, False
+
+    def get(self, cluster: Optional[str] = None) -> KafkaManager:
+        """Look up a manager by name or config path, or the default cluster
+
+        Raises ValueError when no cluster is connected or the name is unknown.
+        """
+        with self._lock:
+            return self._lookup(cluster)
+
+    @contextmanager
+    def lease(self, cluster: Optional[str] = None) -> Iterator[KafkaManager]:
+        """Look up a manager as get() does and keep it open until released"""
+        with self._lock:
+            manager = self._lookup(cluster)
+            self._leases[manager] += 1
+        try:
+            yield manager
+        finally:
+            with self._lock:
+                remaining = self._leases.pop(manager, 0) - 1
+                if remaining > 0:
+                    self._leases[manager] = remaining
+                close = remaining <= 0 and manager in self._retired
+                if close:
+                    self._retired.remove(manager)
+            if close:
+                self._close_manager(manager)
+
+    def _lookup(self, cluster: Optional[str]) -> KafkaManager:
+        """get() without the lock"""
+        if not self._managers:
+            raise ValueError(
+                "Not connected to Kafka. Please use kafka_initialize_connection first."
+            )
+        if cluster is None:
+            key = self.default_cluster
+        elif cluster in self._managers:
+            key = cluster
+        else:
+            # Allow the config file path to be used instead of the name
+            resolved = Path(cluster).resolve()
+            key = next(
+                (
+                    name
+                    for name, manager in self._managers.items()
+                    if manager.config_file.resolve() == resolved
+                ),
+                None,
+            )
+        if key not in self._managers:
+            raise ValueError(
+                f"Unknown cluster '{cluster}'. Connected clusters: "
+                + ", ".join(self._managers)
+            )
+        self._managers.move_to_end(key)
+        return self._managers[key]
+
+    def clusters(self) -> List[str]:
+        """Names of the connected clusters, least recently used first"""
+        with self._lock:
+            return list(self._managers)
+
+    def close(self):
+        """Close every manager in the pool, including evicted ones still leased"""
+        with self._lock:
+            managers = list(self._managers.values()) + list(self._retired)
+            self._managers.clear()
+            self._retired.clear()
+            self._leases.clear()
+            self.default_cluster = None
+        for manager in managers:
+            self._close_manager(manager)
+
+    @staticmethod
+    def _close_manager(manager: KafkaManager):
+        """Close a manager, logging rather than raising on failure"""
+        try:
+            manager.close()
+        except Exception as e:
+            logger.error(
+                f"Failed to close Kafka connections for {manager.config_file}: {e}"
+            )
@@ -0,0 +1,731 @@
+#!/usr/bin/env python3
+"""
+Memory Backend - An in-process stand-in for a Kafka cluster
+
+Implements the parts of the kafka-python admin client, producer and consumer
+APIs that KafkaManager uses, on top of a cluster held in memory: topics with
+partitioned logs, offsets, timestamps, headers and committed consumer group
+offsets. Clients with the same bootstrap.servers share one cluster. Every
+request can be given an artificial latency to approximate a network round
+trip, so tools can be benchmarked without Docker or a network.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from kafka.admin import ConfigResourceType
+from kafka.consumer.fetcher import ConsumerRecord
+from kafka.errors import (
+    InvalidConfigurationError,
+    InvalidPartitionsError,
+    InvalidReplicationFactorError,
+    InvalidTopicError,
+    KafkaTimeoutError,
+    TopicAlreadyExistsError,
+    UnknownTopicOrPartitionError,
+)
+from kafka.future import Future
+from kafka.partitioner import DefaultPartitioner
+from kafka.producer.future import RecordMetadata
+from kafka.structs import OffsetAndMetadata, OffsetAndTimestamp, TopicPartition
+
+LEGAL_TOPIC_NAME = re.compile(r"^[a-zA-Z0-9._-]{1,249}$")
+
+# Broker defaults for topics created with -1 partitions or replication factor
+DEFAULT_PARTITIONS = 1
+DEFAULT_REPLICATION_FACTOR = 1
+
+# Broker defaults reported for topic configs that aren't set on the topic
+TOPIC_CONFIG_DEFAULTS = {
+    "cleanup.policy": "delete",
+    "compression.type": "producer",
+    "max.message.bytes": "1048588",
+    "min.insync.replicas": "1",
+    "retention.bytes": "-1",
+    "retention.ms": "604800000",
+    "segment.bytes": "1073741824",
+}
+
+# Broker configs describing the defaults above
+BROKER_CONFIG_DEFAULTS = {
+    "default.replication.factor": str(DEFAULT_REPLICATION_FACTOR),
+    "num.partitions": str(DEFAULT_PARTITIONS),
+}
+
+# DescribeConfigs config sources
+TOPIC_CONFIG_SOURCE = 1
+DEFAULT_CONFIG_SOURCE = 5
+
+
+class MemoryTopic:
+    """A topic's partition logs and replica assignment"""
+
+    def __init__(
+        self,
+        name: str,
+        partitions: int,
+        replicas: List[List[int]],
+        configs: Optional[Dict[str, str]] = None,
+    ):
+        self.name = name
+        self.logs: List[List[ConsumerRecord]] = [[] for _ in range(partitions)]
+        self.replicas = replicas
+        self.configs = dict(configs or {})
+
+
+class MemoryCluster:
+    """Shared state of one in-memory cluster; every method is thread-safe"""
+
+    def __init__(self, cluster_id: str, brokers: int = 1):
+        self.cluster_id = cluster_id
+        self.brokers = brokers
+        self.topics: Dict[str, MemoryTopic] = {}
+        self.groups: Dict[str, Dict[TopicPartition, OffsetAndMetadata]] = {}
+        # Consumers wait on this for new records
+        self.changed = threading.Condition()
+
+    def describe_cluster(self) -> Dict[str, Any]:
+        return {
+            "throttle_time_ms": 0,
+            "brokers": [
+                {"node_id": node, "host": "memory", "port": node, "rack": None}
+                for node in range(self.brokers)
+            ],
+            "cluster_id": self.cluster_id,
+            "controller_id": 0,
+        }
+
+    def describe_topic(self, name: str) -> Dict[str, Any]:
+        with self.changed:
+            topic = self.topics.get(name)
+            if topic is None:
+                return {
+                    "error_code": UnknownTopicOrPartitionError.errno,
+                    "topic": name,
+                    "is_internal": False,
+                    "partitions": [],
+                }
+            return {
+                "error_code": 0,
+                "topic": name,
+                "is_internal": False,
+                "partitions": [
+                    {
+                        "error_code": 0,
+                        "partition": partition,
+                        "leader": replicas[0],
+                        "replicas": list(replicas),
+                        "isr": list(replicas),
+                        "offline_replicas": [],
+                    }
+                    for partition, replicas in enumerate(topic.replicas)
+                ],
+            }
+
+    def topic_names(self) -> List[str]:
+        with self.changed:
+            return list(self.topics)
+
+    def partitions_for(self, name: str) -> Optional[Set[int]]:
+        with self.changed:
+            topic = self.topics.get(name)
+            return set(range(len(topic.logs))) if topic else None
+
+    def _replicas(self, partition: int, replication_factor: int) -> List[int]:
+        return [(partition + i) % self.brokers for i in range(replication_factor)]
+
+    @staticmethod
+    def _check_configs(configs: Dict[str, str]) -> None:
+        unknown = sorted(set(configs) - set(TOPIC_CONFIG_DEFAULTS))
+        if unknown:
+            raise InvalidConfigurationError(
+                f"Unknown topic config(s): {', '.join(unknown)}"
+            )
+
+    def create_topic(
+        self,
+        name: str,
+        partitions: int,
+        replication_factor: int,
+        configs: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if not LEGAL_TOPIC_NAME.match(name) or name in (".", ".."):
+            raise InvalidTopicError(f"Illegal topic name '{name}'")
+        partitions = DEFAULT_PARTITIONS if partitions == -1 else partitions
+        if partitions < 1:
+            raise InvalidPartitionsError("Number of partitions must be positive")
+        if replication_factor == -1:
+            replication_factor = DEFAULT_REPLICATION_FACTOR
+        if not 1 <= replication_factor <= self.brokers:
+            raise InvalidReplicationFactorError(
+                f"Replication factor {replication_factor} larger than available "
+                f"brokers {self.brokers}"
+            )
+        self._check_configs(configs or {})
+        with self.changed:
+            if name in self.topics:
+                raise TopicAlreadyExistsError(f"Topic '{name}' already exists")
+            self.topics[name] = MemoryTopic(
+                name,
+                partitions,
+                [
+                    self._replicas(partition, replication_factor)
+                    for partition in range(partitions)
+                ],
+                configs,
+            )
+
+    def _topic(self, name: str) -> MemoryTopic:
+        topic = self.topics.get(name)
+        if topic is None:
+            raise UnknownTopicOrPartitionError(f"Topic '{name}' does not exist")
+        return topic
+
+    def add_partitions(self, name: str, total: int) -> None:
+        with self.changed:
+            topic = self._topic(name)
+            if total <= len(topic.logs):
+                raise InvalidPartitionsError(
+                    f"Topic '{name}' already has {len(topic.logs)} partitions"
+                )
+            replication_factor = len(topic.replicas[0])
+            for partition in range(len(topic.logs), total):
+                topic.logs.append([])
+                topic.replicas.append(self._replicas(partition, replication_factor))
+            self.changed.notify_all()
+
+    def topic_configs(self, name: str) -> Dict[str, str]:
+        """Configs set on a topic"""
+        with self.changed:
+            return dict(self._topic(name).configs)
+
+    def set_topic_configs(self, name: str, configs: Dict[str, str]) -> None:
+        """Replace every config set on a topic, like AlterConfigs"""
+        self._check_configs(configs)
+        with self.changed:
+            self._topic(name).configs = dict(configs)
+
+    def delete_topic(self, name: str) -> None:
+        with self.changed:
+            if self.topics.pop(name, None) is None:
+                raise UnknownTopicOrPartitionError(f"Topic '{name}' does not exist")
+            for offsets in self.groups.values():
+                for tp in [tp for tp in offsets if tp.topic == name]:
+                    del offsets[tp]
+
+    def _log(self, tp: TopicPartition) -> List[ConsumerRecord]:
+        topic = self.topics.get(tp.topic)
+        if topic is None or not 0 <= tp.partition < len(topic.logs):
+            raise UnknownTopicOrPartitionError(f"Unknown partition {tp}")
+        return topic.logs[tp.partition]
+
+    def append(self, batch: List[Dict[str, Any]]) -> List[Any]:
+        """Append records, returning each one's offset or the exception it failed with"""
+        results = []
+        with self.changed:
+            for record in batch:
+                tp = record["tp"]
+                try:
+                    log = self._log(tp)
+                except UnknownTopicOrPartitionError as e:
+                    results.append(e)
+                    continue
+                key, value, headers = record["key"], record["value"], record["headers"]
+                log.append(
+                    ConsumerRecord(
+                        tp.topic,
+                        tp.partition,
+                        0,
+                        len(log),
+                        record["timestamp"],
+                        0,
+                        key,
+                        value,
+                        headers,
+                        None,
+                        len(key) if key is not None else -1,
+                        len(value) if value is not None else -1,
+                        sum(len(k) + len(v or b"") for k, v in headers),
+                    )
+                )
+                results.append(len(log) - 1)
+            self.changed.notify_all()
+        return results
+
+    def read(
+        self, positions: Dict[TopicPartition, int], max_records: int
+    ) -> Dict[TopicPartition, List[ConsumerRecord]]:
+        with self.changed:
+            batch = {}
+            for tp, position in positions.items():
+                if max_records <= 0:
+                    break
+                records = self._log(tp)[position : position + max_records]
+                if records:
+                    batch[tp] = records
+                    max_records -= len(records)
+            return batch
+
+    def end_offset(self, tp: TopicPartition) -> int:
+        with self.changed:
+            return len(self._log(tp))
+
+    def offset_for_time(
+        self, tp: TopicPartition, timestamp_ms: int
+    ) -> Optional[OffsetAndTimestamp]:
+        with self.changed:
+            for record in self._log(tp):
+                if record.timestamp >= timestamp_ms:
+                    return OffsetAndTimestamp(record.offset, record.timestamp, 0)
+            return None
+
+    def commit(self, group_id: str, offsets: Dict[TopicPartition, Any]) -> None:
+        with self.changed:
+            committed = self.groups.setdefault(group_id, {})
+            for tp, offset in offsets.items():
+                if not isinstance(offset, OffsetAndMetadata):
+                    offset = OffsetAndMetadata(offset, "", -1)
+                committed[tp] = offset
+
+    def committed(self, group_id: str) -> Dict[TopicPartition, OffsetAndMetadata]:
+        with self.changed:
+            return dict(self.groups.get(group_id, {}))
+
+    def group_ids(self) -> List[str]:
+        with self.changed:
+            return list(self.groups)
+
+
+_clusters: Dict[str, MemoryCluster] = {}
+_clusters_lock = threading.Lock()
+
+
+def get_cluster(bootstrap_servers: Any, brokers: int = 1) -> MemoryCluster:
+    """Return the cluster for a bootstrap.servers value, creating it on first use"""
+    if not isinstance(bootstrap_servers, str):
+        bootstrap_servers = ",".join(bootstrap_servers)
+    with _clusters_lock:
+        if bootstrap_servers not in _clusters:
+            _clusters[bootstrap_servers] = MemoryCluster(
+                f"memory-{bootstrap_servers}", brokers
+            )
+        return _clusters[bootstrap_servers]
+
+
+def reset_clusters() -> None:
+    """Forget every in-memory cluster"""
+    with _clusters_lock:
+        _clusters.clear()
+
+
+class MemoryClient:
+    """Base for in-memory clients: a cluster plus simulated request latency"""
+
+    def __init__(self, cluster: MemoryCluster, latency_s: float, **configs):
+        self.cluster = cluster
+        self.latency_s = latency_s
+        self.config = configs
+
+    def _round_trip(self) -> None:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        pass
+
+
+class _Response:
+    """Stands in for an admin protocol response"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class MemoryAdminClient(MemoryClient):
+    """Subset of KafkaAdminClient backed by a MemoryCluster"""
+
+    def describe_cluster(self) -> Dict[str, Any]:
+        self._round_trip()
+        return self.cluster.describe_cluster()
+
+    def describe_topics(self, topics: Optional[List[str]] = None):
+        self._round_trip()
+        names = self.cluster.topic_names() if topics is None else topics
+        return [self.cluster.describe_topic(name) for name in names]
+
+    def list_topics(self) -> List[str]:
+        self._round_trip()
+        return self.cluster.topic_names()
+
+    def create_topics(self, new_topics, timeout_ms=None, validate_only=False):
+        """Create every valid topic, then raise the first error like kafka-python"""
+        self._round_trip()
+        errors, first_error = [], None
+        for new_topic in new_topics:
+            try:
+                if not validate_only:
+                    self.cluster.create_topic(
+                        new_topic.name,
+                        new_topic.num_partitions,
+                        new_topic.replication_factor,
+                        new_topic.topic_configs,
+                    )
+                errors.append((new_topic.name, 0, None))
+            except Exception as e:
+                errors.append((new_topic.name, getattr(e, "errno", -1), str(e)))
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return _Response(topic_errors=errors)
+
+    def delete_topics(self, topics: List[str], timeout_ms=None):
+        """Delete every existing topic, then raise the first error like kafka-python"""
+        self._round_trip()
+        errors, first_error = [], None
+        for name in topics:
+            try:
+                self.cluster.delete_topic(name)
+                errors.append((name, 0))
+            except UnknownTopicOrPartitionError as e:
+                errors.append((name, e.errno))
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return _Response(topic_error_codes=errors)
+
+    def create_partitions(self, topic_partitions, timeout_ms=None, validate_only=False):
+        """Grow every valid topic, then raise the first error like kafka-python"""
+        self._round_trip()
+        errors, first_error = [], None
+        for name, new_partitions in topic_partitions.items():
+            try:
+                if not validate_only:
+                    self.cluster.add_partitions(name, new_partitions.total_count)
+                errors.append((name, 0, None))
+            except Exception as e:
+                errors.append((name, getattr(e, "errno", -1), str(e)))
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return _Response(topic_errors=errors)
+
+    def describe_configs(self, config_resources, include_synonyms=False):
+        """Topic and broker configs in the shape of a DescribeConfigs v1 response"""
+        self._round_trip()
+        resources = []
+        for resource in config_resources:
+            if resource.resource_type == ConfigResourceType.BROKER:
+                entries = [
+                    (key, value, False, DEFAULT_CONFIG_SOURCE, False, [])
+                    for key, value in BROKER_CONFIG_DEFAULTS.items()
+                    if not resource.configs or key in resource.configs
+                ]
+                resources.append(
+                    (0, None, resource.resource_type, resource.name, entries)
+                )
+                continue
+            try:
+                configs = self.cluster.topic_configs(resource.name)
+            except UnknownTopicOrPartitionError as e:
+                resources.append(
+                    (e.errno, str(e), resource.resource_type, resource.name, [])
+                )
+                continue
+            entries = [
+                (
+                    key,
+                    configs.get(key, default),
+                    False,
+                    TOPIC_CONFIG_SOURCE if key in configs else DEFAULT_CONFIG_SOURCE,
+                    False,
+                    [],
+                )
+                for key, default in TOPIC_CONFIG_DEFAULTS.items()
+                if not resource.configs or key in resource.configs
+            ]
+            resources.append((0, None, resource.resource_type, resource.name, entries))
+        return [_Response(API_VERSION=1, throttle_time_ms=0, resources=resources)]
+
+    def alter_configs(self, config_resources):
+        """Replace topic configs; errors are reported per resource"""
+        self._round_trip()
+        resources = []
+        for resource in config_resources:
+            try:
+                self.cluster.set_topic_configs(
+                    resource.name,
+                    {key: str(value) for key, value in resource.configs.items()},
+                )
+                resources.append((0, None, resource.resource_type, resource.name))
+            except Exception as e:
+                resources.append(
+                    (
+                        getattr(e, "errno", -1),
+                        str(e),
+                        resource.resource_type,
+                        resource.name,
+                    )
+                )
+        return _Response(throttle_time_ms=0, resources=resources)
+
+    def list_consumer_groups(self, broker_ids=None):
+        self._round_trip()
+        return [(group_id, "consumer") for group_id in self.cluster.group_ids()]
+
+    def list_consumer_group_offsets(
+        self, group_id: str, group_coordinator_id=None, partitions=None
+    ):
+        self._round_trip()
+        committed = self.cluster.committed(group_id)
+        if partitions is not None:
+            committed = {tp: committed[tp] for tp in partitions if tp in committed}
+        return committed
+
+
+class MemoryFuture(Future):
+    """Produce future with the blocking get() of FutureRecordMetadata"""
+
+    def __init__(self):
+        super().__init__()
+        self._done = threading.Event()
+
+    def success(self, value):
+        super().success(value)
+        self._done.set()
+        return self
+
+    def failure(self, e):
+        super().failure(e)
+        self._done.set()
+        return self
+
+    def get(self, timeout: Optional[float] = None):
+        if not self._done.wait(timeout):
+            raise KafkaTimeoutError(f"Timeout after waiting for {timeout} secs.")
+        if self.failed():
+            raise self.exception
+        return self.value
+
+
+class MemoryProducer(MemoryClient):
+    """Subset of KafkaProducer backed by a MemoryCluster
+
+    Sends are queued and appended by a background sender thread, one batch
+    per simulated round trip, so sends return immediately and acks arrive
+    asynchronously as with a real producer.
+    """
+
+    def __init__(self, cluster: MemoryCluster, latency_s: float, **configs):
+        super().__init__(cluster, latency_s, **configs)
+        self._partitioner = DefaultPartitioner()
+        self._pending: List[Dict[str, Any]] = []
+        self._in_flight = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._sender = threading.Thread(
+            target=self._run, name="memory-producer-sender", daemon=True
+        )
+        self._sender.start()
+
+    def partitions_for(self, topic: str) -> Set[int]:
+        partitions = self.cluster.partitions_for(topic)
+        if partitions is None:
+            raise KafkaTimeoutError(f"Topic '{topic}' not present in metadata")
+        return partitions
+
+    def send(
+        self,
+        topic: str,
+        value: Optional[bytes] = None,
+        key: Optional[bytes] = None,
+        headers: Optional[List[tuple]] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+    ) -> MemoryFuture:
+        partitions = sorted(self.partitions_for(topic))
+        if partition is None:
+            partition = self._partitioner(key, partitions, partitions)
+        elif partition not in partitions:
+            raise AssertionError("Unrecognized partition")
+        future = MemoryFuture()
+        with self._condition:
+            if self._closed:
+                raise KafkaTimeoutError("Producer is closed")
+            self._pending.append(
+                {
+                    "tp": TopicPartition(topic, partition),
+                    "key": key,
+                    "value": value,
+                    "headers": list(headers or []),
+                    "timestamp": (
+                        timestamp_ms
+                        if timestamp_ms is not None
+                        else int(time.time() * 1000)
+                    ),
+                    "future": future,
+                }
+            )
+            self._condition.notify_all()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                self._in_flight = len(batch)
+            self._round_trip()
+            for record, result in zip(batch, self.cluster.append(batch)):
+                if isinstance(result, Exception):
+                    record["future"].failure(result)
+                    continue
+                key, value = record["key"], record["value"]
+                record["future"].success(
+                    RecordMetadata(
+                        record["tp"].topic,
+                        record["tp"].partition,
+                        record["tp"],
+                        result,
+                        record["timestamp"],
+                        None,
+                        len(key) if key is not None else -1,
+                        len(value) if value is not None else -1,
+                        -1,
+                    )
+                )
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: not self._pending and not self._in_flight, timeout
+            ):
+                raise KafkaTimeoutError(f"Timeout after waiting for {timeout} secs.")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._sender.join(timeout)
+
+
+class MemoryConsumer(MemoryClient):
+    """Subset of KafkaConsumer (manual assignment) backed by a MemoryCluster"""
+
+    def __init__(self, cluster: MemoryCluster, latency_s: float, **configs):
+        super().__init__(cluster, latency_s, **configs)
+        self.group_id = configs.get("group_id")
+        self.max_poll_records = configs.get("max_poll_records", 500)
+        self._positions: Dict[TopicPartition, Optional[int]] = {}
+
+    def partitions_for_topic(self, topic: str) -> Optional[Set[int]]:
+        return self.cluster.partitions_for(topic)
+
+    def assignment(self) -> Set[TopicPartition]:
+        return set(self._positions)
+
+    def assign(self, partitions: Iterable[TopicPartition]) -> None:
+        self._positions = {tp: None for tp in partitions}
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        assert partition in self._positions, "Unassigned partition"
+        self._positions[partition] = offset
+
+    def position(self, partition: TopicPartition, timeout_ms=None) -> int:
+        assert partition in self._positions, "Partition is not assigned"
+        if self._positions[partition] is None:
+            # auto_offset_reset=latest
+            self._positions[partition] = self.cluster.end_offset(partition)
+        return self._positions[partition]
+
+    def beginning_offsets(self, partitions: Iterable[TopicPartition]):
+        self._round_trip()
+        for tp in partitions:
+            self.cluster.end_offset(tp)
+        return {tp: 0 for tp in partitions}
+
+    def end_offsets(self, partitions: Iterable[TopicPartition]):
+        self._round_trip()
+        return {tp: self.cluster.end_offset(tp) for tp in partitions}
+
+    def offsets_for_times(self, timestamps: Dict[TopicPartition, int]):
+        self._round_trip()
+        return {
+            tp: self.cluster.offset_for_time(tp, timestamp)
+            for tp, timestamp in timestamps.items()
+        }
+
+    def poll(
+        self,
+        timeout_ms: int = 0,
+        max_records: Optional[int] = None,
+        update_offsets: bool = True,
+    ):
+        """Return records from the assigned positions, waiting up to timeout_ms for some"""
+        deadline = time.monotonic() + timeout_ms / 1000
+        positions = {tp: self.position(tp) for tp in self._positions}
+        while True:
+            self._round_trip()
+            batch = self.cluster.read(positions, max_records or self.max_poll_records)
+            if batch:
+                for tp, records in batch.items():
+                    self._positions[tp] = records[-1].offset + 1
+                return batch
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {}
+            with self.cluster.changed:
+                self.cluster.changed.wait(remaining)
+
+    def commit(self, offsets: Optional[Dict[TopicPartition, Any]] = None) -> None:
+        assert self.group_id is not None, "Requires group_id"
+        self._round_trip()
+        self.cluster.commit(
+            self.group_id,
+            (
+                offsets
+                if offsets is not None
+                else {tp: self.position(tp) for tp in self._positions}
+            ),
+        )
+
+
+class MemoryBackend:
+    """Creates clients for an in-process cluster instead of real brokers
+
+    ``mcp.backend.latency.ms`` adds a delay to every simulated request and
+    ``mcp.backend.brokers`` sets the number of brokers (and so the highest
+    replication factor) of clusters created by this backend.
+    """
+
+    name = "memory"
+
+    def __init__(self, config: Dict[str, str]):
+        self.latency_s = float(config.get("mcp.backend.latency.ms", 0)) / 1000
+        self.brokers = int(config.get("mcp.backend.brokers", 1))
+
+    def _client(self, client_class: type, configs: Dict[str, Any]):
+        cluster = get_cluster(
+            configs.get("bootstrap_servers", "localhost:9092"), self.brokers
+        )
+        return client_class(cluster, self.latency_s, **configs)
+
+    def admin_client(self, **configs) -> MemoryAdminClient:
+        return self._client(MemoryAdminClient, configs)
+
+    def producer(self, **configs) -> MemoryProducer:
+        return self._client(MemoryProducer, configs)
+
+    def consumer(self, **configs) -> MemoryConsumer:
+        return self._client(MemoryConsumer, configs)
+
+    def connect_broker(self, host: str, port: int, timeout: float) -> None:
+        """Simulate opening a connection to a broker"""
+        time.sleep(self.latency_s)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Record Files - Stream records out of local JSONL, JSON, CSV and raw-line files
+
+Files are memory-mapped and read one line (or, for JSON arrays, one block)
+at a time through generators, so a multi-gigabyte capture is never loaded
+into memory; the OS pages it in and out as the producer works through it.
+"""
+
+import codecs
+import csv
+import functools
+import json
+import mmap
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+FILE_FORMATS = ("jsonl", "json", "csv", "lines")
+
+# File extension -> format, used when no format is given
+FORMAT_EXTENSIONS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "json",
+    ".csv": "csv",
+}
+
+# Bytes read at a time from a JSON array file
+JSON_BLOCK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class RecordError(ValueError):
+    """A line that can't be turned into a record"""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+# (line number, key, value); a record that failed to parse is yielded as
+# (line number, None, RecordError) so the caller can count it and move on
+FileRecord = Tuple[int, Optional[Any], Any]
+
+
+def detect_format(path: Path, file_format: Optional[str] = None) -> str:
+    """Validate an explicit format or infer one from the file extension"""
+    if file_format:
+        if file_format not in FILE_FORMATS:
+            raise ValueError(
+                f"Unknown file format '{file_format}'. Available: {', '.join(FILE_FORMATS)}"
+            )
+        return file_format
+    return FORMAT_EXTENSIONS.get(path.suffix.lower(), "lines")
+
+
+class LineReader:
+    """Iterates the lines (with endings) of a memory-mapped file"""
+
+    def __init__(self, mapped: Optional[mmap.mmap]):
+        self._mapped = mapped
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._mapped is None:
+            return iter(())
+        return iter(self._mapped.readline, b"")
+
+    def blocks(self, size: int = JSON_BLOCK_SIZE) -> Iterator[bytes]:
+        """Iterates the file in blocks of up to size bytes"""
+        if self._mapped is None:
+            return iter(())
+        return iter(functools.partial(self._mapped.read, size), b"")
+
+    @property
+    def bytes_read(self) -> int:
+        """Bytes consumed so far"""
+        return self._mapped.tell() if self._mapped is not None else 0
+
+
+@contextmanager
+def open_lines(path: Path) -> Iterator[LineReader]:
+    """Memory-map a file for line-by-line reading"""
+    with open(path, "rb") as f:
+        if path.stat().st_size == 0:
+            # mmap can't map an empty file
+            yield LineReader(None)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield LineReader(mapped)
+
+
+def _get_field(record: Any, path: str) -> Tuple[bool, Any]:
+    """Resolve a dotted path in a parsed record, returning (found, element)"""
+    element = record
+    for part in path.split("."):
+        if isinstance(element, dict) and part in element:
+            element = element[part]
+        elif isinstance(element, list) and part.isdigit() and int(part) < len(element):
+            element = element[int(part)]
+        else:
+            return False, None
+    return True, element
+
+
+def _key_text(key: Any) -> Optional[str]:
+    """Render an extracted key as text (non-strings as JSON)"""
+    if key is None or isinstance(key, str):
+        return key
+    return json.dumps(key)
+
+
+def _split_fields(
+    line: int,
+    record: Any,
+    key_field: Optional[str],
+    value_field: Optional[str],
+) -> Tuple[Optional[str], Any]:
+    """Extract the key and value of a parsed record"""
+    key = None
+    if key_field:
+        found, key = _get_field(record, key_field)
+        if not found:
+            raise RecordError(line, f"key field '{key_field}' not found")
+    if value_field:
+        found, record = _get_field(record, value_field)
+        if not found:
+            raise RecordError(line, f"value field '{value_field}' not found")
+    return _key_text(key), record
+
+
+def _jsonl_records(
+    lines: Iterable[bytes],
+    key_field: Optional[str],
+    value_field: Optional[str],
+    raw_values: bool,
+    encoding: str,
+) -> Iterator[FileRecord]:
+    """One JSON document per line; blank lines are skipped
+
+    With ``raw_values`` the line's JSON text is yielded as the value (after
+    validating it) so it is produced without re-encoding; UTF-8 lines are
+    passed through as they are, others are transcoded to UTF-8.
+    """
+    utf8 = codecs.lookup(encoding).name == "utf-8"
+    for number, data in enumerate(lines, 1):
+        data = data.strip()
+        if not data:
+            continue
+        try:
+            text = data.decode(encoding)
+            record = json.loads(text)
+            key, value = _split_fields(number, record, key_field, value_field)
+        except RecordError as e:
+            yield number, None, e
+            continue
+        except UnicodeDecodeError as e:
+            yield number, None, RecordError(number, f"invalid {encoding} text: {e}")
+            continue
+        except ValueError as e:
+            yield number, None, RecordError(number, f"invalid JSON: {e}")
+            continue
+        if raw_values and not value_field:
+            value = data if utf8 else text.encode("utf-8")
+        yield number, key, value
+
+
+def _json_array_records(
+    blocks: Iterable[bytes],
+    key_field: Optional[str],
+    value_field: Optional[str],
+    raw_values: bool,
+    encoding: str,
+) -> Iterator[FileRecord]:
+    """Elements of a JSON array, decoded one at a time as the file is read
+
+    Each element is numbered by the line it starts on. An element that isn't
+    valid JSON ends the file, since the array can't be resynchronized after
+    it. With ``raw_values`` the element's text is yielded as the value.
+    """
+    blocks = iter(blocks)
+    text = codecs.getincrementaldecoder(encoding)()
+    decoder = json.JSONDecoder()
+    buffer, pos, line, eof = "", 0, 1, False
+    # What comes next: "[", the first element or "]", an element, "," or "]"
+    expect = "["
+
+    def read_more() -> None:
+        nonlocal buffer, pos, eof
+        block = next(blocks, None)
+        eof = block is None
+        buffer = buffer[pos:] + text.decode(block or b"", final=eof)
+        pos = 0
+
+    while True:
+        end = _WHITESPACE.match(buffer, pos).end()
+        line += buffer.count("\n", pos, end)
+        pos = end
+        if pos == len(buffer):
+            if not eof:
+                read_more()
+                continue
+            if expect:
+                yield line, None, RecordError(line, "the JSON array is not closed")
+            return
+
+        char = buffer[pos]
+        if expect == "[":
+            if char != "[":
+                yield line, None, RecordError(line, "expected a JSON array")
+                return
+            pos += 1
+            expect = "first"
+        elif expect in ("first", "element") and not (expect == "first" and char == "]"):
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except ValueError as e:
+                if not eof:
+                    read_more()
+                    continue
+                yield line, None, RecordError(line, f"invalid JSON: {e}")
+                return
+            if end == len(buffer) and not eof:
+                # A number at the end of the buffer may continue in the next block
+                read_more()
+                continue
+            try:
+                key, value = _split_fields(line, record, key_field, value_field)
+            except RecordError as e:
+                yield line, None, e
+            else:
+                if raw_values and not value_field:
+                    value = buffer[pos:end].encode("utf-8")
+                yield line, key, value
+            line += buffer.count("\n", pos, end)
+            pos = end
+            expect = ","
+        elif expect and char in ",]":
+            pos += 1
+            expect = "element" if char == "," else None
+        else:
+            yield line, None, RecordError(
+                line,
+                (
+                    "unexpected data after the JSON array"
+                    if expect is None
+                    else f"expected ',' or ']', found '{char}'"
+                ),
+            )
+            return
+
+
+def _csv_records(
+    lines: Iterable[bytes],
+    key_field: Optional[str],
+    value_field: Optional[str],
+    encoding: str,
+) -> Iterator[FileRecord]:
+    """CSV with a header row; each row becomes an object keyed by column"""
+    reader = csv.DictReader(line.decode(encoding) for line in lines)
+    for row in reader:
+        number = reader.line_num
+        try:
+            key, value = _split_fields(number, row, key_field, value_field)
+        except RecordError as e:
+            yield number, None, e
+            continue
+        yield number, key, value
+
+
+def _raw_line_records(
+    lines: Iterable[bytes], key_separator: Optional[str], encoding: str
+) -> Iterator[FileRecord]:
+    """Each non-empty line is a value, sent as-is without its line ending
+
+    With ``key_separator`` the text before the first separator is the key,
+    as with kafka-console-producer's ``parse.key``.
+    """
+    separator = key_separator.encode(encoding) if key_separator else None
+    for number, data in enumerate(lines, 1):
+        data = data.rstrip(b"\r\n")
+        if not data:
+            continue
+        if separator is None:
+            yield number, None, data
+            continue
+        key, found, value = data.partition(separator)
+        if not found:
+            yield number, None, RecordError(
+                number, f"key separator '{key_separator}' not found"
+            )
+            continue
+        yield number, key.decode(encoding, errors="replace"), value
+
+
+def read_records(
+    lines: Iterable[bytes],
+    file_format: str,
+    key_field: Optional[str] = None,
+    value_field: Optional[str] = None,
+    key_separator: Optional[str] = None,
+    raw_values: bool = False,
+    encoding: str = "utf-8",
+) -> Iterator[FileRecord]:
+    """Turn the lines of a file into (line number, key, value) records
+
+    For the "json" format, lines may be any pieces of the file, such as
+    LineReader.blocks().
+    """
+    if file_format == "jsonl":
+        return _jsonl_records(lines, key_field, value_field, raw_values, encoding)
+    if file_format == "json":
+        return _json_array_records(lines, key_field, value_field, raw_values, encoding)
+    if file_format == "csv":
+        return _csv_records(lines, key_field, value_field, encoding)
+    return _raw_line_records(lines, key_separator, encoding)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Responses - Pydantic models for tool results and their compact JSON form
+
+Tools answer with JSON text. Results are validated into these models and
+serialized without indentation or ASCII escaping, which keeps large describe
+and list results small. Manager results without a dedicated model go through
+the ToolResult envelope, which passes their fields through unchanged.
+
+A result whose JSON exceeds the response budget is shrunk by its model's
+fit(): by default the longest list is cut and marked as truncated, while
+paged results move their continuation offset or cursor to the first item
+left out so the caller can fetch the rest.
+"""
+
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+import pydantic_core
+from pydantic import BaseModel, ConfigDict
+
+
+def json_size(data: Any) -> int:
+    """Bytes of compact JSON for data"""
+    return len(pydantic_core.to_json(data))
+
+
+def _longest_list(data: Dict[str, Any]) -> Tuple[Optional[str], List[Any]]:
+    """Dotted path and items of the longest list in data or a nested object"""
+    path, items = None, []
+    for key, value in data.items():
+        if isinstance(value, list) and len(value) > len(items):
+            path, items = key, value
+        elif isinstance(value, dict):
+            nested_path, nested = _longest_list(value)
+            if len(nested) > len(items):
+                path, items = f"{key}.{nested_path}", nested
+    return path, items
+
+
+def truncate(
+    data: Dict[str, Any],
+    budget: int,
+    path: Optional[str] = None,
+    finish: Optional[Callable[[Dict[str, Any], int], None]] = None,
+) -> Dict[str, Any]:
+    """Cut a list in data (default: the longest) so its JSON fits in budget bytes
+
+    path is the dotted path of the list to cut; at least one item is kept.
+    finish(result, returned) completes each candidate before it is measured,
+    so notes about the cut count against the budget. By default it records
+    the list's path and how many of its items were returned under
+    "truncated".
+    """
+    if path is None:
+        path, _ = _longest_list(data)
+        if not path:
+            return data
+    *parents, field = path.split(".")
+    items = data
+    for key in path.split("."):
+        items = items[key]
+    if not items:
+        return data
+    if finish is None:
+
+        def finish(result: Dict[str, Any], returned: int) -> None:
+            result["truncated"] = {
+                "field": path,
+                "returned": returned,
+                "total": len(items),
+            }
+
+    def cut(count: int) -> Dict[str, Any]:
+        # Copy only the objects on the way to the list
+        result = dict(data)
+        container = result
+        for parent in parents:
+            container[parent] = dict(container[parent])
+            container = container[parent]
+        container[field] = items[:count]
+        finish(result, count)
+        return result
+
+    # Largest prefix that fits, found by bisection
+    low, high = 1, len(items)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if json_size(cut(middle)) <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    return cut(low)
+
+
+class ToolResult(BaseModel):
+    """status/message envelope of manager results; other fields pass through"""
+
+    model_config = ConfigDict(extra="allow")
+
+    status: Optional[str] = None
+    message: Optional[str] = None
+
+    def data(self) -> Dict[str, Any]:
+        return self.model_dump(mode="json", exclude_unset=True)
+
+    def fit(self, budget: int) -> Dict[str, Any]:
+        """Shrink the result to about budget bytes of JSON"""
+        return truncate(self.data(), budget)
+
+
+class ConnectionResult(ToolResult):
+    cluster: str
+    reused: bool
+    warm_up: Optional[Dict[str, Any]] = None
+
+
+class TopicSummary(BaseModel):
+    name: str
+    partitions: Optional[int] = None
+    replication_factor: Optional[int] = None
+
+
+class TopicPage(ToolResult):
+    topics: List[TopicSummary]
+    total: int
+    offset: int
+    limit: Optional[int] = None
+    next_offset: Optional[int] = None
+
+    def fit(self, budget: int) -> Dict[str, Any]:
+        """Return fewer topics and continue the next page after them"""
+
+        def finish(result: Dict[str, Any], returned: int) -> None:
+            if returned < len(self.topics):
+                result["next_offset"] = self.offset + returned
+                result["message"] = (
+                    f"Returned {returned} topics to stay within the response "
+                    f"budget; continue with offset={result['next_offset']}"
+                )
+
+        return truncate(self.data(), budget, "topics", finish)
+
+
+class ConsumeResult(ToolResult):
+    """Records read from one partition, continued from next_offset"""
+
+    def fit(self, budget: int) -> Dict[str, Any]:
+        """Return fewer records and continue reading after them"""
+        data = self.data()
+        records = data.get("records")
+        if not records:
+            return super().fit(budget)
+
+        def finish(result: Dict[str, Any], returned: int) -> None:
+            if returned < len(records):
+                result["count"] = returned
+                result["next_offset"] = records[returned]["offset"]
+                result.pop("bytes", None)
+                result["message"] = (
+                    f"Returned {returned} of {len(records)} records to stay within "
+                    f"the response budget; continue with offset={result['next_offset']}"
+                )
+
+        return truncate(data, budget, "records", finish)
+
+
+class PartitionDetail(BaseModel):
+    partition_id: int
+    leader: int
+    replicas: List[int]
+    isr: List[int]
+
+
+class TopicDetail(BaseModel):
+    name: str
+    partitions: List[PartitionDetail]
+    partition_count: int
+    replication_factor: int
+
+
+class TopicInfoResult(ToolResult):
+    topic: Optional[TopicDetail] = None
+
+    def fit(self, budget: int) -> Dict[str, Any]:
+        """Summarize partitions by leader and list only unhealthy ones
+
+        Under-replicated partitions have fewer in-sync replicas than
+        replicas; offline partitions have no leader. The full partition
+        list is available page by page, starting from next_cursor.
+        """
+        if self.topic is None:
+            return super().fit(budget)
+        partitions = self.topic.partitions
+        leaders = Counter(partition.leader for partition in partitions)
+        data = {
+            "status": self.status,
+            "message": (
+                f"Topic '{self.topic.name}' has {len(partitions)} partitions; the "
+                "full description exceeds the response budget, so this is a "
+                "summary. Pass cursor to page through partition details."
+            ),
+            "summarized": True,
+            "topic": {
+                "name": self.topic.name,
+                "partition_count": self.topic.partition_count,
+                "replication_factor": self.topic.replication_factor,
+                "partitions_by_leader": {
+                    str(leader): count for leader, count in sorted(leaders.items())
+                },
+                "offline_partitions": [
+                    partition.partition_id
+                    for partition in partitions
+                    if partition.leader < 0
+                ],
+                "under_replicated": [
+                    partition.model_dump()
+                    for partition in partitions
+                    if len(partition.isr) < len(partition.replicas)
+                ],
+            },
+            "next_cursor": "0",
+        }
+        return truncate(data, budget) if json_size(data) > budget else data
+
+    def page(self, cursor: str, budget: int) -> Dict[str, Any]:
+        """Partition details from cursor on, as many as fit in budget bytes"""
+        data = self.data()
+        if self.topic is None:
+            return data
+        total = len(self.topic.partitions)
+        if not cursor.isdigit() or int(cursor) > total:
+            raise ValueError(f"Invalid cursor '{cursor}'")
+        start = int(cursor)
+
+        def finish(result: Dict[str, Any], returned: int) -> None:
+            end = start + returned
+            result["next_cursor"] = str(end) if end < total else None
+
+        data["topic"]["partitions"] = data["topic"]["partitions"][start:]
+        finish(data, total - start)
+        if budget and json_size(data) > budget:
+            data = truncate(data, budget, "topic.partitions", finish)
+        return data
+
+
+def dump(
+    result: Union[ToolResult, Dict[str, Any]],
+    model: Type[ToolResult] = ToolResult,
+    budget: int = 0,
+) -> str:
+    """Serialize a result as compact JSON, validating a plain dict into model
+
+    Fields missing from the result are left out rather than added as nulls.
+    With a budget (in bytes), larger results are shrunk by the model's fit().
+    """
+    if not isinstance(result, ToolResult):
+        result = model.model_validate(result)
+    text = result.model_dump_json(exclude_unset=True)
+    if budget and len(text.encode("utf-8")) > budget:
+        text = pydantic_core.to_json(result.fit(budget)).decode()
+    return text
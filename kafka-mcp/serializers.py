@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Serializers - Pluggable value encoders for the Kafka producer
+
+A serializer is selected with a spec string: a registered name, optionally
+followed by ``:<argument>`` (e.g. ``avro:schemas/order.avsc``). Values that
+are already bytes are always sent as-is and never re-serialized.
+"""
+
+import base64
+import io
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import fastavro
+except ImportError:
+    fastavro = None
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+# Configure logging
+logger = logging.getLogger("kafka-serializers")
+
+DEFAULT_SERIALIZER = "json"
+
+Serializer = Callable[[Any], bytes]
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode JSON with orjson when installed, falling back to the stdlib"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson rejects e.g. non-string keys and integers over 64 bits
+            pass
+    return json.dumps(value).encode("utf-8")
+
+
+def _load_schema(path: Optional[str]) -> Dict[str, Any]:
+    """Read a JSON schema file (Avro schemas are JSON too)"""
+    if not path:
+        raise ValueError("This serializer needs a schema file, e.g. 'avro:order.avsc'")
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _json_serializer(argument: Optional[str]) -> Serializer:
+    """JSON, via orjson when installed"""
+    return _json_dumps
+
+
+def _stdlib_json_serializer(argument: Optional[str]) -> Serializer:
+    """JSON via the standard library encoder"""
+    return lambda value: json.dumps(value).encode("utf-8")
+
+
+def _string_serializer(argument: Optional[str]) -> Serializer:
+    """Text as-is (other values as JSON text) in the given encoding"""
+    encoding = argument or "utf-8"
+    return lambda value: (
+        value if isinstance(value, str) else json.dumps(value)
+    ).encode(encoding)
+
+
+def _bytes_serializer(argument: Optional[str]) -> Serializer:
+    """Raw bytes passed as a base64 string"""
+
+    def serialize(value: Any) -> bytes:
+        # Tool arguments arrive as JSON, so raw bytes are passed base64-encoded
+        if isinstance(value, str):
+            return base64.b64decode(value, validate=True)
+        raise TypeError("The 'bytes' serializer expects a base64-encoded string")
+
+    return serialize
+
+
+def _msgpack_serializer(argument: Optional[str]) -> Serializer:
+    """MessagePack"""
+    if msgpack is None:
+        raise ImportError("The 'msgpack' serializer requires: pip install msgpack")
+    return lambda value: msgpack.packb(value, use_bin_type=True)
+
+
+def _avro_serializer(argument: Optional[str]) -> Serializer:
+    """Schemaless Avro binary using a local .avsc schema file"""
+    if fastavro is None:
+        raise ImportError("The 'avro' serializer requires: pip install fastavro")
+    schema = fastavro.parse_schema(_load_schema(argument))
+
+    def serialize(value: Any) -> bytes:
+        buffer = io.BytesIO()
+        fastavro.schemaless_writer(buffer, schema, value)
+        return buffer.getvalue()
+
+    return serialize
+
+
+def _json_schema_serializer(argument: Optional[str]) -> Serializer:
+    """JSON validated against a local JSON Schema file"""
+    if jsonschema is None:
+        raise ImportError(
+            "The 'json-schema' serializer requires: pip install jsonschema"
+        )
+    schema = _load_schema(argument)
+    validator = jsonschema.validators.validator_for(schema)(schema)
+
+    def serialize(value: Any) -> bytes:
+        validator.validate(value)
+        return _json_dumps(value)
+
+    return serialize
+
+
+# Serializer name -> factory taking the optional ":<argument>" part of the spec
+SERIALIZERS: Dict[str, Callable[[Optional[str]], Serializer]] = {
+    "json": _json_serializer,
+    "stdlib-json": _stdlib_json_serializer,
+    "string": _string_serializer,
+    "bytes": _bytes_serializer,
+    "msgpack": _msgpack_serializer,
+    "avro": _avro_serializer,
+    "json-schema": _json_schema_serializer,
+}
+
+
+def register_serializer(
+    name: str, factory: Callable[[Optional[str]], Serializer]
+) -> None:
+    """Register a custom serializer factory under a name"""
+    SERIALIZERS[name] = factory
+    get_serializer.cache_clear()
+
+
+@lru_cache(maxsize=128)
+def get_serializer(spec: str) -> Serializer:
+    """Build (once) the serializer for a spec like 'msgpack' or 'avro:order.avsc'"""
+    name, _, argument = spec.partition(":")
+    factory = SERIALIZERS.get(name)
+    if factory is None:
+        raise ValueError(
+            f"Unknown serializer '{name}'. Available: {', '.join(sorted(SERIALIZERS))}"
+        )
+    logger.info(f"Loaded serializer '{spec}'")
+    return factory(argument or None)
+
+
+def serialize(value: Any, spec: str = DEFAULT_SERIALIZER) -> Optional[bytes]:
+    """Serialize a record value; bytes pass through and None stays a tombstone"""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return get_serializer(spec)(value)
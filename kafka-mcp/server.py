@@ -3,41 +3,94 @@
 Kafka MCP Server - A Model Context Protocol server for Kafka operations using FastMCP
 """
 
-import json
+import asyncio
+import functools
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import os
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Type, Union
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from kafka_utils import (
     KafkaManager,
+    KafkaManagerPool,
+)
+from responses import (
+    ConnectionResult,
+    ConsumeResult,
+    TopicInfoResult,
+    TopicPage,
+    ToolResult,
+    dump,
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("kafka-mcp-server")
 
+# Size of the thread pool that runs blocking Kafka calls off the event loop
+MAX_WORKERS = int(os.environ.get("KAFKA_MCP_MAX_WORKERS", "8"))
+
+# Number of cluster connections kept open before the least recently used is closed
+MAX_CLUSTERS = int(os.environ.get("KAFKA_MCP_MAX_CLUSTERS", "4"))
+
+# Size in bytes a tool response may reach before it is summarized or cut
+# (0 disables the limit)
+MAX_RESPONSE_BYTES = int(os.environ.get("KAFKA_MCP_MAX_RESPONSE_BYTES", "50000"))
+
 
 @dataclass
 class KafkaContext:
-    """Application context holding Kafka manager"""
+    """Application context holding the pool of Kafka managers"""
 
-    kafka_manager: Optional[KafkaManager] = None
+    kafka_pool: Optional[KafkaManagerPool] = None
+    executor: Optional[ThreadPoolExecutor] = None
 
 
 # Create the FastMCP server with lifespan management
 @asynccontextmanager
 async def kafka_lifespan(server: FastMCP) -> AsyncIterator[KafkaContext]:
     """Manage Kafka connections lifecycle"""
-    context = KafkaContext()
+    context = KafkaContext(
+        kafka_pool=KafkaManagerPool(max_size=MAX_CLUSTERS),
+        executor=ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="kafka-mcp"
+        ),
+    )
     try:
         yield context
     finally:
-        if context.kafka_manager:
-            context.kafka_manager.close()
+        context.executor.shutdown(wait=False, cancel_futures=True)
+        context.kafka_pool.close()
+
+
+async def run_blocking(ctx: Context, func, *args, **kwargs):
+    """Run a blocking Kafka call in the server thread pool"""
+    executor = ctx.request_context.lifespan_context.executor
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+def respond(result: Any, model: Type[ToolResult] = ToolResult) -> str:
+    """Serialize a tool result within the response budget"""
+    return dump(result, model, budget=MAX_RESPONSE_BYTES)
+
+
+@contextmanager
+def use_kafka_manager(ctx: Context, cluster: Optional[str]) -> Iterator[KafkaManager]:
+    """Lease the manager for a cluster name or config path (default: last connected)
+
+    The manager stays open until the tool call is done, even if a new
+    connection evicts it meanwhile. Raises ValueError for an unknown cluster.
+    """
+    with ctx.request_context.lifespan_context.kafka_pool.lease(cluster) as manager:
+        yield manager
 
 
 # Initialize the MCP server
@@ -45,110 +98,670 @@ mcp = FastMCP("Kafka MCP Server", lifespan=kafka_lifespan)
 
 
 @mcp.tool()
-def kafka_initialize_connection(config_file: str, ctx: Context) -> str:
-    """Connect to Kafka using a properties file"""
+async def kafka_initialize_connection(
+    config_file: str,
+    cluster: Optional[str] = None,
+    warm_up: bool = False,
+    ctx: Context = None,
+) -> str:
+    """Connect to Kafka using a properties file
+
+    cluster names the connection (default: the config file path) so other tools
+    can target it with their cluster argument. Connecting with the same name and
+    file again reuses the open connection. The latest connection is the default.
+    warm_up=True opens the admin and producer connections right away, fetches
+    cluster metadata and reports the connect latency to each broker.
+    """
     try:
-        kafka_manager = KafkaManager(config_file)
-        # Store in the lifespan context
-        ctx.request_context.lifespan_context.kafka_manager = kafka_manager
-        return f"Successfully connected to Kafka using config file: {config_file}"
+        kafka_pool = ctx.request_context.lifespan_context.kafka_pool
+        name, _, reused = await run_blocking(
+            ctx, kafka_pool.connect, config_file, cluster
+        )
+        if reused:
+            message = f"Reusing existing connection to Kafka cluster '{name}'"
+        else:
+            message = f"Successfully connected to Kafka cluster '{name}' using config file: {config_file}"
+        result = ConnectionResult(
+            status="success", message=message, cluster=name, reused=reused
+        )
+        if warm_up:
+            with kafka_pool.lease(name) as kafka_manager:
+                result.warm_up = await run_blocking(ctx, kafka_manager.warm_up)
+        return respond(result)
     except Exception as e:
         return f"Failed to connect to Kafka: {str(e)}"
 
 
 @mcp.tool()
-def kafka_list_topics(ctx: Context) -> str:
-    """List all topics in the Kafka cluster"""
-    kafka_manager = ctx.request_context.lifespan_context.kafka_manager
-    if not kafka_manager:
-        return "Error: Not connected to Kafka. Please use kafka_initialize_connection first."
+async def kafka_list_topics(
+    pattern: Optional[str] = None,
+    prefix: Optional[str] = None,
+    include_internal: bool = True,
+    sort: str = "name",
+    descending: bool = False,
+    offset: int = 0,
+    limit: int = 100,
+    names_only: bool = False,
+    refresh: bool = False,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """List topics in the Kafka cluster, one page at a time
 
+    pattern (regex) and prefix filter topic names; every page is cut from one cached
+    describe of all topics.
+    sort is one of "name", "partitions" or "replication_factor". Use the returned
+    next offset to fetch the following page. names_only=True skips partition
+    details and returns just the topic names. refresh=True bypasses the metadata cache.
+    """
     try:
-        topics = kafka_manager.list_topics()
-        if topics:
-            topics_info = []
-            for topic in topics:
-                topics_info.append(
-                    f"• {topic['name']} (partitions: {topic['partitions']}, replication: {topic['replication_factor']})"
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            page = await run_blocking(
+                ctx,
+                kafka_manager.list_topics_page,
+                pattern=pattern,
+                prefix=prefix,
+                include_internal=include_internal,
+                sort=sort,
+                descending=descending,
+                offset=offset,
+                limit=limit,
+                names_only=names_only,
+                refresh=refresh,
+            )
+            result = TopicPage(status="success", **page)
+            if not page["topics"]:
+                result.message = (
+                    f"No topics at offset {offset} ({page['total']} topics matched)."
+                    if page["total"]
+                    else "No topics found in the Kafka cluster."
                 )
-            return f"Topics in Kafka cluster:\n" + "\n".join(topics_info)
-        else:
-            return "No topics found in the Kafka cluster."
+            return respond(result)
     except Exception as e:
         return f"Error listing topics: {str(e)}"
 
 
 @mcp.tool()
-def kafka_create_topic(
+async def kafka_create_topic(
     name: str,
     partitions: int = 1,
     replication_factor: int = 1,
     config: Optional[Dict[str, str]] = None,
+    cluster: Optional[str] = None,
     ctx: Context = None,
 ) -> str:
     """Create a new Kafka topic"""
-    kafka_manager = ctx.request_context.lifespan_context.kafka_manager
-    if not kafka_manager:
-        return "Error: Not connected to Kafka. Please use kafka_initialize_connection first."
-
     try:
-        result = kafka_manager.create_topic(
-            name, partitions, replication_factor, config
-        )
-        return json.dumps(result, indent=2)
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.create_topic,
+                name,
+                partitions,
+                replication_factor,
+                config,
+            )
+            return respond(result)
     except Exception as e:
         return f"Error creating topic: {str(e)}"
 
 
 @mcp.tool()
-def kafka_delete_topic(name: str, ctx: Context) -> str:
+async def kafka_delete_topic(
+    name: str, cluster: Optional[str] = None, ctx: Context = None
+) -> str:
     """Delete a Kafka topic"""
-    kafka_manager = ctx.request_context.lifespan_context.kafka_manager
-    if not kafka_manager:
-        return "Error: Not connected to Kafka. Please use kafka_initialize_connection first."
-
     try:
-        result = kafka_manager.delete_topic(name)
-        return json.dumps(result, indent=2)
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(ctx, kafka_manager.delete_topic, name)
+            return respond(result)
     except Exception as e:
         return f"Error deleting topic: {str(e)}"
 
 
 @mcp.tool()
-def kafka_get_topic_info(name: str, ctx: Context) -> str:
-    """Get detailed information about a specific topic"""
-    kafka_manager = ctx.request_context.lifespan_context.kafka_manager
-    if not kafka_manager:
-        return "Error: Not connected to Kafka. Please use kafka_initialize_connection first."
+async def kafka_create_topics(
+    topics: List[Union[str, Dict[str, Any]]],
+    partitions: int = 1,
+    replication_factor: int = 1,
+    config: Optional[Dict[str, str]] = None,
+    chunk_size: int = 100,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Create many Kafka topics in batched admin requests
 
+    Each entry is a topic name or an object with "name" and optional
+    "partitions", "replication_factor" and "config" overriding the defaults;
+    -1 takes the brokers' default. Topics are sent chunk_size per request and
+    each gets its own result: created, exists or error.
+    """
     try:
-        result = kafka_manager.get_topic_info(name)
-        return json.dumps(result, indent=2)
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.create_topics,
+                topics,
+                partitions,
+                replication_factor,
+                config,
+                chunk_size,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error creating topics: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_delete_topics(
+    names: Optional[List[str]] = None,
+    pattern: Optional[str] = None,
+    include_internal: bool = False,
+    dry_run: bool = False,
+    chunk_size: int = 100,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Delete many Kafka topics by name and/or glob pattern
+
+    pattern uses shell-style wildcards (e.g. "test-*"); internal topics such
+    as __consumer_offsets only match when include_internal is set. Use
+    dry_run=True to preview which topics would be deleted.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.delete_topics,
+                names,
+                pattern,
+                include_internal,
+                dry_run,
+                chunk_size,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error deleting topics: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_apply_topic_spec(
+    spec_file: Optional[str] = None,
+    spec: Optional[Dict[str, Any]] = None,
+    dry_run: bool = False,
+    chunk_size: int = 100,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Make the cluster's topics match a declarative spec
+
+    The spec (a YAML/JSON file in spec_file, or inline in spec) lists topics
+    with partitions, replication_factor and config, plus optional defaults.
+    Only the differences are applied, in batched requests: missing topics
+    are created, partitions added and changed configs set. Use dry_run=True
+    to review the plan first; changes that need manual work are reported as
+    conflicts.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.apply_topic_spec,
+                spec_file,
+                spec,
+                dry_run,
+                chunk_size,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error applying topic spec: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_get_topic_info(
+    name: str,
+    refresh: bool = False,
+    cursor: Optional[str] = None,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Get detailed information about a specific topic
+
+    refresh=True bypasses the metadata cache. When the partition list is too
+    large for one response, a summary (partitions per leader, under-replicated
+    and offline partitions) is returned instead; pass its next_cursor as
+    cursor to page through the partition details.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx, kafka_manager.get_topic_info, name, refresh
+            )
+            if cursor is not None:
+                return dump(
+                    TopicInfoResult.model_validate(result).page(
+                        cursor, MAX_RESPONSE_BYTES
+                    )
+                )
+            return respond(result, TopicInfoResult)
     except Exception as e:
         return f"Error getting topic info: {str(e)}"
 
 
 @mcp.tool()
-def kafka_send_message(
+async def kafka_send_message(
     topic: str,
     message: Optional[Any] = None,
     key: Optional[str] = None,
+    serializer: Optional[str] = None,
+    wait: bool = True,
+    ticket: Optional[str] = None,
+    cluster: Optional[str] = None,
     ctx: Context = None,
 ) -> str:
-    """Send a message to a Kafka topic"""
+    """Send a message to a Kafka topic
+
+    serializer overrides the topic's configured value encoding: "json" (default),
+    "string", "bytes" (message is base64), "msgpack", "avro:<schema file>" or
+    "json-schema:<schema file>".
+
+    With wait=false the call returns as soon as the message is queued, with a
+    delivery ticket instead of its offset. Pass the same ticket to later sends
+    to aggregate them, and check acknowledgements with kafka_delivery_status.
+    """
     if message is None:
         return "Error: 'message' must be provided."
 
-    kafka_manager = ctx.request_context.lifespan_context.kafka_manager
-    if not kafka_manager:
-        return "Error: Not connected to Kafka. Please use kafka_initialize_connection first."
-
     try:
-        result = kafka_manager.send_message(topic, message, key)
-        return json.dumps(result, indent=2)
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.send_message,
+                topic,
+                message,
+                key,
+                serializer,
+                wait=wait,
+                ticket=ticket,
+            )
+            return respond(result)
     except Exception as e:
         return f"Error sending message: {str(e)}"
 
+
+@mcp.tool()
+async def kafka_delivery_status(
+    ticket: Optional[str] = None,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Report delivery results of fire-and-forget sends (kafka_send_message with wait=false)
+
+    For a ticket (or, without one, every retained ticket) reports sent, acked,
+    failed and pending counts, acknowledgement latency percentiles (p50, p95,
+    p99) over the most recent deliveries and the last errors.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = kafka_manager.delivery_status(ticket)
+            return respond(result)
+    except Exception as e:
+        return f"Error getting delivery status: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_send_messages(
+    topic: str,
+    messages: List[Dict[str, Any]],
+    serializer: Optional[str] = None,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Send a batch of messages to a Kafka topic in one call
+
+    Each message is an object with a required "value" and optional "key",
+    "headers" (string map) and "partition". serializer selects the value
+    encoding as for kafka_send_message.
+    """
+    if not messages:
+        return "Error: 'messages' must contain at least one message."
+    if any(not isinstance(m, dict) or m.get("value") is None for m in messages):
+        return "Error: every message must be an object with a 'value'."
+
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx, kafka_manager.send_messages, topic, messages, serializer=serializer
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error sending messages: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_load_test(
+    topic: str,
+    duration_s: float = 10.0,
+    rate: Optional[float] = None,
+    message_size: int = 1024,
+    key_cardinality: Optional[int] = None,
+    partitions: Optional[List[int]] = None,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Generate synthetic produce load and measure throughput and ack latency
+
+    Sends random message_size-byte records through the server's producer for
+    duration_s seconds (at most 600), at rate messages per second or as fast as
+    possible when rate is omitted. key_cardinality cycles keys through that
+    many distinct values; partitions spreads records round-robin over the
+    listed partitions. Returns achieved send and ack rates, MB/s and p50, p95
+    and p99 acknowledgement latency.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.load_test,
+                topic,
+                duration_s=duration_s,
+                rate=rate,
+                message_size=message_size,
+                key_cardinality=key_cardinality,
+                partitions=partitions,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error running load test: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_e2e_latency_probe(
+    topic: str,
+    count: int = 10,
+    partitions: Optional[List[int]] = None,
+    interval_ms: int = 100,
+    timeout_ms: int = 30000,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Measure produce, fetch and end-to-end latency with canary records
+
+    Sends count rounds of timestamped canary records, one per partition per
+    round (all partitions unless given), and reads each back before the next
+    round. Reports produce-ack, fetch (ack to consume) and end-to-end (send to
+    consume) latency percentiles overall and per partition. The canaries stay
+    in the topic, so use a dedicated probe topic.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.e2e_latency_probe,
+                topic,
+                count=count,
+                partitions=partitions,
+                interval_ms=interval_ms,
+                timeout_ms=timeout_ms,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error probing latency: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_produce_from_file(
+    topic: str,
+    path: str,
+    file_format: Optional[str] = None,
+    key_field: Optional[str] = None,
+    value_field: Optional[str] = None,
+    key_separator: Optional[str] = None,
+    serializer: Optional[str] = None,
+    flush_every: int = 10000,
+    max_records: Optional[int] = None,
+    encoding: str = "utf-8",
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Stream a local file into a Kafka topic without loading it into memory
+
+    file_format is "jsonl" (one JSON document per line), "json" (an array of
+    records), "csv" (header row; each row is sent as an object) or "lines"
+    (each line sent as-is, so serializer can't be used); by default it is
+    inferred from the file extension. key_field picks the record key (a dotted
+    path for JSON, a column for CSV) and value_field sends only part of each
+    record; for raw lines, key_separator splits "key<sep>value". encoding is
+    the file's text encoding. The producer is flushed every flush_every
+    records. Returns throughput and a delivery report with failures by line
+    number.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.produce_from_file,
+                topic,
+                path,
+                file_format=file_format,
+                key_field=key_field,
+                value_field=value_field,
+                key_separator=key_separator,
+                serializer=serializer,
+                flush_every=flush_every,
+                max_records=max_records,
+                encoding=encoding,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error producing from file: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_consume_messages(
+    topic: str,
+    partition: int = 0,
+    offset: Optional[int] = None,
+    timestamp_ms: Optional[int] = None,
+    last_n: Optional[int] = None,
+    max_messages: int = 10,
+    max_bytes: int = 1048576,
+    max_wait_ms: int = 5000,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Read messages from a topic partition without joining a consumer group
+
+    Start at an explicit offset, at the first message at or after timestamp_ms
+    (epoch milliseconds), or last_n messages before the end of the partition.
+    With none of them, reading starts at the earliest offset. Use next_offset
+    from the result to continue reading.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.consume_messages,
+                topic,
+                partition,
+                offset=offset,
+                timestamp_ms=timestamp_ms,
+                last_n=last_n,
+                max_messages=max_messages,
+                max_bytes=max_bytes,
+                max_wait_ms=max_wait_ms,
+            )
+            return respond(result, ConsumeResult)
+    except Exception as e:
+        return f"Error consuming messages: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_search_topic(
+    topic: str,
+    key_pattern: Optional[str] = None,
+    value_contains: Optional[str] = None,
+    value_pattern: Optional[str] = None,
+    json_path: Optional[str] = None,
+    json_value: Optional[Any] = None,
+    headers: Optional[Dict[str, str]] = None,
+    partitions: Optional[List[int]] = None,
+    max_hits: int = 10,
+    max_scan_per_partition: int = 10000,
+    max_wait_ms: int = 30000,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Search the most recent messages of a topic, scanning partitions in parallel
+
+    All given criteria must match: key_pattern (regex on the key), value_contains
+    (substring), value_pattern (regex), json_path (dotted path into a JSON value,
+    e.g. "order.id", optionally equal to json_value) and headers (header name to
+    substring). Each partition scans at most its last max_scan_per_partition
+    messages; the search stops after max_hits matches or max_wait_ms.
+    """
+    if not any([key_pattern, value_contains, value_pattern, json_path, headers]):
+        return "Error: at least one search criterion must be provided."
+
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.search_topic,
+                topic,
+                key_pattern=key_pattern,
+                value_contains=value_contains,
+                value_pattern=value_pattern,
+                json_path=json_path,
+                json_value=json_value,
+                headers=headers,
+                partitions=partitions,
+                max_hits=max_hits,
+                max_scan_per_partition=max_scan_per_partition,
+                max_wait_ms=max_wait_ms,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error searching topic: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_export_topic(
+    topic: str,
+    output_dir: str,
+    file_format: str = "jsonl",
+    partitions: Optional[List[int]] = None,
+    start_offset: Optional[int] = None,
+    end_offset: Optional[int] = None,
+    start_timestamp_ms: Optional[int] = None,
+    end_timestamp_ms: Optional[int] = None,
+    resume: bool = True,
+    checkpoint_every: int = 100000,
+    max_wait_ms: int = 600000,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Export an offset or time range of a topic to local files, reading partitions in parallel
+
+    Writes one file per partition into output_dir: "jsonl" (decoded records),
+    "raw" (length-prefixed key/value bytes) or "parquet" (columnar, needs
+    pyarrow). The range defaults to everything up to the current end offsets.
+    Progress is checkpointed in output_dir, so an export that is interrupted or
+    stops at max_wait_ms continues where it left off when called again with the
+    same output_dir (pass resume=false to start over). Reports MB/s and records/s.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.export_topic,
+                topic,
+                output_dir,
+                file_format=file_format,
+                partitions=partitions,
+                start_offset=start_offset,
+                end_offset=end_offset,
+                start_timestamp_ms=start_timestamp_ms,
+                end_timestamp_ms=end_timestamp_ms,
+                resume=resume,
+                checkpoint_every=checkpoint_every,
+                max_wait_ms=max_wait_ms,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error exporting topic: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_consumer_group_lag(
+    group_ids: Optional[List[str]] = None,
+    topics: Optional[List[str]] = None,
+    include_partitions: bool = True,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Show per-partition and total lag for consumer groups
+
+    With no group_ids every consumer group is reported. topics restricts the
+    report to the given topics; include_partitions=False returns only the
+    per-topic and total lag.
+    """
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.consumer_group_lag,
+                group_ids,
+                topics,
+                include_partitions,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error getting consumer group lag: {str(e)}"
+
+
+@mcp.tool()
+async def kafka_cluster_health(
+    chunk_size: int = 500,
+    parallelism: int = 4,
+    include_internal: bool = True,
+    max_partitions: int = 100,
+    refresh: bool = False,
+    cluster: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """Report offline, leaderless, under-min-ISR and under-replicated partitions
+
+    All topics are described in one metadata request, reusing the one cached
+    by kafka_list_topics unless refresh=True. Their min.insync.replicas are
+    described chunk_size topics per request with up to parallelism requests
+    at a time, and progress is reported after each chunk. Also reports leader skew: partitions led per broker and partitions
+    not led by their preferred replica. Each problem list is capped at
+    max_partitions entries.
+    """
+    loop = asyncio.get_running_loop()
+
+    def progress(scanned: int, total: int) -> None:
+        # Called from the worker thread; the notification is sent on the loop
+        asyncio.run_coroutine_threadsafe(ctx.report_progress(scanned, total), loop)
+
+    try:
+        with use_kafka_manager(ctx, cluster) as kafka_manager:
+            result = await run_blocking(
+                ctx,
+                kafka_manager.cluster_health,
+                chunk_size,
+                parallelism,
+                include_internal,
+                max_partitions,
+                refresh,
+                progress,
+            )
+            return respond(result)
+    except Exception as e:
+        return f"Error checking cluster health: {str(e)}"
+
+
 if __name__ == "__main__":
     # Run the server
     mcp.run()
@@ -0,0 +1,29 @@
+"""
+Shared fixtures: the server modules live next to this directory, and the
+manager fixture runs against a fresh in-memory cluster.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kafka_utils import KafkaManager  # noqa: E402
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """KafkaManager on the memory backend with three brokers"""
+    config_file = tmp_path / "memory.properties"
+    # Clusters are shared by bootstrap.servers, so every test gets its own
+    config_file.write_text(
+        f"bootstrap.servers=memory-{uuid.uuid4().hex}:9092\n"
+        "mcp.backend=memory\n"
+        "mcp.backend.brokers=3\n"
+    )
+    kafka_manager = KafkaManager(str(config_file))
+    yield kafka_manager
+    kafka_manager.close()
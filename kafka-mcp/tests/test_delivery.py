@@ -0,0 +1,68 @@
+from kafka.future import Future
+
+from delivery import DeliveryTracker, LatencyReservoir, latency_summary
+
+
+def test_percentiles():
+    summary = latency_summary(range(100, 0, -1))
+    assert (summary["count"], summary["min"], summary["max"]) == (100, 1, 100)
+    assert summary["mean"] == 50.5
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (50, 95, 99)
+
+
+def test_nearest_rank_percentiles():
+    summary = latency_summary([5, 1, 4, 2, 3])
+    assert summary == {
+        "count": 5,
+        "min": 1,
+        "mean": 3.0,
+        "p50": 3,
+        "p95": 5,
+        "p99": 5,
+        "max": 5,
+    }
+
+
+def test_percentiles_of_few_samples():
+    assert latency_summary([]) == {"count": 0}
+    assert latency_summary([7.5])["p99"] == 7.5
+    two = latency_summary([1, 2])
+    assert (two["p50"], two["p95"]) == (1, 2)
+
+
+def test_reservoir_keeps_exact_figures_and_a_bounded_sample():
+    reservoir = LatencyReservoir(100)
+    for value in range(1, 10001):
+        reservoir.append(value)
+    assert len(reservoir.samples) == 100
+    summary = reservoir.summary()
+    assert summary["count"] == 10000
+    assert (summary["min"], summary["max"], summary["mean"]) == (1, 10000, 5000.5)
+    # Sampled from the whole stream, not just its tail
+    assert min(reservoir.samples) < 5000
+
+
+def test_ticket_counts_acks_and_failures():
+    tracker = DeliveryTracker()
+    ticket = tracker.open("orders")
+    acked, failed = Future(), Future()
+    tracker.track(ticket, acked, 0.0)
+    tracker.track(ticket, failed, 0.0)
+    tracker.record_failure(ticket, ValueError("bad record"))
+    acked.success(None)
+    failed.failure(RuntimeError("broker down"))
+
+    report = tracker.status(ticket.ticket_id)
+    assert (report["sent"], report["acked"], report["failed"]) == (3, 1, 2)
+    assert report["state"] == "complete"
+    assert report["latency_ms"]["count"] == 1
+    assert len(report["last_errors"]) == 2
+
+
+def test_oldest_tickets_are_evicted():
+    tracker = DeliveryTracker(max_tickets=2)
+    first = tracker.open("t")
+    tracker.open("t")
+    tracker.open("t")
+    assert tracker.status(first.ticket_id)["status"] == "error"
+    assert len(tracker.status()["tickets"]) == 2
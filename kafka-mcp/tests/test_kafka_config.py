@@ -0,0 +1,82 @@
+import pytest
+
+from kafka_config import build_client_configs, convert_value, parse_jaas_config
+
+
+def test_shared_properties_go_to_every_client_that_accepts_them():
+    configs = build_client_configs(
+        {
+            "bootstrap.servers": "a:9092,b:9092",
+            "security.protocol": "SASL_SSL",
+            "linger.ms": "5",
+            "fetch.max.wait.ms": "100",
+        }
+    )
+    for client in ("admin", "producer", "consumer"):
+        assert configs[client]["bootstrap_servers"] == "a:9092,b:9092"
+        assert configs[client]["security_protocol"] == "SASL_SSL"
+    assert configs["producer"]["linger_ms"] == 5
+    assert "linger_ms" not in configs["consumer"]
+    assert configs["consumer"]["fetch_max_wait_ms"] == 100
+    assert "fetch_max_wait_ms" not in configs["producer"]
+
+
+def test_scoped_properties_override_shared_ones():
+    configs = build_client_configs(
+        {"client.id": "shared", "producer.client.id": "writer"}
+    )
+    assert configs["producer"]["client_id"] == "writer"
+    assert configs["consumer"]["client_id"] == "shared"
+
+
+def test_java_values_are_converted():
+    configs = build_client_configs(
+        {"acks": "-1", "compression.type": "none", "enable.idempotence": "true"}
+    )
+    assert configs["producer"]["acks"] == "all"
+    assert configs["producer"]["compression_type"] is None
+    assert configs["producer"]["enable_idempotence"] is True
+    assert convert_value("acks", "1", -1) == 1
+    assert convert_value("api_version", "2.8.1", None) == (2, 8, 1)
+    assert convert_value("ssl_check_hostname", "https", True) is True
+
+
+def test_jaas_config_becomes_sasl_credentials():
+    jaas = (
+        "org.apache.kafka.common.security.plain.PlainLoginModule required "
+        'username="alice" password="secret";'
+    )
+    assert parse_jaas_config(jaas) == {
+        "sasl_plain_username": "alice",
+        "sasl_plain_password": "secret",
+    }
+    configs = build_client_configs({"sasl.jaas.config": jaas})
+    assert configs["admin"]["sasl_plain_password"] == "secret"
+
+
+def test_unsupported_java_properties_are_dropped():
+    configs = build_client_configs({"buffer.memory": "33554432"})
+    assert "buffer_memory" not in configs["producer"]
+
+
+def test_every_problem_is_reported_together():
+    with pytest.raises(ValueError) as error:
+        build_client_configs(
+            {
+                "lingr.ms": "5",
+                "producer.fetch.max.wait.ms": "100",
+                "enable.idempotence": "maybe",
+            }
+        )
+    message = str(error.value)
+    assert "'lingr.ms' is not accepted by any Kafka client" in message
+    assert "'producer.fetch.max.wait.ms' is not a KafkaProducer property" in message
+    assert "invalid value for 'enable.idempotence'" in message
+
+
+def test_profiles_set_producer_defaults_that_properties_override():
+    configs = build_client_configs({"acks": "0"}, profile="durability")
+    assert configs["producer"]["enable_idempotence"] is True
+    assert configs["producer"]["acks"] == 0
+    with pytest.raises(ValueError, match="Unknown producer profile"):
+        build_client_configs({}, profile="fastest")
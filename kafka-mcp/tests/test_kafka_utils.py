@@ -0,0 +1,88 @@
+import pytest
+from kafka.errors import KafkaTimeoutError
+from kafka.future import Future
+
+
+@pytest.fixture
+def describe_calls(manager, monkeypatch):
+    """Topics passed to every describe_topics request (None for all topics)"""
+    admin = manager._get_admin_client()
+    describe_topics = admin.describe_topics
+    calls = []
+
+    def counting(topics=None):
+        calls.append(topics)
+        return describe_topics(topics)
+
+    monkeypatch.setattr(admin, "describe_topics", counting)
+    return calls
+
+
+def test_topic_pages_reuse_the_listing_describe(manager, describe_calls):
+    manager.create_topics([f"t-{i}" for i in range(5)])
+    describe_calls.clear()
+
+    first = manager.list_topics_page(limit=2, refresh=True)
+    second = manager.list_topics_page(offset=first["next_offset"], limit=2)
+    names = manager.list_topic_names()
+    assert [t["name"] for t in first["topics"] + second["topics"]] == names[:4]
+    assert describe_calls == [None]
+
+
+def test_produce_from_file_reports_a_failed_flush(manager, tmp_path, monkeypatch):
+    manager.create_topic("files", 1, 1)
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"id": 1}\n{"id": 2}\n')
+    producer = manager._get_producer()
+
+    def flush(timeout=None):
+        raise KafkaTimeoutError(
+            f"Failed to flush buffered records within {timeout} secs"
+        )
+
+    # Records stay unacknowledged, as with a broker that stopped responding
+    monkeypatch.setattr(producer, "send", lambda *args, **kwargs: Future())
+    monkeypatch.setattr(producer, "flush", flush)
+    result = manager.produce_from_file("files", str(path))
+    assert result["status"] == "error"
+    assert result["summary"]["delivery"]["pending"] == 2
+    assert "within 60 secs" in result["summary"]["flush_error"]
+
+
+def test_load_test_reports_a_failed_flush(manager, monkeypatch):
+    manager.create_topic("load", 1, 1)
+    producer = manager._get_producer()
+
+    def flush(timeout=None):
+        raise KafkaTimeoutError(
+            f"Failed to flush buffered records within {timeout} secs"
+        )
+
+    monkeypatch.setattr(producer, "send", lambda *args, **kwargs: Future())
+    monkeypatch.setattr(producer, "flush", flush)
+    result = manager.load_test("load", duration_s=0.05, rate=100)
+    summary = result["summary"]
+    assert result["status"] == "error"
+    assert summary["pending"] == summary["sent"] > 0
+    assert "within 60 secs" in summary["flush_error"]
+
+
+def test_load_tests_leave_delivery_tickets_alone(manager):
+    manager.create_topic("load", 1, 1)
+    ticket = manager.send_message("load", {"id": 1}, wait=False)["ticket"]
+    for _ in range(3):
+        manager.load_test("load", duration_s=0.01, rate=100)
+    assert [t["ticket"] for t in manager.deliveries.status()["tickets"]] == [ticket]
+
+
+def test_cluster_health_reuses_the_listing_describe(manager, describe_calls):
+    manager.create_topics([f"h-{i}" for i in range(5)], replication_factor=3)
+    manager.list_topic_names(refresh=True)
+    describe_calls.clear()
+
+    health = manager.cluster_health(chunk_size=2)
+    assert health["healthy"]
+    assert (health["summary"]["topics"], health["summary"]["chunks"]) == (5, 3)
+    assert describe_calls == []
+    manager.cluster_health(refresh=True)
+    assert describe_calls == [None]
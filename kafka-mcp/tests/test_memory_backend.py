@@ -0,0 +1,119 @@
+def test_create_describe_and_delete_a_topic(manager):
+    result = manager.create_topic("orders", 3, 2, {"retention.ms": "1000"})
+    assert result["status"] == "success"
+    assert manager.create_topic("orders", 3, 2)["message"] == (
+        "Topic 'orders' already exists"
+    )
+
+    info = manager.get_topic_info("orders")["topic"]
+    assert (info["partition_count"], info["replication_factor"]) == (3, 2)
+    assert all(len(p["isr"]) == 2 for p in info["partitions"])
+
+    assert manager.delete_topic("orders")["status"] == "success"
+    assert manager.delete_topic("orders")["status"] == "error"
+    assert manager.list_topic_names(refresh=True) == []
+
+
+def test_bulk_create_list_and_delete(manager):
+    result = manager.create_topics(
+        ["a-1", {"name": "a-2", "partitions": 4}, "b-1"], partitions=2
+    )
+    assert result["summary"]["created"] == 3
+    assert manager.create_topics(["a-1"])["topics"] == [
+        {"name": "a-1", "status": "exists"}
+    ]
+
+    page = manager.list_topics_page(limit=2)
+    assert [t["name"] for t in page["topics"]] == ["a-1", "a-2"]
+    assert page["topics"][1]["partitions"] == 4
+    assert (page["total"], page["next_offset"]) == (3, 2)
+    rest = manager.list_topics_page(offset=page["next_offset"], limit=2)
+    assert [t["name"] for t in rest["topics"]] == ["b-1"]
+    assert rest["next_offset"] is None
+
+    dry_run = manager.delete_topics(pattern="a-*", dry_run=True)
+    assert dry_run["topics"] == ["a-1", "a-2"]
+    assert manager.list_topic_names(refresh=True) == ["a-1", "a-2", "b-1"]
+    manager.delete_topics(pattern="a-*")
+    assert manager.list_topic_names(refresh=True) == ["b-1"]
+
+
+def test_bulk_create_resolves_broker_defaults(manager):
+    result = manager.create_topics(["d-1", {"name": "d-2", "partitions": -1}], 2, -1)
+    assert result["summary"]["created"] == 2
+    assert manager.get_topic_info("d-2")["topic"]["partition_count"] == 1
+    assert manager.get_topic_info("d-1")["topic"]["replication_factor"] == 1
+
+
+def test_bulk_create_rejects_bad_counts_per_topic(manager):
+    result = manager.create_topics(
+        [
+            {"name": "c-1", "partitions": "2"},
+            {"name": "c-2", "replication_factor": True},
+            {"name": "c-3", "config": "retention.ms=1"},
+            "c-4",
+        ]
+    )
+    statuses = {t["name"]: t["status"] for t in result["topics"]}
+    assert statuses == {
+        "c-1": "error",
+        "c-2": "error",
+        "c-3": "error",
+        "c-4": "created",
+    }
+    assert "must be an integer" in result["topics"][0]["error"]
+    assert manager.list_topic_names(refresh=True) == ["c-4"]
+
+
+def test_produce_and_consume_round_trip(manager):
+    manager.create_topic("events", 2, 1)
+    records = [
+        {"key": f"k{i}", "value": {"id": i}, "headers": {"source": "test"}}
+        for i in range(5)
+    ]
+    result = manager.send_messages("events", [dict(r, partition=1) for r in records])
+    assert result["status"] == "success"
+    assert result["summary"]["partitions"] == {
+        "1": {"first_offset": 0, "last_offset": 4, "count": 5}
+    }
+
+    first = manager.consume_messages("events", partition=1, max_messages=3)
+    assert [r["value"] for r in first["records"]] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert first["records"][0]["key"] == "k0"
+    assert first["records"][0]["headers"] == {"source": "test"}
+    assert (first["next_offset"], first["end_offset"]) == (3, 5)
+
+    rest = manager.consume_messages("events", partition=1, offset=first["next_offset"])
+    assert [r["offset"] for r in rest["records"]] == [3, 4]
+    last = manager.consume_messages("events", partition=1, last_n=1)
+    assert [r["value"] for r in last["records"]] == [{"id": 4}]
+    assert manager.consume_messages("events", partition=0)["records"] == []
+
+
+def test_consume_from_a_missing_topic(manager):
+    result = manager.consume_messages("missing")
+    assert result == {"status": "error", "message": "Topic 'missing' not found"}
+
+
+def test_produce_from_file(manager, tmp_path):
+    manager.create_topic("lines", 1, 1)
+    path = tmp_path / "orders.json"
+    path.write_text('[{"id": 1, "customer": "c1"}, {"id": 2, "customer": "c2"}]')
+    result = manager.produce_from_file("lines", str(path), key_field="customer")
+    assert result["status"] == "success"
+
+    records = manager.consume_messages("lines")["records"]
+    assert [(r["key"], r["value"]) for r in records] == [
+        ("c1", {"id": 1, "customer": "c1"}),
+        ("c2", {"id": 2, "customer": "c2"}),
+    ]
+
+
+def test_raw_lines_reject_a_serializer(manager, tmp_path):
+    path = tmp_path / "events.txt"
+    path.write_text("a\nb\n")
+    result = manager.produce_from_file(
+        "lines", str(path), file_format="lines", serializer="msgpack"
+    )
+    assert result["status"] == "error"
+    assert "serializer needs a jsonl, json or csv file" in result["message"]
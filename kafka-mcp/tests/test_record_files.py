@@ -0,0 +1,34 @@
+import json
+
+from record_files import RecordError, read_records
+
+
+def test_jsonl_lines_are_decoded_with_the_file_encoding():
+    lines = ['{"name": "café"}\n'.encode("latin-1"), b"\n", b"{oops\n"]
+    records = list(read_records(lines, "jsonl", key_field="name", encoding="latin-1"))
+    assert records[0] == (1, "café", {"name": "café"})
+    assert records[1][0] == 3 and isinstance(records[1][2], RecordError)
+
+
+def test_raw_jsonl_values_are_sent_as_utf8():
+    line = '{"name": "café"}\n'
+    latin1 = read_records(
+        [line.encode("latin-1")], "jsonl", raw_values=True, encoding="latin-1"
+    )
+    utf8 = read_records([line.encode("utf-8")], "jsonl", raw_values=True)
+    assert next(latin1)[2] == next(utf8)[2] == line.strip().encode("utf-8")
+
+
+def test_undecodable_lines_are_reported():
+    (record,) = read_records([b'{"a": "\xff"}'], "jsonl")
+    assert "invalid utf-8 text" in str(record[2])
+
+
+def test_json_array_elements_keep_their_line_numbers():
+    text = '[\n  {"id": 1},\n  {"id": 2}\n]'
+    blocks = [text[i : i + 4].encode() for i in range(0, len(text), 4)]
+    records = list(read_records(blocks, "json", key_field="id"))
+    assert records == [(2, "1", {"id": 1}), (3, "2", {"id": 2})]
+    assert json.loads(
+        next(read_records([text.encode()], "json", raw_values=True))[2]
+    ) == {"id": 1}
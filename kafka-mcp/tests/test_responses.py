@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from responses import (
+    ConsumeResult,
+    TopicInfoResult,
+    TopicPage,
+    dump,
+    json_size,
+    truncate,
+)
+
+
+def test_truncate_cuts_the_longest_list_to_fit():
+    data = {"status": "success", "tags": ["a"], "items": list(range(1000))}
+    result = truncate(data, 200)
+    assert json_size(result) <= 200
+    assert result["tags"] == ["a"]
+    assert result["items"] == list(range(len(result["items"])))
+    assert result["truncated"] == {
+        "field": "items",
+        "returned": len(result["items"]),
+        "total": 1000,
+    }
+    # The input is left alone
+    assert len(data["items"]) == 1000
+
+
+def test_truncate_keeps_at_least_one_item():
+    result = truncate({"items": ["x" * 500, "y"]}, 10)
+    assert result["items"] == ["x" * 500]
+
+
+def test_truncate_follows_a_nested_path():
+    data = {"topic": {"name": "t", "partitions": list(range(500))}}
+    result = truncate(data, 300)
+    assert result["truncated"]["field"] == "topic.partitions"
+    assert result["topic"]["name"] == "t"
+    assert json_size(result) <= 300
+
+
+def test_dump_is_compact_and_leaves_unset_fields_out():
+    text = dump({"status": "success", "message": "héllo", "extra": [1, 2]})
+    assert text == '{"status":"success","message":"héllo","extra":[1,2]}'
+
+
+def test_dump_validates_into_the_model():
+    text = dump(
+        {"topics": [{"name": "a", "partitions": 1}], "total": 1, "offset": 0},
+        TopicPage,
+    )
+    assert text == ('{"topics":[{"name":"a","partitions":1}],"total":1,"offset":0}')
+
+
+def test_topic_page_continues_after_the_returned_topics():
+    page = TopicPage(
+        topics=[{"name": f"topic-{i:04d}", "partitions": 3} for i in range(500)],
+        total=900,
+        offset=100,
+        limit=500,
+        next_offset=600,
+    )
+    data = json.loads(dump(page, budget=2000))
+    returned = len(data["topics"])
+    assert returned < 500
+    assert data["next_offset"] == 100 + returned
+    assert f"offset={100 + returned}" in data["message"]
+    assert len(dump(page, budget=2000).encode()) <= 2000
+
+
+def test_consume_result_continues_from_the_first_record_left_out():
+    records = [{"offset": 40 + i, "value": "v" * 50} for i in range(100)]
+    result = ConsumeResult(
+        status="success", next_offset=140, count=100, bytes=5000, records=records
+    )
+    data = result.fit(1500)
+    returned = len(data["records"])
+    assert data["count"] == returned
+    assert data["next_offset"] == 40 + returned
+    assert "bytes" not in data
+
+
+def _topic_info(partitions):
+    return TopicInfoResult(
+        status="success",
+        topic={
+            "name": "orders",
+            "partition_count": partitions,
+            "replication_factor": 2,
+            "partitions": [
+                {
+                    "partition_id": i,
+                    "leader": -1 if i == 3 else i % 3,
+                    "replicas": [i % 3, (i + 1) % 3],
+                    "isr": [i % 3] if i == 5 else [i % 3, (i + 1) % 3],
+                }
+                for i in range(partitions)
+            ],
+        },
+    )
+
+
+def test_topic_info_summary_lists_unhealthy_partitions():
+    data = _topic_info(300).fit(4000)
+    topic = data["topic"]
+    assert data["summarized"] is True
+    assert data["next_cursor"] == "0"
+    assert topic["partitions_by_leader"] == {"-1": 1, "0": 99, "1": 100, "2": 100}
+    assert topic["offline_partitions"] == [3]
+    assert [p["partition_id"] for p in topic["under_replicated"]] == [5]
+
+
+def test_topic_info_pages_through_partitions():
+    result = _topic_info(300)
+    seen, cursor = [], "0"
+    while cursor is not None:
+        data = result.page(cursor, 2000)
+        assert json_size(data) <= 2000
+        seen += [p["partition_id"] for p in data["topic"]["partitions"]]
+        cursor = data["next_cursor"]
+    assert seen == list(range(300))
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        result.page("301", 2000)
@@ -0,0 +1,52 @@
+import base64
+import json
+
+import pytest
+
+from serializers import SERIALIZERS, get_serializer, register_serializer, serialize
+
+
+def test_json_is_the_default():
+    assert json.loads(serialize({"id": 1, "tags": ["a"]})) == {"id": 1, "tags": ["a"]}
+
+
+def test_bytes_pass_through_and_none_stays_a_tombstone():
+    assert serialize(b"\x00raw", "msgpack") == b"\x00raw"
+    assert serialize(None, "json") is None
+
+
+def test_string_serializer_takes_an_encoding():
+    assert serialize("héllo", "string") == "héllo".encode("utf-8")
+    assert serialize("héllo", "string:latin-1") == "héllo".encode("latin-1")
+    assert serialize({"a": 1}, "string") == b'{"a": 1}'
+
+
+def test_bytes_serializer_decodes_base64():
+    assert serialize(base64.b64encode(b"\xff\x00").decode(), "bytes") == b"\xff\x00"
+    with pytest.raises(TypeError):
+        serialize(5, "bytes")
+
+
+def test_unknown_serializer():
+    with pytest.raises(ValueError, match="Unknown serializer 'protobuf'"):
+        get_serializer("protobuf")
+
+
+def test_register_serializer():
+    register_serializer("upper", lambda argument: lambda v: str(v).upper().encode())
+    try:
+        assert serialize("abc", "upper") == b"ABC"
+    finally:
+        del SERIALIZERS["upper"]
+        get_serializer.cache_clear()
+
+
+def test_msgpack_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+    assert msgpack.unpackb(serialize({"id": 1}, "msgpack")) == {"id": 1}
+
+
+def test_schema_serializers_need_a_schema_file():
+    pytest.importorskip("jsonschema")
+    with pytest.raises(ValueError, match="needs a schema file"):
+        get_serializer("json-schema")
@@ -0,0 +1,128 @@
+import json
+
+import pytest
+from kafka.errors import KafkaError
+
+from topic_spec import diff_topic, load_spec_file, parse_spec
+
+
+def test_topics_inherit_defaults():
+    topics = parse_spec(
+        {
+            "defaults": {
+                "partitions": 6,
+                "replication_factor": 3,
+                "config": {"retention.ms": 604800000},
+            },
+            "topics": [
+                {"name": "orders", "partitions": 12, "config": {"compact": True}},
+                {"name": "payments"},
+            ],
+        }
+    )
+    assert topics == [
+        {
+            "name": "orders",
+            "partitions": 12,
+            "replication_factor": 3,
+            "config": {"retention.ms": "604800000", "compact": "true"},
+        },
+        {
+            "name": "payments",
+            "partitions": 6,
+            "replication_factor": 3,
+            "config": {"retention.ms": "604800000"},
+        },
+    ]
+
+
+def test_topics_may_be_a_mapping():
+    topics = parse_spec({"topics": {"orders": {"partitions": 3}, "audit": None}})
+    assert [(t["name"], t["partitions"]) for t in topics] == [
+        ("orders", 3),
+        ("audit", -1),
+    ]
+
+
+def test_every_problem_is_reported_together():
+    with pytest.raises(ValueError) as error:
+        parse_spec(
+            {
+                "topics": [
+                    {"name": "a", "partitions": 0},
+                    {"name": "a"},
+                    {"partitions": 1},
+                    {"name": "b", "replicas": 3},
+                ],
+                "extra": 1,
+            }
+        )
+    message = str(error.value)
+    assert "topic 'a': partitions must be at least 1 or -1 for default" in message
+    assert "topic 'a': listed more than once" in message
+    assert "topics[2]: each topic needs a name" in message
+    assert "topic 'b': unknown fields replicas" in message
+    assert "unknown top-level fields: extra" in message
+
+
+def test_diff_grows_partitions_and_changes_configs():
+    desired = {
+        "name": "orders",
+        "partitions": 12,
+        "replication_factor": -1,
+        "config": {"retention.ms": "1000", "cleanup.policy": "delete"},
+    }
+    diff = diff_topic(
+        desired, 6, 3, {"retention.ms": "5000", "cleanup.policy": "delete"}
+    )
+    assert diff == {
+        "partitions": 12,
+        "config": {"retention.ms": {"from": "5000", "to": "1000"}},
+        "conflicts": [],
+    }
+
+
+def test_diff_reports_changes_it_cannot_apply():
+    desired = {"name": "t", "partitions": 3, "replication_factor": 2, "config": {}}
+    diff = diff_topic(desired, 6, 3, None)
+    assert diff["partitions"] is None
+    assert len(diff["conflicts"]) == 2
+
+
+def test_spec_files(tmp_path):
+    json_file = tmp_path / "topics.json"
+    json_file.write_text(json.dumps({"topics": ["x"]}))
+    assert load_spec_file(json_file) == {"topics": ["x"]}
+
+    pytest.importorskip("yaml")
+    yaml_file = tmp_path / "topics.yaml"
+    yaml_file.write_text("topics:\n  - name: orders\n    partitions: 3\n")
+    assert parse_spec(load_spec_file(yaml_file))[0]["partitions"] == 3
+
+
+def test_spec_topics_take_broker_defaults(manager):
+    spec = {"topics": [{"name": "s-1"}, {"name": "s-2", "partitions": 3}]}
+    plan = manager.apply_topic_spec(spec=spec, dry_run=True)
+    assert plan["status"] == "success"
+    assert [(c["partitions"], c["replication_factor"]) for c in plan["changes"]] == [
+        (1, 1),
+        (3, 1),
+    ]
+    assert manager.apply_topic_spec(spec=spec)["summary"]["create"] == 2
+    assert manager.list_topic_names(refresh=True) == ["s-1", "s-2"]
+
+
+def test_spec_topics_fail_on_their_own(manager, monkeypatch):
+    def unavailable():
+        raise KafkaError("brokers unavailable")
+
+    monkeypatch.setattr(manager, "_broker_topic_defaults", unavailable)
+    spec = {
+        "defaults": {"replication_factor": 1},
+        "topics": [{"name": "s-1"}, {"name": "s-2", "partitions": 2}],
+    }
+    result = manager.apply_topic_spec(spec=spec)
+    assert result["status"] == "partial"
+    assert [c.get("status") for c in result["changes"]] == ["error", "applied"]
+    assert "brokers unavailable" in result["changes"][0]["error"]
+    assert manager.list_topic_names(refresh=True) == ["s-2"]
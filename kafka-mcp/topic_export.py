@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Topic Export - Per-partition file writers and resumable export checkpoints
+
+An export writes one file per partition into an output directory, next to a
+``_checkpoint.json`` recording for every partition the offset range being
+exported, the next offset to read and how much of its file is complete.
+Writers only report a checkpoint after their data is flushed, so an
+interrupted export resumes from the last checkpoint: files are cut back to
+their checkpointed size and reading continues from the recorded offset.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+EXPORT_FORMATS = ("jsonl", "raw", "parquet")
+
+CHECKPOINT_FILE = "_checkpoint.json"
+
+# Write buffer per partition file
+WRITE_BUFFER_BYTES = 1048576
+
+# Raw records are framed as: offset (int64), timestamp (int64), key length
+# (int32, -1 for null), key, value length (int32, -1 for null), value
+RAW_HEADER = struct.Struct(">qqi")
+RAW_LENGTH = struct.Struct(">i")
+
+
+if pyarrow is not None:
+    PARQUET_SCHEMA = pyarrow.schema(
+        [
+            ("partition", pyarrow.int32()),
+            ("offset", pyarrow.int64()),
+            ("timestamp", pyarrow.int64()),
+            ("key", pyarrow.binary()),
+            ("value", pyarrow.binary()),
+            (
+                "headers",
+                pyarrow.list_(
+                    pyarrow.struct(
+                        [("key", pyarrow.string()), ("value", pyarrow.binary())]
+                    )
+                ),
+            ),
+        ]
+    )
+
+
+def _dumps(value: Any) -> bytes:
+    """Compact JSON line"""
+    return json.dumps(value, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def check_format(file_format: str) -> None:
+    """Fail early for an unknown format or a missing optional dependency"""
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format '{file_format}'. Available: {', '.join(EXPORT_FORMATS)}"
+        )
+    if file_format == "parquet" and pyarrow is None:
+        raise ImportError("The 'parquet' export format requires: pip install pyarrow")
+
+
+class Checkpoint:
+    """Export progress persisted atomically next to the exported files"""
+
+    def __init__(self, output_dir: Path, state: Dict[str, Any]):
+        self.path = output_dir / CHECKPOINT_FILE
+        self.state = state
+        # Partition workers update and save concurrently
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, output_dir: Path) -> Optional["Checkpoint"]:
+        """Read an existing checkpoint, or None if the directory has none"""
+        path = output_dir / CHECKPOINT_FILE
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return cls(output_dir, json.load(f))
+
+    def partition(self, partition: int) -> Dict[str, Any]:
+        """Copy of one partition's progress entry"""
+        with self._lock:
+            return dict(self.state["partitions"][str(partition)])
+
+    def update(self, partition: int, progress: Dict[str, Any]) -> None:
+        """Record a partition's progress and persist the checkpoint"""
+        with self._lock:
+            self.state["partitions"][str(partition)].update(progress)
+            self._save()
+
+    def save(self) -> None:
+        """Persist the checkpoint"""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        """Write to a temporary file and swap it into place"""
+        self.state["updated_at"] = int(time.time() * 1000)
+        temporary = self.path.with_suffix(".tmp")
+        with open(temporary, "w") as f:
+            json.dump(self.state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+
+class PartitionWriter(ABC):
+    """Writes one partition's records, resuming from its last checkpoint"""
+
+    extension = ""
+
+    @abstractmethod
+    def write(self, record) -> None:
+        """Add a record to the partition's output"""
+
+    @abstractmethod
+    def checkpoint(self) -> Dict[str, Any]:
+        """Make everything written so far durable and describe the files"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the output without writing anything further"""
+
+
+class FileWriter(PartitionWriter):
+    """Appends one partition's records to a single file"""
+
+    def __init__(
+        self, output_dir: Path, topic: str, partition: int, progress: Dict[str, Any]
+    ):
+        self.path = output_dir / f"{topic}-{partition}.{self.extension}"
+        # Drop anything written after the last checkpoint
+        with open(self.path, "ab") as f:
+            f.truncate(progress.get("file_bytes", 0))
+        self._file = open(self.path, "ab", buffering=WRITE_BUFFER_BYTES)
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Make everything written so far durable and describe the file"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"files": [self.path.name], "file_bytes": self._file.tell()}
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlWriter(FileWriter):
+    """One JSON object per record, decoded like the read tools' output"""
+
+    extension = "jsonl"
+
+    def __init__(self, *args, format_record: Callable[[Any], Dict[str, Any]]):
+        super().__init__(*args)
+        self._format_record = format_record
+
+    def write(self, record) -> None:
+        self._file.write(_dumps(self._format_record(record)))
+
+
+class RawWriter(FileWriter):
+    """Length-prefixed binary records with key and value bytes untouched"""
+
+    extension = "bin"
+
+    def write(self, record) -> None:
+        key, value = record.key, record.value
+        self._file.write(
+            RAW_HEADER.pack(
+                record.offset, record.timestamp, -1 if key is None else len(key)
+            )
+        )
+        if key is not None:
+            self._file.write(key)
+        self._file.write(RAW_LENGTH.pack(-1 if value is None else len(value)))
+        if value is not None:
+            self._file.write(value)
+
+
+class ParquetWriter(PartitionWriter):
+    """Columnar Parquet part files, one written at every checkpoint
+
+    A Parquet file is only readable once closed, so rows are buffered until
+    the next checkpoint and then written as a new part file. Part files not
+    listed in the checkpoint are leftovers of an interruption and are
+    removed when the export resumes.
+    """
+
+    extension = "parquet"
+
+    def __init__(
+        self, output_dir: Path, topic: str, partition: int, progress: Dict[str, Any]
+    ):
+        self.output_dir = output_dir
+        self.prefix = f"{topic}-{partition}.part-"
+        self.parts: List[str] = list(progress.get("files", []))
+        for stray in output_dir.glob(f"{self.prefix}*.{self.extension}"):
+            if stray.name not in self.parts:
+                stray.unlink()
+        self._rows = self._empty_rows()
+
+    @staticmethod
+    def _empty_rows() -> Dict[str, List[Any]]:
+        return {name: [] for name in PARQUET_SCHEMA.names}
+
+    def write(self, record) -> None:
+        self._rows["partition"].append(record.partition)
+        self._rows["offset"].append(record.offset)
+        self._rows["timestamp"].append(record.timestamp)
+        self._rows["key"].append(record.key)
+        self._rows["value"].append(record.value)
+        self._rows["headers"].append(
+            [{"key": k, "value": v} for k, v in record.headers or []]
+        )
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Write buffered rows as a new part file and list the parts"""
+        if self._rows["offset"]:
+            name = f"{self.prefix}{len(self.parts):05d}.{self.extension}"
+            table = pyarrow.Table.from_pydict(self._rows, schema=PARQUET_SCHEMA)
+            pyarrow.parquet.write_table(table, self.output_dir / name)
+            self.parts.append(name)
+            self._rows = self._empty_rows()
+        return {"files": list(self.parts)}
+
+    def close(self) -> None:
+        self._rows = self._empty_rows()
+
+
+def open_writer(
+    file_format: str,
+    output_dir: Path,
+    topic: str,
+    partition: int,
+    progress: Dict[str, Any],
+    format_record: Callable[[Any], Dict[str, Any]],
+) -> PartitionWriter:
+    """Create the writer for a partition, positioned at its last checkpoint"""
+    check_format(file_format)
+    if file_format == "jsonl":
+        return JsonlWriter(
+            output_dir, topic, partition, progress, format_record=format_record
+        )
+    if file_format == "raw":
+        return RawWriter(output_dir, topic, partition, progress)
+    return ParquetWriter(output_dir, topic, partition, progress)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Topic Spec - Desired topic layouts and the changes needed to reach them
+
+A spec lists topics with their partition count, replication factor and
+topic-level configs, plus optional defaults shared by every topic:
+
+    defaults:
+      partitions: 6
+      replication_factor: 3
+      config:
+        retention.ms: 604800000
+    topics:
+      - name: orders
+        partitions: 12
+        config:
+          cleanup.policy: compact
+      - name: payments
+
+``topics`` may also be a mapping of topic name to settings. Specs are read
+from YAML (with PyYAML installed) or JSON files.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+TOPIC_FIELDS = ("name", "partitions", "replication_factor", "config")
+
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+def load_spec_file(path: Path) -> Any:
+    """Parse a YAML or JSON spec file"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if path.suffix.lower() in YAML_EXTENSIONS:
+        if yaml is None:
+            raise ImportError("YAML topic specs require: pip install pyyaml")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def _config_value(value: Any) -> str:
+    """Render a config value the way brokers report it"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ",".join(_config_value(item) for item in value)
+    return str(value)
+
+
+def _check_count(problems: List[str], where: str, field: str, value: Any) -> None:
+    """A partition count or replication factor must be >= 1 or -1 (broker default)"""
+    if isinstance(value, bool) or not isinstance(value, int):
+        problems.append(f"{where}: {field} must be an integer")
+    elif value < 1 and value != -1:
+        problems.append(f"{where}: {field} must be at least 1 or -1 for default")
+
+
+def parse_spec(spec: Any) -> List[Dict[str, Any]]:
+    """Validate a spec and resolve every topic against the defaults
+
+    Returns one entry per topic with name, partitions, replication_factor
+    and config (string values). All problems are reported together in a
+    single ValueError.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("Invalid topic spec: expected an object with 'topics'")
+
+    problems = []
+    defaults = spec.get("defaults") or {}
+    topics = spec.get("topics")
+    if isinstance(topics, dict):
+        topics = [
+            {"name": name, **(settings or {})} for name, settings in topics.items()
+        ]
+    if not isinstance(topics, list):
+        raise ValueError("Invalid topic spec: 'topics' must be a list or a mapping")
+    unknown = set(spec) - {"defaults", "topics"}
+    if unknown:
+        problems.append(f"unknown top-level fields: {', '.join(sorted(unknown))}")
+    if not isinstance(defaults, dict):
+        raise ValueError("Invalid topic spec: 'defaults' must be an object")
+
+    resolved, seen = [], set()
+    for index, entry in enumerate(topics):
+        if not isinstance(entry, dict) or not entry.get("name"):
+            problems.append(f"topics[{index}]: each topic needs a name")
+            continue
+        name = str(entry["name"])
+        where = f"topic '{name}'"
+        if name in seen:
+            problems.append(f"{where}: listed more than once")
+            continue
+        seen.add(name)
+        unknown = set(entry) - set(TOPIC_FIELDS)
+        if unknown:
+            problems.append(f"{where}: unknown fields {', '.join(sorted(unknown))}")
+
+        topic = {
+            "name": name,
+            "partitions": entry.get("partitions", defaults.get("partitions", -1)),
+            "replication_factor": entry.get(
+                "replication_factor", defaults.get("replication_factor", -1)
+            ),
+        }
+        _check_count(problems, where, "partitions", topic["partitions"])
+        _check_count(problems, where, "replication_factor", topic["replication_factor"])
+
+        config = entry.get("config") or {}
+        if not isinstance(config, dict):
+            problems.append(f"{where}: config must be an object")
+            config = {}
+        topic["config"] = {
+            str(key): _config_value(value)
+            for key, value in {**(defaults.get("config") or {}), **config}.items()
+        }
+        resolved.append(topic)
+
+    if problems:
+        raise ValueError("Invalid topic spec: " + "; ".join(problems))
+    return resolved
+
+
+def diff_topic(
+    desired: Dict[str, Any],
+    partitions: int,
+    replication_factor: int,
+    configs: Optional[Dict[str, str]],
+) -> Dict[str, Any]:
+    """Compare an existing topic with its desired state
+
+    Returns the partition count to grow to (or None), the configs that
+    differ as key -> {"from", "to"}, and conflicts that can't be applied:
+    partitions can't be removed and changing the replication factor needs a
+    partition reassignment. ``-1`` in the spec accepts whatever the topic
+    has. configs is None when the topic's configs couldn't be described.
+    """
+    result = {"partitions": None, "config": {}, "conflicts": []}
+    if desired["partitions"] != -1:
+        if desired["partitions"] > partitions:
+            result["partitions"] = desired["partitions"]
+        elif desired["partitions"] < partitions:
+            result["conflicts"].append(
+                f"has {partitions} partitions, spec wants {desired['partitions']} "
+                "(partitions can't be removed)"
+            )
+    if desired["replication_factor"] not in (-1, replication_factor):
+        result["conflicts"].append(
+            f"has replication factor {replication_factor}, spec wants "
+            f"{desired['replication_factor']} (needs a partition reassignment)"
+        )
+    if configs is not None:
+        result["config"] = {
+            key: {"from": configs.get(key), "to": value}
+            for key, value in desired["config"].items()
+            if configs.get(key) != value
+        }
+    return result